@@ -0,0 +1,272 @@
+"""
+═══════════════════════════════════════════════════════════════════
+ANSWER ANALYTICS
+═══════════════════════════════════════════════════════════════════
+One row per submitted answer in an append-only SQLite table
+(data/analytics.db):
+
+    session, class_id, question_hash, level, type, target_part,
+    latency_ms, correct, ts
+
+- record() only appends a tuple to an in-memory queue: no I/O on
+  the frame thread
+- A background thread writes rows in batches (executemany, one
+  transaction per batch) every batch_size rows or flush_interval s
+- Aggregations run as set-based GROUP BY queries over indexed
+  columns: per-question difficulty, per-class / per-level accuracy
+
+Usage:
+    python analytics.py                  (hardest questions)
+    python analytics.py --classes        (accuracy per class)
+═══════════════════════════════════════════════════════════════════
+"""
+
+import argparse
+import hashlib
+import os
+import queue
+import sqlite3
+import threading
+import time
+
+
+COLUMNS = ('session', 'class_id', 'question_hash', 'level', 'type',
+           'target_part', 'latency_ms', 'correct', 'ts')
+
+
+def question_hash(question):
+    """Stable short id of a question (type + text), independent of file order"""
+    key = f"{question.get('type', 'multiple_choice')}\x1f{question.get('question', '')}"
+    return hashlib.sha1(key.encode('utf-8')).hexdigest()[:16]
+
+
+class AnswerLog:
+    """
+    Batched, background-written log of answers
+    """
+
+    def __init__(self, path='data/analytics.db', batch_size=256, flush_interval=1.0):
+        """
+        Args:
+            path: SQLite file, or ':memory:' (reads then see only flushed rows)
+            batch_size: Rows per write transaction
+            flush_interval: Max seconds a row waits in memory
+        """
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        if path != ':memory:':
+            folder = os.path.dirname(path)
+            if folder:
+                os.makedirs(folder, exist_ok=True)
+
+        self.dropped = 0
+        self._queue = queue.SimpleQueue()
+        self._flushed = threading.Event()
+        self._writer_db = None
+        self._ready = threading.Event()
+        self._thread = threading.Thread(target=self._writer, name="analytics-writer", daemon=True)
+        self._thread.start()
+        self._ready.wait()
+
+    def _connect(self):
+        db = sqlite3.connect(self.path, check_same_thread=False)
+        if self.path != ':memory:':
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")
+        db.executescript("""
+            CREATE TABLE IF NOT EXISTS answers (
+                id INTEGER PRIMARY KEY,
+                session TEXT NOT NULL,
+                class_id TEXT NOT NULL DEFAULT '',
+                question_hash TEXT NOT NULL,
+                level TEXT NOT NULL,
+                type TEXT NOT NULL,
+                target_part TEXT,
+                latency_ms REAL NOT NULL,
+                correct INTEGER NOT NULL,
+                ts REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_answers_question ON answers(question_hash, correct);
+            CREATE INDEX IF NOT EXISTS idx_answers_class ON answers(class_id, correct);
+        """)
+        db.commit()
+        return db
+
+    # ══════════════════════════════════════════════════════════
+    #   WRITE PATH
+    # ══════════════════════════════════════════════════════════
+
+    def record(self, session, question, target_part, latency_s, correct, class_id=''):
+        """
+        Queue one answer row (never blocks, never touches the disk)
+
+        Args:
+            session: Game/session id
+            question: Question dict that was answered
+            target_part: Body part that was shot
+            latency_s: Seconds from question shown to submit
+            correct: Grading result
+            class_id: Class / group the student belongs to
+        """
+        self._queue.put((
+            str(session), class_id or '', question_hash(question),
+            str(question.get('level', '')), question.get('type', 'multiple_choice'),
+            target_part, latency_s * 1000.0, int(bool(correct)), time.time()
+        ))
+
+    def _writer(self):
+        db = self._writer_db = self._connect()
+        self._ready.set()
+        insert = f"INSERT INTO answers ({', '.join(COLUMNS)}) VALUES ({', '.join('?' * len(COLUMNS))})"
+        batch = []
+        deadline = None
+        running = True
+
+        while running:
+            timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                item = None
+
+            if item is _FLUSH or item is _STOP:
+                running = item is _FLUSH
+            elif item is not None:
+                batch.append(item)
+                if deadline is None:
+                    deadline = time.monotonic() + self.flush_interval
+                if len(batch) < self.batch_size:
+                    continue
+
+            if batch:
+                try:
+                    db.executemany(insert, batch)
+                    db.commit()
+                except sqlite3.Error as e:
+                    print(f"Khong ghi duoc analytics: {e}")
+                    self.dropped += len(batch)
+                batch = []
+            deadline = None
+            if item is _FLUSH:
+                self._flushed.set()
+
+        db.close()
+
+    def flush(self, timeout=5.0):
+        """Block until every queued row is written (tools / tests, not the frame loop)"""
+        self._flushed.clear()
+        self._queue.put(_FLUSH)
+        self._flushed.wait(timeout)
+
+    def close(self):
+        """Write remaining rows and stop the writer thread"""
+        if self._thread.is_alive():
+            self._queue.put(_STOP)
+            self._thread.join(5.0)
+
+    # ══════════════════════════════════════════════════════════
+    #   QUERIES
+    # ══════════════════════════════════════════════════════════
+
+    def _query(self, sql, params=()):
+        self.flush()
+        if self.path == ':memory:':
+            db = self._writer_db  # only the writer's connection sees an in-memory table
+            return [dict(zip([c[0] for c in cur.description], row))
+                    for cur in [db.execute(sql, params)] for row in cur.fetchall()]
+        db = sqlite3.connect(self.path)
+        try:
+            cur = db.execute(sql, params)
+            names = [c[0] for c in cur.description]
+            return [dict(zip(names, row)) for row in cur.fetchall()]
+        finally:
+            db.close()
+
+    def question_difficulty(self, min_attempts=3, limit=20):
+        """
+        Hardest questions first
+
+        Returns:
+            list: dicts question_hash, level, type, attempts, accuracy, mean_latency_ms
+        """
+        return self._query("""
+            SELECT question_hash, MIN(level) AS level, MIN(type) AS type,
+                   COUNT(*) AS attempts,
+                   AVG(correct) AS accuracy,
+                   AVG(latency_ms) AS mean_latency_ms
+            FROM answers
+            GROUP BY question_hash
+            HAVING COUNT(*) >= ?
+            ORDER BY accuracy ASC, attempts DESC
+            LIMIT ?
+        """, (min_attempts, limit))
+
+    def class_accuracy(self):
+        """
+        Returns:
+            list: dicts class_id, students, answers, accuracy, mean_latency_ms
+        """
+        return self._query("""
+            SELECT class_id, COUNT(DISTINCT session) AS students,
+                   COUNT(*) AS answers,
+                   AVG(correct) AS accuracy,
+                   AVG(latency_ms) AS mean_latency_ms
+            FROM answers
+            GROUP BY class_id
+            ORDER BY class_id
+        """)
+
+    def level_accuracy(self, class_id=None):
+        """
+        Returns:
+            list: dicts level, answers, accuracy, mean_latency_ms
+        """
+        where, params = ("WHERE class_id = ?", (class_id,)) if class_id is not None else ("", ())
+        return self._query(f"""
+            SELECT level, COUNT(*) AS answers,
+                   AVG(correct) AS accuracy,
+                   AVG(latency_ms) AS mean_latency_ms
+            FROM answers {where}
+            GROUP BY level
+            ORDER BY level
+        """, params)
+
+
+_FLUSH = object()
+_STOP = object()
+
+
+def _print_rows(rows):
+    if not rows:
+        print("(chua co du lieu)")
+        return
+    keys = list(rows[0].keys())
+    print("  ".join(f"{k:>16}" for k in keys))
+    for row in rows:
+        print("  ".join(f"{v:>16.3f}" if isinstance(v, float) else f"{str(v):>16}" for v in row.values()))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Monster Quiz answer analytics")
+    parser.add_argument('--db', default='data/analytics.db')
+    parser.add_argument('--classes', action='store_true', help="Ti le dung theo lop")
+    parser.add_argument('--levels', action='store_true', help="Ti le dung theo cap do")
+    parser.add_argument('--min-attempts', type=int, default=3)
+    parser.add_argument('--limit', type=int, default=20)
+    args = parser.parse_args()
+
+    log = AnswerLog(args.db)
+    try:
+        if args.classes:
+            _print_rows(log.class_accuracy())
+        elif args.levels:
+            _print_rows(log.level_accuracy())
+        else:
+            _print_rows(log.question_difficulty(args.min_attempts, args.limit))
+    finally:
+        log.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+"""
+═══════════════════════════════════════════════════════════════════
+ANIMATION SYSTEM (shared tweens / springs)
+═══════════════════════════════════════════════════════════════════
+One owner for every animated scalar of the first-person gun:
+recoil, kickback, muzzle flash, sway, bob, weapon position.
+
+Channel kinds:
+- DECAY:  kicked to a value, falls linearly at `rate`/s to 0
+          (level() = value / last kick, 0-1)
+- PHASE:  angle advancing at `rate` Hz (sin() of it = sway / bob)
+- SPRING: exponential approach to a target (`rate` = stiffness)
+
+update(dt) advances every channel once per frame, grouped by kind.
+Renderers only read: anim['recoil'], anim.level('flash'), ...
+Writers kick / retarget: kick(), set_target(), set_rate().
+═══════════════════════════════════════════════════════════════════
+"""
+
+import math
+
+from noise import TABLE_SIZE
+
+DECAY = "decay"
+PHASE = "phase"
+SPRING = "spring"
+
+TAU = math.pi * 2
+# PHASE channels wrap here: a whole number of sin() periods, and phase / pi
+# (the weapon's noise drift coordinate) wraps at a full noise table period
+PHASE_WRAP = TABLE_SIZE * math.pi
+
+# Gun feel (UI.draw_gun_doom was tuned per 60 FPS frame: 0.08 / 2.0 / 1/60 per frame)
+FLASH_TIME = 0.15
+
+
+class AnimationSystem:
+    """
+    Named float channels advanced together
+    """
+
+    def __init__(self):
+        self.values = {}
+        self._decay = {}  # name -> rate (units / s)
+        self._phase = {}  # name -> rate (Hz)
+        self._spring = {}  # name -> stiffness (1 / s)
+        self._targets = {}
+        self._peaks = {}
+
+    def channel(self, name, kind, rate, value=0.0):
+        """
+        Register a channel (re-registering keeps nothing of the old one)
+
+        Args:
+            name: Channel name
+            kind: DECAY, PHASE or SPRING
+            rate: Decay per second / Hz / spring stiffness
+            value: Start value (also the spring target)
+        """
+        for group in (self._decay, self._phase, self._spring):
+            group.pop(name, None)
+        {DECAY: self._decay, PHASE: self._phase, SPRING: self._spring}[kind][name] = rate
+        self.values[name] = value
+        self._targets[name] = value
+        self._peaks[name] = value or 1.0
+        return self
+
+    def __getitem__(self, name):
+        return self.values[name]
+
+    def __contains__(self, name):
+        return name in self.values
+
+    def level(self, name):
+        """DECAY channel as 0-1 of its last kick"""
+        return self.values[name] / self._peaks[name]
+
+    # ══════════════════════════════════════════════════════════
+    #   WRITERS
+    # ══════════════════════════════════════════════════════════
+
+    def kick(self, name, value):
+        """Jump a channel to value (DECAY: starts falling from there)"""
+        self.values[name] = value
+        if value > 0:
+            self._peaks[name] = value
+
+    def set_target(self, name, target):
+        self._targets[name] = target
+
+    def set_rate(self, name, rate):
+        for group in (self._decay, self._phase, self._spring):
+            if name in group:
+                group[name] = rate
+                return
+
+    def snap(self, name, value):
+        """Spring: jump value and target together"""
+        self.values[name] = value
+        self._targets[name] = value
+
+    # ══════════════════════════════════════════════════════════
+    #   UPDATE
+    # ══════════════════════════════════════════════════════════
+
+    def update(self, dt):
+        """
+        Advance every channel by dt seconds
+
+        Args:
+            dt: Frame time in seconds
+        """
+        values = self.values
+        for name, rate in self._decay.items():
+            v = values[name]
+            if v > 0.0:
+                v -= rate * dt
+                values[name] = v if v > 0.0 else 0.0
+        step = dt * TAU
+        for name, rate in self._phase.items():
+            if rate:
+                values[name] = (values[name] + step * rate) % PHASE_WRAP
+        targets = self._targets
+        for name, stiffness in self._spring.items():
+            target = targets[name]
+            v = values[name]
+            if v != target:
+                v += (target - v) * (1.0 - math.exp(-stiffness * dt))
+                values[name] = target if abs(target - v) < 1e-6 else v
+
+    def active(self):
+        """True while any DECAY channel is still running or a spring is moving"""
+        values = self.values
+        return (any(values[n] > 0.0 for n in self._decay)
+                or any(values[n] != self._targets[n] for n in self._spring))
+
+
+def gun_animation():
+    """
+    The first-person gun's channels: recoil / kickback / flash of the
+    on-screen gun (UI), sway / bob shared with WeaponController, which
+    registers its own recoil and flash channels
+
+    Returns:
+        AnimationSystem
+    """
+    anim = AnimationSystem()
+    anim.channel('recoil', DECAY, 0.08 * 60)  # 0-1, gun kicks up
+    anim.channel('kickback', DECAY, 2.0 * 60)  # px, gun pushed back
+    anim.channel('flash', DECAY, 1.0)  # seconds of muzzle flash left
+    anim.channel('sway', PHASE, 0.6)  # idle figure-8
+    anim.channel('bob', PHASE, 0.0)  # walk bob (rate set while moving)
+    return anim
@@ -0,0 +1,143 @@
+"""
+═══════════════════════════════════════════════════════════════════
+BAKED ASSET CACHE
+═══════════════════════════════════════════════════════════════════
+Persists procedurally drawn surfaces (background static layer,
+gradients, sprite banks...) as raw pixel blobs under data/asset_cache.
+
+- Keyed by asset name, resolution and a hash of the drawing code
+  (DRAWING_SOURCES), so editing a draw routine invalidates bakes
+- Loaded with pygame.image.frombuffer: no decoding, no redraw
+- First launch pays the bake cost, later launches just read files
+═══════════════════════════════════════════════════════════════════
+"""
+
+import hashlib
+import os
+import struct
+
+import pygame
+
+
+MAGIC = b"MQAC"
+VERSION = 1
+_HEADER = struct.Struct("<4sHHHB")
+
+SOURCE_DIR = os.path.dirname(os.path.abspath(__file__))
+# Every module whose code draws into a baked layer, plus the blob format itself
+DRAWING_SOURCES = ('ui.py', 'monster.py', 'robot_display.py', 'muzzle_flash.py', 'asset_cache.py')
+
+
+def drawing_code_hash(sources=DRAWING_SOURCES):
+    """Short SHA-1 over the files whose draw code produces baked assets"""
+    digest = hashlib.sha1()
+    for name in sources:
+        try:
+            with open(os.path.join(SOURCE_DIR, name), 'rb') as f:
+                digest.update(f.read())
+        except OSError:
+            digest.update(name.encode('utf-8'))
+    return digest.hexdigest()[:12]
+
+
+class AssetCache:
+    """
+    Disk cache of baked surfaces
+    """
+
+    def __init__(self, folder='data/asset_cache', sources=DRAWING_SOURCES, persist=True):
+        """
+        Args:
+            folder: Where blobs are written
+            sources: Source files hashed into every key
+            persist: False = read existing bakes but never write (replay)
+        """
+        self.folder = folder
+        self.code_hash = drawing_code_hash(sources)
+        self.enabled = True
+        self.persist = persist
+        self.hits = 0
+        self.misses = 0
+
+    def _path(self, name, size):
+        return os.path.join(self.folder, f"{name}_{size[0]}x{size[1]}_{self.code_hash}.bin")
+
+    def load(self, name, size, alpha=False):
+        """
+        Load a baked surface
+
+        Returns:
+            pygame.Surface or None if missing/stale
+        """
+        path = self._path(name, size)
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+        except OSError:
+            return None
+
+        try:
+            magic, version, w, h, has_alpha = _HEADER.unpack_from(data, 0)
+        except struct.error:
+            return None
+        fmt = 'RGBA' if has_alpha else 'RGB'
+        expected = w * h * len(fmt)
+        if (magic != MAGIC or version != VERSION or (w, h) != tuple(size)
+                or bool(has_alpha) != alpha or len(data) - _HEADER.size != expected):
+            return None
+
+        surface = pygame.image.frombuffer(data[_HEADER.size:], (w, h), fmt)
+        return self._to_display_format(surface, alpha)
+
+    def save(self, name, surface, alpha=False):
+        """Write a baked surface, replacing older bakes of the same asset"""
+        w, h = surface.get_size()
+        fmt = 'RGBA' if alpha else 'RGB'
+        try:
+            os.makedirs(self.folder, exist_ok=True)
+            prefix = f"{name}_{w}x{h}_"
+            for old in os.listdir(self.folder):
+                if old.startswith(prefix):
+                    os.remove(os.path.join(self.folder, old))
+
+            path = self._path(name, (w, h))
+            tmp_path = path + ".tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(_HEADER.pack(MAGIC, VERSION, w, h, 1 if alpha else 0))
+                f.write(pygame.image.tostring(surface, fmt))
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"Khong ghi duoc asset cache {name}: {e}")
+
+    def get(self, name, size, bake, alpha=False):
+        """
+        Return a cached surface, baking and saving it on a miss
+
+        Args:
+            name: Asset name (no resolution / hash, those are added)
+            size: (width, height)
+            bake: Callable(surface) that draws the asset
+            alpha: Bake onto an SRCALPHA surface
+
+        Returns:
+            pygame.Surface
+        """
+        if self.enabled:
+            surface = self.load(name, size, alpha)
+            if surface is not None:
+                self.hits += 1
+                return surface
+
+        self.misses += 1
+        surface = pygame.Surface(size, pygame.SRCALPHA if alpha else 0)
+        bake(surface)
+        if self.enabled and self.persist:
+            self.save(name, surface, alpha)
+        return self._to_display_format(surface, alpha)
+
+    @staticmethod
+    def _to_display_format(surface, alpha):
+        # Match the display pixel format so per-frame blits are plain copies
+        if pygame.display.get_init() and pygame.display.get_surface() is not None:
+            return surface.convert_alpha() if alpha else surface.convert()
+        return surface
@@ -12,15 +12,92 @@ Features:
 - Player-centered camera with smooth interpolation
 - Weapon sway and head bobbing
 - Recoil and camera shake
-- Focus depth separation
+- Focus depth separation (cached depth-of-field blur)
 - Performance-optimized rendering
+
+Motion is closed-form: every impulse (recoil, shake, start / stop
+moving, reset) opens a segment of parameters, and the offset at any
+time t is evaluated from the segment containing t (linear decays,
+sine phases, precomputed noise table for shake (noise.py), exponential
+blend for smoothing). get_camera_offset_at(t) needs no re-simulation, and the
+result does not depend on how frame times were split.
+
+Smoothing is the exact response of the exponential filter (rate k):
+each sinusoid comes out scaled by k/sqrt(k^2+w^2) and delayed by
+atan(w/k) (_filtered_sine), a decaying bob is scaled by k/(k-a), the
+linear recoil recovery trails by rate/k (_filtered_recoil), and what
+is left at an impulse closes as exp(-k t) (the segment lag). Shake
+noise is treated as a sine at half its lattice rate (approximate).
 ═══════════════════════════════════════════════════════════════════
 """
 
 import pygame
+import bisect
+import cmath
 import math
 import random
 
+from noise import shared_table
+
+
+SHAKE_NOISE_HZ = 30.0  # Lattice points per second of the shake direction noise
+BOB_STOP_DECAY = 5.0  # 1/s, head bob fade-out after stopping
+MAX_SEGMENTS = 4096  # Impulse history kept for evaluating past timestamps
+
+
+def _filtered_sine(amplitude, phase, omega, k):
+    """
+    Steady-state output of the exponential filter (rate k) for
+    amplitude * sin(phase) turning at omega rad/s
+    """
+    return amplitude * k / math.hypot(k, omega) * math.sin(phase - math.atan2(omega, k))
+
+
+def _filtered_recoil(amount, tail, scale, freq, rate, k):
+    """
+    Steady-state output of the exponential filter (rate k) for
+    scale * r * sin(freq * r), r recovering linearly at rate
+
+    Args:
+        amount: r now (0 once recovered)
+        tail: Seconds since r reached 0 (<= 0 while recovering)
+    """
+    # r e^(i freq r) is a ramp times e^(s t): response H(s) r + r' H'(s), H = k / (k + s)
+    s = -1j * freq * rate
+    h = k / (k + s)
+    dh = -k / (k + s) ** 2
+    if tail > 0:
+        return (-scale * rate * dh).imag * math.exp(-k * tail)
+    return (cmath.exp(1j * freq * amount) * (h * scale * amount - scale * rate * dh)).imag
+
+
+class _Segment:
+    """Camera motion parameters valid from t0 until the next impulse"""
+    
+    __slots__ = ('t0', 'moving', 'bob_phase0', 'bob0', 'sway_phase0', 'sway0',
+                 'recoil_t0', 'recoil0', 'shake_t0', 'shake0', 'shake_seed', 'lag')
+    
+    def __init__(self):
+        self.t0 = 0.0
+        self.moving = False
+        self.bob_phase0 = 0.0  # bob phase at t0
+        self.bob0 = (0.0, 0.0)  # bob offset at t0 (fades out while idle)
+        self.sway_phase0 = 0.0
+        self.sway0 = (0.0, 0.0)  # sway offset at t0 (held while moving)
+        self.recoil_t0 = 0.0
+        self.recoil0 = 0.0
+        self.shake_t0 = 0.0
+        self.shake0 = 0.0
+        self.shake_seed = 0
+        self.lag = (0.0, 0.0, 0.0)  # smoothed - target at t0 (x, y, rotation)
+    
+    def copy(self, t0):
+        seg = _Segment()
+        for name in self.__slots__:
+            setattr(seg, name, getattr(self, name))
+        seg.t0 = t0
+        return seg
+
 
 class CameraSystem:
     """
@@ -36,6 +113,11 @@ class CameraSystem:
         self.rotation = 0.0  # Camera rotation (degrees)
         self.fov = 75.0  # Field of view
         
+        # ═══ CLOCK & IMPULSE SEGMENTS ═══ (see _evaluate)
+        self.time = 0.0  # Camera clock in seconds, advanced by update(dt)
+        self._segments = [_Segment()]
+        self._segment_starts = [0.0]
+        
         # ═══ MOVEMENT STATE ═══
         self.velocity = pygame.math.Vector2(0, 0)
         self.is_moving = False
@@ -64,6 +146,8 @@ class CameraSystem:
         self.shake_amount = 0.0
         self.shake_decay_rate = 5.0
         self.shake_offset = pygame.math.Vector2(0, 0)
+        self.rng = random.Random()  # Seedable for session replay
+        self.seed = None
         
         # ═══ SMOOTHING & INTERPOLATION ═══
         self.smooth_position = pygame.math.Vector2(0, 0)
@@ -82,6 +166,11 @@ class CameraSystem:
         self.focus_distance = 500.0  # Focus plane distance
         self.dof_enabled = True
         self.dof_intensity = 0.3  # 0-1, how much blur
+        self.background_depth = 1000.0  # Distance of the corridor backdrop
+        self.dof_max_passes = 5  # Halvings at full defocus (2x - 32x downsample)
+        self._dof_source = None  # Baked static background to blur
+        self._dof_blurred = None
+        self._dof_key = None  # (source, passes) _dof_blurred was made from
         
         # ═══ PERFORMANCE TRACKING ═══
         self.frame_count = 0
@@ -93,100 +182,158 @@ class CameraSystem:
     
     def update(self, dt):
         """
-        Update camera state for current frame
+        Advance the camera clock and refresh the offset fields
         
         Args:
             dt: Delta time in seconds
         """
-        # Update movement-based effects
-        if self.is_moving:
-            self._update_head_bob(dt)
-        else:
-            self._update_idle_sway(dt)
-            self._decay_head_bob(dt)
-        
-        # Update recoil recovery
-        self._update_recoil(dt)
-        
-        # Update camera shake
-        self._update_shake(dt)
-        
-        # Smooth interpolation for final camera transform
-        self._smooth_camera(dt)
+        self.time += dt
+        sample = self._evaluate(self.time)
+        self.bob_offset.update(sample['bob'])
+        self.sway_offset.update(sample['sway'])
+        self.recoil_offset.update(sample['recoil'])
+        self.shake_offset.update(sample['shake'])
+        self.recoil_amount = sample['recoil_amount']
+        self.shake_amount = sample['shake_amount']
+        self.recoil_rotation = sample['recoil_rotation']
+        self.bob_timer = sample['bob_phase']
+        self.sway_timer = sample['sway_phase']
+        self.smooth_position.update(sample['offset'])
+        self.smooth_rotation = sample['rotation']
     
-    def _update_head_bob(self, dt):
-        """Simulate head bobbing during movement"""
-        self.bob_timer += dt * self.bob_frequency * math.pi * 2
-        
-        # Vertical bob (up-down)
-        self.bob_offset.y = math.sin(self.bob_timer) * self.bob_amplitude_vertical
-        
-        # Horizontal bob (side-to-side at half frequency)
-        self.bob_offset.x = math.sin(self.bob_timer * 0.5) * self.bob_amplitude_horizontal
-    
-    def _decay_head_bob(self, dt):
-        """Smoothly decay head bob when stopping"""
-        decay_rate = 5.0
-        self.bob_offset.x *= max(0, 1.0 - decay_rate * dt)
-        self.bob_offset.y *= max(0, 1.0 - decay_rate * dt)
-        self.bob_timer *= max(0, 1.0 - decay_rate * dt)
-    
-    def _update_idle_sway(self, dt):
-        """Subtle breathing/idle sway when stationary"""
-        self.sway_timer += dt * self.sway_frequency * math.pi * 2
-        
-        # Smooth sine wave motion
-        self.sway_offset.x = math.sin(self.sway_timer) * self.sway_amplitude
-        self.sway_offset.y = math.sin(self.sway_timer * 0.7) * self.sway_amplitude * 0.6
+    def _segment_at(self, t):
+        i = bisect.bisect_right(self._segment_starts, t) - 1
+        return self._segments[max(0, i)]
     
-    def _update_recoil(self, dt):
-        """Update and recover from recoil"""
-        if self.recoil_amount > 0:
-            # Smooth recovery
-            self.recoil_amount = max(0, self.recoil_amount - self.recoil_recovery_rate * dt)
-            
-            # Calculate recoil offset (upward and slight side-to-side)
-            recoil_intensity = self.recoil_amount
-            self.recoil_offset.y = -recoil_intensity * 45  # Kick up
-            self.recoil_offset.x = math.sin(recoil_intensity * 3) * recoil_intensity * 8  # Side sway
-            
-            # Camera tilt during recoil
-            self.recoil_rotation = math.sin(recoil_intensity * 2) * recoil_intensity * 2.5
+    def _components(self, seg, t):
+        """Unsmoothed offsets of segment seg at time t (closed form)"""
+        dt = max(0.0, t - seg.t0)
+        two_pi = math.pi * 2
+        k = self.smoothing_factor
+        
+        # ═══ HEAD BOB / IDLE SWAY ═══ (*_smooth: filtered steady state)
+        if seg.moving:
+            omega = self.bob_frequency * two_pi
+            bob_phase = seg.bob_phase0 + dt * omega
+            bob = (math.sin(bob_phase * 0.5) * self.bob_amplitude_horizontal,
+                   math.sin(bob_phase) * self.bob_amplitude_vertical)
+            bob_smooth = (_filtered_sine(self.bob_amplitude_horizontal, bob_phase * 0.5, omega * 0.5, k),
+                          _filtered_sine(self.bob_amplitude_vertical, bob_phase, omega, k))
+            sway = sway_smooth = seg.sway0
+            sway_phase = seg.sway_phase0
         else:
-            self.recoil_offset.x = 0
-            self.recoil_offset.y = 0
-            self.recoil_rotation = 0
-    
-    def _update_shake(self, dt):
-        """Update camera shake effect"""
-        if self.shake_amount > 0:
-            # Random shake direction
-            angle = random.uniform(0, math.pi * 2)
-            magnitude = self.shake_amount
-            
-            self.shake_offset.x = math.cos(angle) * magnitude * random.uniform(0.7, 1.0)
-            self.shake_offset.y = math.sin(angle) * magnitude * random.uniform(0.7, 1.0)
-            
-            # Decay shake
-            self.shake_amount = max(0, self.shake_amount - self.shake_decay_rate * dt)
+            fade = math.exp(-BOB_STOP_DECAY * dt)
+            bob_phase = seg.bob_phase0 * fade
+            bob = (seg.bob0[0] * fade, seg.bob0[1] * fade)
+            gain = k / (k - BOB_STOP_DECAY) if k != BOB_STOP_DECAY else 1.0
+            bob_smooth = (bob[0] * gain, bob[1] * gain)
+            omega = self.sway_frequency * two_pi
+            sway_phase = seg.sway_phase0 + dt * omega
+            sway = (math.sin(sway_phase) * self.sway_amplitude,
+                    math.sin(sway_phase * 0.7) * self.sway_amplitude * 0.6)
+            sway_smooth = (_filtered_sine(self.sway_amplitude, sway_phase, omega, k),
+                           _filtered_sine(self.sway_amplitude * 0.6, sway_phase * 0.7, omega * 0.7, k))
+        
+        # ═══ RECOIL ═══ (linear recovery)
+        rate = self.recoil_recovery_rate
+        recoil_time = max(0.0, t - seg.recoil_t0)
+        recoil = max(0.0, seg.recoil0 - rate * recoil_time)
+        recoil_offset = (math.sin(recoil * 3) * recoil * 8, -recoil * 45)
+        recoil_rotation = math.sin(recoil * 2) * recoil * 2.5
+        # Filtered: the ramp trails by rate / k, then what is left decays at k
+        if seg.recoil0 > 0:
+            tail = recoil_time - seg.recoil0 / rate
+            kick = recoil + rate / k if tail <= 0 else rate / k * math.exp(-k * tail)
+            recoil_smooth = (_filtered_recoil(recoil, tail, 8, 3, rate, k), -kick * 45)
+            recoil_rotation_smooth = _filtered_recoil(recoil, tail, 2.5, 2, rate, k)
+        else:
+            recoil_smooth = (0.0, 0.0)
+            recoil_rotation_smooth = 0.0
+        
+        # ═══ SHAKE ═══ (linear decay, direction from the shared noise table)
+        shake_time = max(0.0, t - seg.shake_t0)
+        shake = max(0.0, seg.shake0 - self.shake_decay_rate * shake_time)
+        if shake > 0:
+            table = shared_table()
+            nx, ny = table.sample2(shake_time * SHAKE_NOISE_HZ + table.offset(seg.shake_seed))
+            shake_offset = (nx * shake, ny * shake)
+            # Filtered as a sine at the lattice's half rate: scaled and read delayed
+            omega = math.pi * SHAKE_NOISE_HZ
+            delay = math.atan2(omega, k) / omega
+            sx, sy = table.sample2(max(0.0, shake_time - delay) * SHAKE_NOISE_HZ
+                                   + table.offset(seg.shake_seed))
+            gain = shake * k / math.hypot(k, omega)
+            shake_smooth = (sx * gain, sy * gain)
         else:
-            self.shake_offset.x = 0
-            self.shake_offset.y = 0
+            shake_offset = shake_smooth = (0.0, 0.0)
+        
+        return {
+            'bob': bob, 'bob_phase': bob_phase,
+            'sway': sway, 'sway_phase': sway_phase,
+            'recoil': recoil_offset, 'recoil_amount': recoil, 'recoil_rotation': recoil_rotation,
+            'shake': shake_offset, 'shake_amount': shake,
+            'smooth': (bob_smooth[0] + sway_smooth[0] + recoil_smooth[0] + shake_smooth[0],
+                       bob_smooth[1] + sway_smooth[1] + recoil_smooth[1] + shake_smooth[1]),
+            'smooth_rotation': recoil_rotation_smooth
+        }
     
-    def _smooth_camera(self, dt):
-        """Apply smooth interpolation to camera movement"""
-        # Combine all offsets
-        target_x = self.position.x + self.bob_offset.x + self.sway_offset.x + self.recoil_offset.x + self.shake_offset.x
-        target_y = self.position.y + self.bob_offset.y + self.sway_offset.y + self.recoil_offset.y + self.shake_offset.y
+    def _evaluate(self, t, seg=None):
+        """
+        Full camera sample at time t
         
-        # Smooth interpolation (exponential smoothing)
-        alpha = 1.0 - math.exp(-self.smoothing_factor * dt)
-        self.smooth_position.x += (target_x - self.smooth_position.x) * alpha
-        self.smooth_position.y += (target_y - self.smooth_position.y) * alpha
+        Smoothing: 'target' is the filter's steady-state response to
+        the offsets (see _components); the gap between the smoothed
+        camera and it at the segment start closes exponentially
+        (smoothing_factor /s)
         
-        # Smooth rotation
-        target_rotation = self.rotation + self.recoil_rotation
-        self.smooth_rotation += (target_rotation - self.smooth_rotation) * alpha
+        Args:
+            t: Camera time in seconds
+            seg: Segment to evaluate (default: the one containing t)
+        """
+        if seg is None:
+            seg = self._segment_at(t)
+        c = self._components(seg, t)
+        target_x = self.position.x + c['smooth'][0]
+        target_y = self.position.y + c['smooth'][1]
+        target_rotation = self.rotation + c['smooth_rotation']
+        
+        fade = math.exp(-self.smoothing_factor * max(0.0, t - seg.t0))
+        c['target'] = (target_x, target_y)
+        c['offset'] = (target_x + seg.lag[0] * fade, target_y + seg.lag[1] * fade)
+        c['rotation'] = target_rotation + seg.lag[2] * fade
+        return c
+    
+    def _impulse(self, change):
+        """
+        Open a new segment at the current clock
+        
+        Args:
+            change: callable(segment) applying the impulse to the new parameters
+        """
+        t = self.time
+        before = self._evaluate(t)
+        seg = self._segment_at(t).copy(t)
+        seg.bob_phase0, seg.bob0 = before['bob_phase'], before['bob']
+        seg.sway_phase0, seg.sway0 = before['sway_phase'], before['sway']
+        seg.recoil_t0, seg.recoil0 = t, before['recoil_amount']
+        if before['shake_amount'] <= 0:
+            seg.shake0 = 0.0
+        change(seg)
+        
+        # Keep the smoothed camera continuous across the impulse
+        seg.lag = (0.0, 0.0, 0.0)
+        after = self._evaluate(t, seg)
+        seg.lag = (before['offset'][0] - after['target'][0],
+                   before['offset'][1] - after['target'][1],
+                   before['rotation'] - after['rotation'])
+        
+        # Impulses in the past of a seek are dropped: history is linear
+        i = bisect.bisect_right(self._segment_starts, t)
+        del self._segments[i:], self._segment_starts[i:]
+        self._segments.append(seg)
+        self._segment_starts.append(t)
+        if len(self._segments) > MAX_SEGMENTS:
+            del self._segments[0], self._segment_starts[0]
     
     # ══════════════════════════════════════════════════════════
     #   PUBLIC API - CAMERA CONTROL
@@ -194,7 +341,13 @@ class CameraSystem:
     
     def set_moving(self, moving):
         """Set whether camera is moving"""
+        if moving == self.is_moving:
+            return
         self.is_moving = moving
+        
+        def change(seg):
+            seg.moving = moving
+        self._impulse(change)
     
     def apply_recoil(self, intensity=1.0):
         """
@@ -203,7 +356,19 @@ class CameraSystem:
         Args:
             intensity: Recoil strength (0-1), default 1.0 for full recoil
         """
-        self.recoil_amount = min(1.0, intensity)
+        def change(seg):
+            seg.recoil0 = min(1.0, intensity)
+        self._impulse(change)
+    
+    def reseed(self, seed):
+        """
+        Seed the shake generator so shakes are reproducible
+        
+        Args:
+            seed: Integer seed (recorded by replay.SessionRecorder)
+        """
+        self.seed = seed
+        self.rng.seed(seed)
     
     def apply_shake(self, intensity=10.0):
         """
@@ -212,7 +377,13 @@ class CameraSystem:
         Args:
             intensity: Shake magnitude in pixels
         """
-        self.shake_amount = intensity
+        seed = self.rng.getrandbits(31)  # One draw per shake: the shake itself is a pure function of t
+        
+        def change(seg):
+            seg.shake_t0 = self.time
+            seg.shake0 = intensity
+            seg.shake_seed = seed
+        self._impulse(change)
     
     def get_camera_offset(self):
         """
@@ -232,6 +403,30 @@ class CameraSystem:
         """
         return self.smooth_rotation
     
+    def get_camera_offset_at(self, t):
+        """
+        Camera offset at any timestamp (render interpolation, replay seeking)
+        
+        Args:
+            t: Camera clock time in seconds (see self.time)
+        
+        Returns:
+            tuple: (offset_x, offset_y) in pixels (float)
+        """
+        return self._evaluate(t)['offset']
+    
+    def get_camera_rotation_at(self, t):
+        """
+        Returns:
+            float: Rotation in degrees at camera time t
+        """
+        return self._evaluate(t)['rotation']
+    
+    def seek(self, t):
+        """Set the camera clock (replay seeking) and refresh the offset fields"""
+        self.time = t
+        self.update(0.0)
+    
     # ══════════════════════════════════════════════════════════
     #   LAYER MANAGEMENT
     # ══════════════════════════════════════════════════════════
@@ -293,16 +488,69 @@ class CameraSystem:
         for render_func in self.layers['ui']:
             render_func(screen, (0, 0))
     
+    def set_dof_source(self, surface):
+        """
+        Set the baked static background the DOF pass blurs
+        
+        Args:
+            surface: Background bake (any resolution) or None
+        """
+        self._dof_source = surface
+    
+    def get_dof_amount(self):
+        """
+        Defocus of the background (0-1) from dof_intensity and focus_distance
+        
+        Returns:
+            float: 0 = sharp, 1 = fully blurred
+        """
+        defocus = abs(self.background_depth - self.focus_distance) / max(1.0, self.background_depth)
+        return max(0.0, min(1.0, self.dof_intensity * min(1.0, defocus) * 2))
+    
+    def _blurred_background(self, passes):
+        """Downscale/upscale chain of the DOF source, cached until source or passes change"""
+        source = self._dof_source
+        size = (self.width, self.height)
+        if self._dof_key is not None and self._dof_key[0] is source and self._dof_key[1] == passes:
+            return self._dof_blurred
+        
+        # Halve repeatedly, then double back up: each smoothscale step is
+        # a bilinear filter, so the chain approximates a wide gaussian
+        surf = source if source.get_bitsize() >= 24 else source.convert(24)
+        w, h = size
+        steps = []
+        for _ in range(passes):
+            w, h = max(1, w // 2), max(1, h // 2)
+            steps.append((w, h))
+            surf = pygame.transform.smoothscale(surf, (w, h))
+        for w, h in reversed(steps[:-1]):
+            surf = pygame.transform.smoothscale(surf, (w, h))
+        surf = pygame.transform.smoothscale(surf, size)
+        
+        self._dof_blurred = surf
+        self._dof_key = (source, passes)
+        return surf
+    
     def _apply_background_dof(self, screen):
         """
-        Apply subtle depth-of-field blur to background
-        (Simplified for performance)
+        Apply depth-of-field blur to background
+        
+        The blurred background is cached; per frame this is one alpha blit.
+        Without a source (set_dof_source) it falls back to a plain darkening.
         """
-        # Create a darkened/desaturated overlay for DOF effect
-        dof_surf = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-        alpha = int(self.dof_intensity * 30)  # Subtle darkening
-        dof_surf.fill((0, 0, 0, alpha))
-        screen.blit(dof_surf, (0, 0))
+        amount = self.get_dof_amount()
+        if amount <= 0:
+            return
+        
+        if self._dof_source is None:
+            shade = 255 - int(amount * 30)
+            screen.fill((shade, shade, shade), special_flags=pygame.BLEND_RGB_MULT)
+            return
+        
+        passes = max(1, round(amount * self.dof_max_passes))
+        blurred = self._blurred_background(passes)
+        blurred.set_alpha(int(80 + amount * 175))
+        screen.blit(blurred, (0, 0))
     
     # ══════════════════════════════════════════════════════════
     #   UTILITY METHODS
@@ -342,6 +590,9 @@ class CameraSystem:
     
     def reset(self):
         """Reset camera to default state"""
+        self.time = 0.0
+        self._segments = [_Segment()]
+        self._segment_starts = [0.0]
         self.position = pygame.math.Vector2(0, 0)
         self.rotation = 0.0
         self.velocity = pygame.math.Vector2(0, 0)
@@ -355,4 +606,6 @@ class CameraSystem:
         self.recoil_offset = pygame.math.Vector2(0, 0)
         self.shake_offset = pygame.math.Vector2(0, 0)
         self.smooth_position = pygame.math.Vector2(0, 0)
-        self.smooth_rotation = 0.0
\ No newline at end of file
+        self.smooth_rotation = 0.0
+        self._dof_blurred = None
+        self._dof_key = None
\ No newline at end of file
@@ -35,7 +35,9 @@ class FPSRenderer:
         
         # ═══ INITIALIZE SUBSYSTEMS ═══
         self.camera = CameraSystem(screen_width, screen_height)
-        self.weapon = WeaponController(screen_width, screen_height)
+        # One animation system for both gun renderers (UI owns it)
+        self.anim = ui_instance.anim
+        self.weapon = WeaponController(screen_width, screen_height, anim=self.anim)
         
         # ═══ RENDERING STATE ═══
         self.enabled = True  # Can be toggled for performance
@@ -61,6 +63,9 @@ class FPSRenderer:
         """
         Update all FPS systems
         
+        Does not advance the shared gun animation: Game.update owns that
+        (ui.update_animations, once per frame).
+        
         Args:
             dt: Delta time in seconds
             is_moving: Whether player is moving
@@ -72,7 +77,7 @@ class FPSRenderer:
         self.camera.set_moving(is_moving)
         self.camera.update(dt)
         
-        # Update weapon
+        # Update weapon (sets its spring targets; Game.update advances them)
         self.weapon.set_moving(is_moving)
         self.weapon.update(dt)
     
@@ -87,8 +92,13 @@ class FPSRenderer:
         """
         camera_offset = self.camera.get_camera_offset()
         
-        # Call existing UI background render with camera offset
-        self.ui.draw_background(screen)
+        # Depth of field over the baked background (re-blurred only when it
+        # changes), under the blinking lights like the fog / doorway they sit on
+        self.ui.draw_background_static(screen)
+        if self.show_effects and self.camera.dof_enabled:
+            self.camera.set_dof_source(self.ui.static_background())
+            self.camera._apply_background_dof(screen)
+        self.ui.draw_background_dynamic(screen)
         
         # Apply subtle vignette
         if self.show_effects:
@@ -127,32 +137,9 @@ class FPSRenderer:
         # Render weapon with camera transforms
         self.weapon.render(screen, camera_offset, camera_rotation)
         
-        # Call existing gun rendering (if using original style)
-        # This maintains compatibility with your existing draw_gun_doom()
-        recoil_offset = int(self.weapon.recoil_strength * 25)
-        
-        # Delegate to UI's gun rendering with enhanced positioning
+        # Existing gun rendering reads the same animation channels (no state to swap)
         if hasattr(self.ui, 'draw_gun_doom'):
-            # Store original values
-            orig_recoil = self.ui._gun_recoil
-            orig_kickback = self.ui._gun_kickback
-            orig_flash = self.ui._muzzle_flash_timer
-            
-            # Apply our weapon controller values
-            self.ui._gun_recoil = self.weapon.recoil_strength
-            self.ui._gun_kickback = recoil_offset
-            
-            if show_flash or self.weapon.muzzle_flash_active:
-                self.ui._muzzle_flash_timer = self.weapon.muzzle_flash_duration * \
-                                             self.weapon.muzzle_flash_intensity
-            
-            # Render gun
             self.ui.draw_gun_doom(screen, show_flash or self.weapon.muzzle_flash_active)
-            
-            # Restore original values
-            self.ui._gun_recoil = orig_recoil
-            self.ui._gun_kickback = orig_kickback
-            self.ui._muzzle_flash_timer = orig_flash
     
     def render_hud(self, screen, *args, **kwargs):
         """
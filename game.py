@@ -1,12 +1,40 @@
 import pygame
-import json
-import os
+import uuid
 from question_manager import QuestionManager
+from leaderboard import LeaderboardStore
+from analytics import AnswerLog
+from game_engine import GameEngine
+import quiz_rules
 from monster import Monster
 from ui import UI
 
+
+def _engine_field(name):
+    # Run state lives in GameEngine; Game reads/writes it under the old names
+    return property(lambda self: getattr(self.engine, name),
+                    lambda self, value: setattr(self.engine, name, value))
+
+
 class Game:
-    def __init__(self, screen):
+    score = _engine_field('score')
+    wrong_answers = _engine_field('wrong_answers')
+    max_wrong = _engine_field('max_wrong')
+    monsters_killed = _engine_field('monsters_killed')
+    current_monster_index = _engine_field('current_monster_index')
+    current_question = _engine_field('current_question')
+    target_part = _engine_field('target_part')
+    selected_answer = _engine_field('selected_answer')
+    selected_answers = _engine_field('selected_answers')
+    user_input = _engine_field('user_input')
+    show_feedback = _engine_field('show_feedback')
+    feedback_timer = _engine_field('feedback_timer')
+    is_correct = _engine_field('is_correct')
+    monster_transition_state = _engine_field('monster_transition_state')
+    transition_timer = _engine_field('transition_timer')
+    monster_death_delay = _engine_field('monster_death_delay')
+    monster_spawn_delay = _engine_field('monster_spawn_delay')
+    
+    def __init__(self, screen, analytics=True, class_id='', persist=True, server=None):
         self.screen = screen
         self.width = screen.get_width()
         self.height = screen.get_height()
@@ -14,42 +42,48 @@ class Game:
         # Game states
         self.state = "MENU"
         
-        # Components
-        self.question_manager = QuestionManager()
+        # Components (persist=False: replay / headless runs never write data/)
+        self.persist = persist
+        self.question_manager = QuestionManager(persist=persist)
+        # server: connected SessionClient = thin client (draw / grading on the server)
+        self.remote = server is not None
+        if self.remote:
+            from session_server import RemoteEngine
+            self.engine = RemoteEngine(server, lambda: self.player_name, class_id)
+        else:
+            self.engine = GameEngine(self.question_manager)
         self.monsters = []
-        self.current_monster_index = 0
         self.create_monsters()
-        self.ui = UI(self.width, self.height)
+        self._monster_layer = None  # Reused alpha layer while compositing
+        self.ui = UI(self.width, self.height, persist=persist)
+        self.ui.preload_assets()
         
-        # Player data
+        # Player data (score, question, transitions: see GameEngine)
         self.player_name = ""
-        self.score = 0
-        self.wrong_answers = 0
-        self.max_wrong = 2
-        self.monsters_killed = 0
         
-        # Current question
-        self.current_question = None
-        self.target_part = None
-        self.selected_answer = None
-        self.selected_answers = []
-        self.user_input = ""
-        self.show_feedback = False
-        self.feedback_timer = 0
-        self.is_correct = False
+        # Per-answer analytics (written on a background thread, see analytics.py)
+        self.analytics = AnswerLog() if analytics and persist and not self.remote else None
+        self.class_id = class_id
+        self.session_id = None
         
         # Rankings
-        self.rankings = self.load_rankings()
+        if persist:
+            self.leaderboard = LeaderboardStore()
+        else:
+            self.leaderboard = LeaderboardStore(':memory:', legacy_json=None)
+        self.rankings_per_page = 6
+        self.ranking_page = 0
+        self.ranking_page_count = 1
+        self.rankings = []  # Only the page being shown
+        
+        # Question search in the file manager (see question_index.py)
+        self.search_per_page = 5
+        self.search_state = {'query': "", 'level': None, 'type': None, 'file': None,
+                             'page': 0, 'result': None}
         
         # Crosshair
         self.crosshair_pos = pygame.mouse.get_pos()
         
-        # ═══ MONSTER TRANSITION ═══
-        self.monster_transition_state = "ACTIVE"  # ACTIVE, DYING, SPAWNING
-        self.transition_timer = 0.0
-        self.monster_death_delay = 0.8  # 0.8 giây delay sau khi chết
-        self.monster_spawn_delay = 0.3  # 0.3 giây spawn animation
-        
     def create_monsters(self):
         # 7 different robot types
         robot_types = ['titan_bot', 'stealth_bot', 'plasma_bot', 'war_bot', 'nano_bot', 'mech_bot', 'cyber_bot']
@@ -61,23 +95,22 @@ class Game:
             return self.monsters[self.current_monster_index % len(self.monsters)]
         return None
     
-    def load_rankings(self):
-        try:
-            if os.path.exists('data/rankings.json'):
-                with open('data/rankings.json', 'r', encoding='utf-8') as f:
-                    return json.load(f)
-        except:
-            pass
-        return []
+    def refresh_rankings(self):
+        """Load the current ranking page from the leaderboard store"""
+        total = self.leaderboard.count()
+        self.ranking_page_count = max(1, (total + self.rankings_per_page - 1) // self.rankings_per_page)
+        self.ranking_page = min(self.ranking_page, self.ranking_page_count - 1)
+        self.rankings = self.leaderboard.page(self.ranking_page, self.rankings_per_page)
     
-    def save_rankings(self):
-        os.makedirs('data', exist_ok=True)
-        with open('data/rankings.json', 'w', encoding='utf-8') as f:
-            json.dump(self.rankings, f, ensure_ascii=False, indent=2)
+    def open_rankings(self):
+        self.state = "RANKING"
+        self.ranking_page = 0
+        self.refresh_rankings()
     
     def reset_rankings(self):
-        self.rankings = []
-        self.save_rankings()
+        self.leaderboard.reset()
+        self.ranking_page = 0
+        self.refresh_rankings()
     
     def handle_event(self, event):
         if self.state == "MENU":
@@ -101,8 +134,9 @@ class Game:
                 self.player_name = ""
             elif self.ui.check_button_click(x, y, "upload"):
                 self.state = "FILE_MANAGER"
+                self.refresh_search()
             elif self.ui.check_button_click(x, y, "ranking"):
-                self.state = "RANKING"
+                self.open_rankings()
     
     def handle_name_input_event(self, event):
         if event.type == pygame.KEYDOWN:
@@ -125,61 +159,43 @@ class Game:
                     self.start_game()
     
     def handle_game_event(self, event):
-        # Không cho click nếu đang transition
-        if self.monster_transition_state != "ACTIVE":
+        # Không cho click nếu đang transition / đang hiện feedback
+        if not self.engine.accepts_input:
             return
             
-        if event.type == pygame.MOUSEBUTTONDOWN and not self.show_feedback:
+        if event.type == pygame.MOUSEBUTTONDOWN:
             x, y = event.pos
             monster = self.get_current_monster()
             
             if self.current_question is None:
                 part = monster.get_clicked_part(x, y)
                 if part:
-                    self.target_part = part
-                    level = self.get_level_from_part(part)
-                    self.current_question = self.question_manager.get_random_question(level)
-                    if self.current_question:
-                        self.selected_answer = None
-                        self.selected_answers = []
-                        self.user_input = ""
+                    self.apply_action(('shoot', part))
             else:
                 q_type = self.current_question.get('type', 'multiple_choice')
                 
-                if q_type == 'multiple_choice':
+                if q_type in ('multiple_choice', 'true_false'):
                     answer_index = self.ui.check_answer_click(x, y, len(self.current_question.get('answers', [])))
                     if answer_index is not None:
-                        self.selected_answer = answer_index
-                        self.selected_answers = [answer_index]
-                    elif self.ui.check_button_click(x, y, "submit") and self.selected_answer is not None:
-                        self.submit_answer()
-                
-                elif q_type == 'true_false':
-                    answer_index = self.ui.check_answer_click(x, y, len(self.current_question.get('answers', [])))
-                    if answer_index is not None:
-                        if answer_index in self.selected_answers:
-                            self.selected_answers.remove(answer_index)
-                        else:
-                            self.selected_answers.append(answer_index)
-                    elif self.ui.check_button_click(x, y, "submit") and len(self.selected_answers) > 0:
+                        self.apply_action(('select', answer_index))
+                    elif self.ui.check_button_click(x, y, "submit"):
                         self.submit_answer()
                 
                 elif q_type == 'short_answer':
-                    if self.ui.check_button_click(x, y, "submit") and self.user_input.strip():
+                    if self.ui.check_button_click(x, y, "submit"):
                         self.submit_answer()
         
         elif event.type == pygame.KEYDOWN and self.current_question:
             q_type = self.current_question.get('type', 'multiple_choice')
             
-            if q_type == 'short_answer' and not self.show_feedback:
+            if q_type == 'short_answer':
                 if event.key == pygame.K_RETURN:
-                    if self.user_input.strip():
-                        self.submit_answer()
+                    self.submit_answer()
                 elif event.key == pygame.K_BACKSPACE:
-                    self.user_input = self.user_input[:-1]
+                    self.apply_action(('input', self.user_input[:-1]))
                 elif event.unicode.isprintable():
                     if len(self.user_input) < 50:
-                        self.user_input += event.unicode
+                        self.apply_action(('input', self.user_input + event.unicode))
     
     def handle_result_event(self, event):
         if event.type == pygame.MOUSEBUTTONDOWN:
@@ -194,178 +210,180 @@ class Game:
                 self.state = "MENU"
             elif self.ui.check_button_click(x, y, "reset"):
                 self.reset_rankings()
+            elif self.ui.check_button_click(x, y, "rank_prev") and self.ranking_page > 0:
+                self.ranking_page -= 1
+                self.refresh_rankings()
+            elif self.ui.check_button_click(x, y, "rank_next") and self.ranking_page < self.ranking_page_count - 1:
+                self.ranking_page += 1
+                self.refresh_rankings()
+    
+    def refresh_search(self, page=0):
+        """Re-run the file manager search (on every query / filter / page change)"""
+        search = self.search_state
+        search['result'] = self.question_manager.search_questions(
+            search['query'], search['level'], search['type'], search['file'],
+            page, self.search_per_page)
+        search['page'] = search['result']['page']
+    
+    def cycle_search_filter(self, key, values):
+        search = self.search_state
+        current = search[key] if search[key] in values else None
+        search[key] = values[(values.index(current) + 1) % len(values)]
+        self.refresh_search()
     
     def handle_file_manager_event(self, event):
-        if event.type == pygame.MOUSEBUTTONDOWN:
+        search = self.search_state
+        if event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_BACKSPACE:
+                search['query'] = search['query'][:-1]
+            elif event.key == pygame.K_ESCAPE:
+                if not search['query']:
+                    self.state = "MENU"
+                    return
+                search['query'] = ""
+            elif event.key == pygame.K_PAGEDOWN:
+                self.refresh_search(search['page'] + 1)
+                return
+            elif event.key == pygame.K_PAGEUP:
+                self.refresh_search(search['page'] - 1)
+                return
+            elif len(search['query']) < 60 and event.unicode and event.unicode.isprintable():
+                search['query'] += event.unicode
+            else:
+                return
+            self.refresh_search()
+        elif event.type == pygame.MOUSEWHEEL:
+            if self.ui.file_list_contains(*pygame.mouse.get_pos()):
+                self.ui.scroll_file_list(event.y)
+        elif event.type == pygame.MOUSEMOTION:
+            self.ui.drag_file_list(event.pos[1])
+        elif event.type == pygame.MOUSEBUTTONUP:
+            self.ui.end_file_drag()
+        elif event.type == pygame.MOUSEBUTTONDOWN:
             x, y = event.pos
+            if event.button in (4, 5):
+                return  # wheel also arrives as MOUSEWHEEL
             if self.ui.check_button_click(x, y, "back"):
                 self.state = "MENU"
+            elif self.ui.check_button_click(x, y, "search_level"):
+                self.cycle_search_filter('level', (None, 'nhanbiet', 'thonghieu', 'vandung'))
+            elif self.ui.check_button_click(x, y, "search_type"):
+                self.cycle_search_filter('type', (None, 'multiple_choice', 'true_false', 'short_answer'))
+            elif self.ui.check_button_click(x, y, "search_file"):
+                self.cycle_search_filter('file', (None,) + tuple(range(len(self.question_manager.uploaded_files))))
+            elif self.ui.check_button_click(x, y, "search_prev"):
+                self.refresh_search(search['page'] - 1)
+            elif self.ui.check_button_click(x, y, "search_next"):
+                self.refresh_search(search['page'] + 1)
             elif self.ui.check_button_click(x, y, "upload"):
-                import tkinter as tk
-                from tkinter import filedialog
-                root = tk.Tk()
-                root.withdraw()
-                filename = filedialog.askopenfilename(
-                    title="Chon file cau hoi",
-                    filetypes=[("Text files", "*.txt")]
-                )
+                filename = self.ask_question_file()
                 if filename:
                     count = self.question_manager.load_questions_from_file(filename)
                     print(f"Da tai {count} cau hoi tu {filename}")
+                    self.refresh_search(search['page'])
             else:
                 delete_index = self.ui.check_file_delete_click(x, y, len(self.question_manager.uploaded_files))
-                if delete_index is not None:
+                if delete_index is None and self.ui.file_list_contains(x, y):
+                    self.ui.begin_file_drag(y)
+                elif delete_index is not None:
                     self.question_manager.delete_file(delete_index)
+                    if search['file'] is not None:
+                        search['file'] = None  # file indices shifted
+                    self.refresh_search(search['page'])
+    
+    def ask_question_file(self):
+        """
+        File dialog for a question file (replaced by a no-op in headless replay)
+        
+        Returns:
+            str: Chosen path, or "" if cancelled
+        """
+        import tkinter as tk
+        from tkinter import filedialog
+        root = tk.Tk()
+        root.withdraw()
+        return filedialog.askopenfilename(
+            title="Chon file cau hoi",
+            filetypes=[("Text files", "*.txt")]
+        )
     
     def get_level_from_part(self, part):
-        if part == "head":
-            return "vandung"
-        elif part == "body":
-            return "thonghieu"
-        else:
-            return "nhanbiet"
+        return quiz_rules.get_level_from_part(part)
     
     def start_game(self):
-        if len(self.question_manager.questions) == 0:
+        if not self.engine.start():
             print("Vui long tai file cau hoi truoc!")
             return
         
         self.state = "GAME"
-        self.score = 0
-        self.wrong_answers = 0
-        self.monsters_killed = 0
-        self.current_monster_index = 0
+        self.session_id = uuid.uuid4().hex[:12]
         for monster in self.monsters:
             monster.reset()
-        self.current_question = None
-        self.target_part = None
-        self.selected_answer = None
-        self.selected_answers = []
-        self.user_input = ""
-        self.show_feedback = False
-        self.question_manager.reset_used_questions()
-        self.monster_transition_state = "ACTIVE"
-        self.transition_timer = 0.0
         pygame.mouse.set_visible(False)
     
+    def apply_action(self, action):
+        """Send a player action to the engine and play its effects"""
+        self.handle_engine_events(self.engine.apply(action))
+    
     def submit_answer(self):
-        if self.current_question is None:
-            return
-        
-        q_type = self.current_question.get('type', 'multiple_choice')
-        
-        if q_type == 'multiple_choice':
-            if self.selected_answer is None:
-                return
-            self.is_correct = (self.selected_answer == self.current_question.get('correct'))
-        
-        elif q_type == 'true_false':
-            if len(self.selected_answers) == 0:
-                return
-            
-            correct_answers = self.current_question.get('correct_answers', [self.current_question.get('correct')])
-            selected_set = set(self.selected_answers)
-            correct_set = set(correct_answers)
-            self.is_correct = (selected_set == correct_set)
-        
-        elif q_type == 'short_answer':
-            if not self.user_input.strip():
-                return
-            correct_ans = self.current_question.get('correct_answer', '').strip().lower()
-            user_ans = self.user_input.strip().lower()
-            self.is_correct = (user_ans == correct_ans)
-        
-        self.show_feedback = True
-        self.feedback_timer = 1.5
-        
-        if self.is_correct:
-            # ═══ TRIGGER SHOOT EFFECT ═══
-            self.ui.trigger_shoot_effect()
+        self.apply_action(('submit',))
+    
+    def handle_engine_events(self, events):
+        for kind, value in events:
+            if kind in ('correct', 'wrong') and self.analytics is not None:
+                self.analytics.record(self.session_id, self.current_question, value,
+                                      self.engine.answer_latency, kind == 'correct', self.class_id)
+            if kind == 'correct':
+                # ═══ TRIGGER SHOOT EFFECT ═══
+                self.ui.trigger_shoot_effect()
+            elif kind == 'damage':
+                self.get_current_monster().take_damage(value)
+            elif kind == 'spawn':
+                self.get_current_monster().reset()
+            elif kind == 'game_over':
+                self.end_game(value)
     
     def update(self, dt):
         self.crosshair_pos = pygame.mouse.get_pos()
+        self.ui.update_animations(dt)
         
         if self.state == "GAME":
-            monster = self.get_current_monster()
-            
-            # ═══ MONSTER TRANSITION STATE MACHINE ═══
-            if self.monster_transition_state == "DYING":
-                self.transition_timer -= dt
-                if self.transition_timer <= 0:
-                    # Chuyển sang spawn con mới
-                    if self.question_manager.has_unused_questions():
-                        self.current_monster_index += 1
-                        next_monster = self.get_current_monster()
-                        next_monster.reset()
-                        self.monster_transition_state = "SPAWNING"
-                        self.transition_timer = self.monster_spawn_delay
-                    else:
-                        # Hết câu hỏi - thắng!
-                        self.end_game(True)
-                        self.monster_transition_state = "ACTIVE"
-            
-            elif self.monster_transition_state == "SPAWNING":
-                self.transition_timer -= dt
-                if self.transition_timer <= 0:
-                    # Spawn xong, active lại
-                    self.monster_transition_state = "ACTIVE"
-            
-            # ═══ FEEDBACK LOGIC ═══
-            if self.show_feedback:
-                self.feedback_timer -= dt
-                if self.feedback_timer <= 0:
-                    self.show_feedback = False
-                    
-                    if self.is_correct:
-                        damage = self.get_damage_from_part(self.target_part)
-                        monster.take_damage(damage)
-                        self.score += damage * 10
-                        
-                        if monster.hp <= 0:
-                            self.monsters_killed += 1
-                            # Bắt đầu transition
-                            self.monster_transition_state = "DYING"
-                            self.transition_timer = self.monster_death_delay
-                    else:
-                        self.wrong_answers += 1
-                        if self.wrong_answers >= self.max_wrong:
-                            self.end_game(False)
-                    
-                    self.current_question = None
-                    self.target_part = None
-                    self.selected_answer = None
-                    self.selected_answers = []
-                    self.user_input = ""
+            self.handle_engine_events(self.engine.step(dt))
+        elif self.state == "FILE_MANAGER":
+            self.ui.update_file_list(dt, len(self.question_manager.uploaded_files))
+    
+    def is_animating(self):
+        """
+        False when the screen only changes on input (main loop may then
+        block in pygame.event.wait instead of redrawing at 60 FPS)
+        """
+        if self.state in ("GAME", "NAME_INPUT"):
+            return True
+        if self.state == "FILE_MANAGER":
+            return self.ui.file_list_moving()
+        return False
     
     def get_damage_from_part(self, part):
-        if part == "head":
-            return 40
-        elif part == "body":
-            return 25
-        else:
-            return 15
+        return quiz_rules.get_damage_from_part(part)
     
     def end_game(self, won):
         import datetime
         
         new_ranking = {
             "name": self.player_name,
-            "score": self.score,
-            "won": won,
-            "monsters_killed": self.monsters_killed,
+            **self.engine.result(),
             "date": datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         }
         
-        self.rankings.append(new_ranking)
-        self.rankings.sort(key=lambda x: x['score'], reverse=True)
-        self.rankings = self.rankings[:10]
-        self.save_rankings()
+        if not self.remote:  # The server ranks networked games
+            self.leaderboard.add(new_ranking)
         
         self.state = "RESULT"
         pygame.mouse.set_visible(True)
     
     def draw(self):
-        self.screen.fill((20, 20, 40))
+        if self.state != "GAME":  # The game view covers the frame (or the compositor does)
+            self.screen.fill((20, 20, 40))
         
         if self.state == "MENU":
             self.ui.draw_menu(self.screen, len(self.question_manager.questions))
@@ -379,9 +397,45 @@ class Game:
                               self.wrong_answers, monster.hp, 
                               self.monsters_killed, self.monsters_killed > 0)
         elif self.state == "RANKING":
-            self.ui.draw_ranking(self.screen, self.rankings)
+            self.ui.draw_ranking(self.screen, self.rankings, self.ranking_page,
+                                 self.ranking_page_count, self.rankings_per_page)
         elif self.state == "FILE_MANAGER":
-            self.ui.draw_file_manager(self.screen, self.question_manager.uploaded_files)
+            self.ui.draw_file_manager(self.screen, self.question_manager.uploaded_files, self.search_state)
+    
+    def set_compositor(self, compositor):
+        """
+        Composite baked layers with a texture backend (sdl2_backend.py):
+        background and monster become textures, the frame only carries
+        what draw_game marks dirty
+        """
+        self.ui.compositor = compositor
+    
+    def mark_dirty(self, rect):
+        """Frame region drawn this frame (compositor uploads only these)"""
+        if self.ui.compositor is not None:
+            self.ui.compositor.mark_dirty(rect)
+    
+    def draw_monster(self, monster, highlighted_part, alpha=255):
+        """
+        Monster at alpha (death / spawn fades): a full-screen alpha surface,
+        or with a compositor a texture layer with alpha mod
+        """
+        compositor = self.ui.compositor
+        if compositor is not None:
+            if self._monster_layer is None:
+                self._monster_layer = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
+            area = monster.layer_rect().clip(self.screen.get_rect())
+            self._monster_layer.fill((0, 0, 0, 0), area)
+            monster.draw(self._monster_layer, highlighted_part)
+            compositor.queue_layer('monster', self._monster_layer, alpha=max(0, min(255, alpha)),
+                                   area=area, version=(pygame.time.get_ticks(), highlighted_part, monster))
+        elif alpha < 255:
+            monster_surf = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
+            monster.draw(monster_surf, highlighted_part)
+            monster_surf.set_alpha(alpha)
+            self.screen.blit(monster_surf, (0, 0))
+        else:
+            monster.draw(self.screen, highlighted_part)
     
     def draw_game(self):
         # ═══ DRAW BACKGROUND ═══
@@ -393,10 +447,7 @@ class Game:
         if self.monster_transition_state == "DYING":
             # Fade out effect
             alpha = int((self.transition_timer / self.monster_death_delay) * 255)
-            monster_surf = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-            monster.draw(monster_surf, self.target_part)
-            monster_surf.set_alpha(alpha)
-            self.screen.blit(monster_surf, (0, 0))
+            self.draw_monster(monster, self.target_part, alpha)
             
             # Death text
             death_text = self.ui.large_font.render("ELIMINATED!", True, (255, 50, 50))
@@ -404,15 +455,12 @@ class Game:
             death_surf = pygame.Surface((death_text.get_width(), death_text.get_height()), pygame.SRCALPHA)
             death_surf.blit(death_text, (0, 0))
             death_surf.set_alpha(text_alpha)
-            self.screen.blit(death_surf, death_text.get_rect(center=(self.width // 2, self.height // 2 - 100)))
+            self.mark_dirty(self.screen.blit(death_surf, death_text.get_rect(center=(self.width // 2, self.height // 2 - 100))))
         
         elif self.monster_transition_state == "SPAWNING":
             # Fade in effect
             alpha = int((1 - self.transition_timer / self.monster_spawn_delay) * 255)
-            monster_surf = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-            monster.draw(monster_surf, None)
-            monster_surf.set_alpha(alpha)
-            self.screen.blit(monster_surf, (0, 0))
+            self.draw_monster(monster, None, alpha)
             
             # Spawn text
             spawn_text = self.ui.large_font.render("NEW TARGET!", True, (255, 200, 0))
@@ -420,24 +468,26 @@ class Game:
             spawn_surf = pygame.Surface((spawn_text.get_width(), spawn_text.get_height()), pygame.SRCALPHA)
             spawn_surf.blit(spawn_text, (0, 0))
             spawn_surf.set_alpha(text_alpha)
-            self.screen.blit(spawn_surf, spawn_text.get_rect(center=(self.width // 2, self.height // 2 - 100)))
+            self.mark_dirty(self.screen.blit(spawn_surf, spawn_text.get_rect(center=(self.width // 2, self.height // 2 - 100))))
         
         else:
             # Normal draw
-            monster.draw(self.screen, self.target_part)
+            self.draw_monster(monster, self.target_part)
         
         # ═══ DRAW HUD ═══
-        self.ui.draw_hud(self.screen, self.player_name, self.score, 
-                        monster.hp, self.wrong_answers, self.max_wrong,
-                        self.monsters_killed)
+        for rect in self.ui.draw_hud(self.screen, self.player_name, self.score, 
+                                     monster.hp, self.wrong_answers, self.max_wrong,
+                                     self.monsters_killed):
+            self.mark_dirty(rect)
         
         # ═══ DRAW GUN ═══
         show_flash = self.show_feedback and self.is_correct
-        self.ui.draw_gun(self.screen, show_flash)
+        for rect in self.ui.draw_gun(self.screen, show_flash):
+            self.mark_dirty(rect)
         
         # ═══ DRAW QUESTION PANEL ═══
         if self.current_question and self.monster_transition_state == "ACTIVE":
-            self.ui.draw_question_panel(
+            self.mark_dirty(self.ui.draw_question_panel(
                 self.screen, 
                 self.current_question, 
                 self.target_part, 
@@ -446,9 +496,10 @@ class Game:
                 self.user_input,
                 self.show_feedback, 
                 self.is_correct
-            )
+            ))
         
         # ═══ DRAW CROSSHAIR ═══
+        self.mark_dirty(pygame.Rect(self.crosshair_pos[0] - 21, self.crosshair_pos[1] - 21, 43, 43))
         if not self.current_question and self.monster_transition_state == "ACTIVE":
             # Crosshair bắn
             pygame.draw.circle(self.screen, (255, 0, 0), self.crosshair_pos, 15, 2)
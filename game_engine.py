@@ -0,0 +1,367 @@
+"""
+═══════════════════════════════════════════════════════════════════
+HEADLESS GAME ENGINE
+═══════════════════════════════════════════════════════════════════
+The rules of one quiz run, without pygame:
+- shoot a body part -> draw a question of the matching level
+- select / type / submit an answer -> grade via quiz_rules
+- feedback timer, damage & score, wrong-answer limit
+- DYING / SPAWNING monster transition state machine
+
+Game turns clicks and key presses into actions and renders the
+engine's fields; simulations drive it directly with step(dt, action).
+
+Actions:
+    ('shoot', part)      ('select', index)      ('input', text)
+    ('submit',)
+
+Events returned by step/apply:
+    ('correct', part) ('wrong', part) ('damage', amount)
+    ('killed', index) ('spawn', index) ('game_over', won)
+
+Usage:
+    python game_engine.py --bots 10000    (bot sessions per second)
+═══════════════════════════════════════════════════════════════════
+"""
+
+import argparse
+import random
+import time
+
+import quiz_rules
+
+
+# Everything a run needs to continue after a restart (GameEngine.snapshot)
+SNAPSHOT_FIELDS = (
+    'state', 'won', 'score', 'wrong_answers', 'max_wrong', 'monsters_killed',
+    'current_monster_index', 'monster_hp', 'current_question', 'target_part',
+    'selected_answer', 'selected_answers', 'user_input', 'show_feedback',
+    'feedback_timer', 'is_correct', 'question_time', 'answer_latency',
+    'monster_transition_state', 'transition_timer'
+)
+
+
+class GameEngine:
+    """
+    Pure-Python state of one quiz run
+    """
+
+    def __init__(self, question_manager):
+        """
+        Args:
+            question_manager: QuestionManager providing questions
+        """
+        self.question_manager = question_manager
+        self.state = "IDLE"  # IDLE, GAME, RESULT
+        self.won = False
+
+        self.score = 0
+        self.wrong_answers = 0
+        self.max_wrong = quiz_rules.MAX_WRONG
+        self.monsters_killed = 0
+        self.current_monster_index = 0
+        self.monster_hp = quiz_rules.MONSTER_MAX_HP
+
+        self.current_question = None
+        self.target_part = None
+        self.selected_answer = None
+        self.selected_answers = []
+        self.user_input = ""
+        self.show_feedback = False
+        self.feedback_timer = 0
+        self.is_correct = False
+        self.question_time = 0.0  # Seconds the current question has been on screen
+        self.answer_latency = 0.0  # question_time at the last submit
+
+        self.monster_transition_state = "ACTIVE"  # ACTIVE, DYING, SPAWNING
+        self.transition_timer = 0.0
+        self.feedback_delay = 1.5
+        self.monster_death_delay = 0.8
+        self.monster_spawn_delay = 0.3
+
+    def start(self):
+        """
+        Begin a new run
+
+        Returns:
+            bool: False if the question bank is empty
+        """
+        if len(self.question_manager.questions) == 0:
+            return False
+
+        self.state = "GAME"
+        self.won = False
+        self.score = 0
+        self.wrong_answers = 0
+        self.monsters_killed = 0
+        self.current_monster_index = 0
+        self.monster_hp = quiz_rules.MONSTER_MAX_HP
+        self._clear_question()
+        self.show_feedback = False
+        self.question_manager.reset_used_questions()
+        self.monster_transition_state = "ACTIVE"
+        self.transition_timer = 0.0
+        return True
+
+    def _clear_question(self):
+        self.current_question = None
+        self.target_part = None
+        self.selected_answer = None
+        self.selected_answers = []
+        self.user_input = ""
+
+    @property
+    def accepts_input(self):
+        return self.state == "GAME" and self.monster_transition_state == "ACTIVE" \
+            and not self.show_feedback
+
+    # ══════════════════════════════════════════════════════════
+    #   ACTIONS
+    # ══════════════════════════════════════════════════════════
+
+    def apply(self, action):
+        """
+        Apply one player action (ignored while not accepting input)
+
+        Returns:
+            list: Events produced
+        """
+        if not self.accepts_input or not action:
+            return []
+
+        kind = action[0]
+        question = self.current_question
+
+        if kind == 'shoot':
+            if question is None:
+                part = action[1]
+                self.target_part = part
+                level = quiz_rules.get_level_from_part(part)
+                self.current_question = self.question_manager.get_random_question(level)
+                if self.current_question:
+                    self.question_time = 0.0
+                    self.selected_answer = None
+                    self.selected_answers = []
+                    self.user_input = ""
+
+        elif question is None:
+            pass
+
+        elif kind == 'select':
+            index = action[1]
+            q_type = question.get('type', 'multiple_choice')
+            if q_type == 'multiple_choice':
+                self.selected_answer = index
+                self.selected_answers = [index]
+            elif q_type == 'true_false':
+                if index in self.selected_answers:
+                    self.selected_answers.remove(index)
+                else:
+                    self.selected_answers.append(index)
+
+        elif kind == 'input':
+            self.user_input = action[1][:50]
+
+        elif kind == 'submit':
+            return self.submit_answer()
+
+        return []
+
+    def submit_answer(self):
+        if self.current_question is None:
+            return []
+
+        is_correct = quiz_rules.grade_answer(self.current_question, self.selected_answer,
+                                             self.selected_answers, self.user_input)
+        if is_correct is None:
+            return []
+        self.is_correct = is_correct
+        self.answer_latency = self.question_time
+        self.question_manager.record_result(self.current_question, is_correct)
+        self.show_feedback = True
+        self.feedback_timer = self.feedback_delay
+        return [('correct' if is_correct else 'wrong', self.target_part)]
+
+    # ══════════════════════════════════════════════════════════
+    #   TIME
+    # ══════════════════════════════════════════════════════════
+
+    def step(self, dt, action=None):
+        """
+        Apply an optional action, then advance timers by dt
+
+        Returns:
+            list: Events produced
+        """
+        events = self.apply(action) if action else []
+        if self.state != "GAME":
+            return events
+
+        if self.current_question is not None and not self.show_feedback:
+            self.question_time += dt
+
+        # ═══ MONSTER TRANSITION STATE MACHINE ═══
+        if self.monster_transition_state == "DYING":
+            self.transition_timer -= dt
+            if self.transition_timer <= 0:
+                if self.question_manager.has_unused_questions():
+                    self.current_monster_index += 1
+                    self.monster_hp = quiz_rules.MONSTER_MAX_HP
+                    self.monster_transition_state = "SPAWNING"
+                    self.transition_timer = self.monster_spawn_delay
+                    events.append(('spawn', self.current_monster_index))
+                else:
+                    # Hết câu hỏi - thắng!
+                    self.monster_transition_state = "ACTIVE"
+                    events.append(self._end(True))
+
+        elif self.monster_transition_state == "SPAWNING":
+            self.transition_timer -= dt
+            if self.transition_timer <= 0:
+                self.monster_transition_state = "ACTIVE"
+
+        # ═══ FEEDBACK LOGIC ═══
+        if self.show_feedback:
+            self.feedback_timer -= dt
+            if self.feedback_timer <= 0:
+                self.show_feedback = False
+
+                if self.is_correct:
+                    damage = quiz_rules.get_damage_from_part(self.target_part)
+                    self.monster_hp = max(0, self.monster_hp - damage)
+                    self.score += damage * quiz_rules.SCORE_PER_DAMAGE
+                    events.append(('damage', damage))
+
+                    if self.monster_hp <= 0:
+                        self.monsters_killed += 1
+                        self.monster_transition_state = "DYING"
+                        self.transition_timer = self.monster_death_delay
+                        events.append(('killed', self.current_monster_index))
+                else:
+                    self.wrong_answers += 1
+                    if self.wrong_answers >= self.max_wrong:
+                        events.append(self._end(False))
+
+                self._clear_question()
+
+        return events
+
+    def _end(self, won):
+        self.state = "RESULT"
+        self.won = won
+        return ('game_over', won)
+
+    def result(self):
+        """Ranking entry fields of the finished run (no name/date)"""
+        return {
+            'score': self.score,
+            'won': self.won,
+            'monsters_killed': self.monsters_killed
+        }
+
+    def snapshot(self):
+        """Run fields as plain builtins (see session_snapshot.py)"""
+        return {name: getattr(self, name) for name in SNAPSHOT_FIELDS}
+
+    def restore(self, fields):
+        """Inverse of snapshot(); unknown keys are ignored"""
+        for name in SNAPSHOT_FIELDS:
+            if name in fields:
+                setattr(self, name, fields[name])
+
+
+# ══════════════════════════════════════════════════════════
+#   BOT SIMULATION
+# ══════════════════════════════════════════════════════════
+
+class Bot:
+    """
+    Scripted player answering correctly with probability accuracy
+    """
+
+    def __init__(self, rng, accuracy):
+        self.rng = rng
+        self.accuracy = accuracy
+        self.plan = None
+
+    def act(self, engine):
+        question = engine.current_question
+        if question is None:
+            self.plan = None
+            return ('shoot', self.rng.choice(quiz_rules.PARTS))
+        if self.plan is None:
+            self.plan = self._plan(question)
+        return self.plan.pop(0) if self.plan else ('submit',)
+
+    def _plan(self, question):
+        q_type = question.get('type', 'multiple_choice')
+        knows = self.rng.random() < self.accuracy
+        n = max(1, len(question.get('answers', [])))
+
+        if q_type == 'multiple_choice':
+            correct = question.get('correct')
+            return [('select', correct if knows and correct is not None else self.rng.randrange(n))]
+        if q_type == 'true_false':
+            correct = question.get('correct_answers') or []
+            if knows and correct:
+                return [('select', i) for i in correct]
+            return [('select', self.rng.randrange(n))]
+        return [('input', question.get('correct_answer', '') if knows else "?")]
+
+
+def simulate(sessions=1000, accuracy=0.7, seed=1, question_manager=None):
+    """
+    Play many bot sessions back to back
+
+    Returns:
+        dict: sessions/s and outcome statistics
+    """
+    if question_manager is None:
+        from question_manager import QuestionManager
+        question_manager = QuestionManager()
+    question_manager.persist = False
+    question_manager.reseed(seed)
+
+    engine = GameEngine(question_manager)
+    bot = Bot(random.Random(seed), accuracy)
+    wins = 0
+    total_score = 0
+    total_steps = 0
+
+    start = time.perf_counter()
+    for _ in range(sessions):
+        if not engine.start():
+            raise SystemExit("Ngan hang cau hoi trong - hay tai file cau hoi truoc")
+        while engine.state == "GAME":
+            action = bot.act(engine) if engine.accepts_input else None
+            # Long steps: each one resolves a whole feedback/transition phase
+            engine.step(2.0 if action is None else 0.0, action)
+            total_steps += 1
+        wins += engine.won
+        total_score += engine.score
+    elapsed = time.perf_counter() - start
+
+    return {
+        'sessions': sessions,
+        'elapsed_s': elapsed,
+        'sessions_per_s': sessions / elapsed if elapsed else 0.0,
+        'steps': total_steps,
+        'win_rate': wins / sessions,
+        'mean_score': total_score / sessions
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Monster Quiz headless bot simulation")
+    parser.add_argument('--bots', type=int, default=1000, help="So phien choi gia lap")
+    parser.add_argument('--accuracy', type=float, default=0.7, help="Xac suat tra loi dung")
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    report = simulate(args.bots, args.accuracy, args.seed)
+    for key, value in report.items():
+        print(f"{key:>16}: {value:.3f}" if isinstance(value, float) else f"{key:>16}: {value}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,202 @@
+"""
+═══════════════════════════════════════════════════════════════════
+INPUT-TO-PHOTON LATENCY PROBE (diagnostic mode)
+═══════════════════════════════════════════════════════════════════
+python main.py --latency [FILE]
+
+- Every MOUSEBUTTONDOWN / KEYDOWN is timestamped when it is taken
+  off the queue (SDL's own event timestamp when pygame exposes it,
+  else the poll time; the wait since the previous poll is reported
+  as the worst case it sat in the queue)
+- The timestamp rides through the frame: handle_event -> update ->
+  draw -> present (flip); latency = flip time - arrival
+- Frame pacing: flip-to-flip interval vs the clock.tick target,
+  jitter = |interval - target|
+- Report: latency / jitter histograms per Game.state and event type
+  (default data/latency.txt)
+
+The flip is the last point the game can see: compositor / monitor
+delay comes on top.
+═══════════════════════════════════════════════════════════════════
+"""
+
+import collections
+import os
+import time
+
+import pygame
+
+
+INPUT_EVENTS = {pygame.MOUSEBUTTONDOWN: "click", pygame.KEYDOWN: "key"}
+BUCKETS_MS = (2, 4, 8, 12, 16, 20, 25, 33, 50, 67, 100, 150)
+STAGES = ('handle', 'update', 'draw', 'present')
+
+
+def _percentile(sorted_values, p):
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * p))]
+
+
+def histogram_lines(values_ms, width=40):
+    """
+    Text histogram over BUCKETS_MS
+
+    Returns:
+        list: Lines "  <= 16 ms |#####      42"
+    """
+    counts = [0] * (len(BUCKETS_MS) + 1)
+    for v in values_ms:
+        i = 0
+        while i < len(BUCKETS_MS) and v > BUCKETS_MS[i]:
+            i += 1
+        counts[i] += 1
+    peak = max(counts) or 1
+    lines = []
+    for i, count in enumerate(counts):
+        if not count:
+            continue
+        label = f"<= {BUCKETS_MS[i]:>3} ms" if i < len(BUCKETS_MS) else f" > {BUCKETS_MS[-1]:>3} ms"
+        lines.append(f"    {label} |{'#' * max(1, count * width // peak):<{width}} {count}")
+    return lines
+
+
+class LatencyProbe:
+    """
+    Per-input latency and per-frame pacing recorder
+    """
+
+    def __init__(self, report_path='data/latency.txt', target_fps=60):
+        """
+        Args:
+            report_path: Text report written by close()
+            target_fps: The clock.tick() target
+        """
+        self.report_path = report_path
+        self.target = 1.0 / target_fps
+        self.latency = collections.defaultdict(list)  # (state, kind) -> [ms flip - arrival]
+        self.queue_wait = collections.defaultdict(list)  # (state, kind) -> [ms poll - previous poll]
+        self.stage_ms = collections.defaultdict(lambda: collections.defaultdict(list))  # state -> stage -> [ms]
+        self.intervals = collections.defaultdict(list)  # state -> [ms flip to flip]
+        self.frames = 0
+
+        self._pending = []  # (arrival, state, kind) of this frame
+        self._poll = None
+        self._last_poll = None
+        self._last_mark = None
+        self._last_flip = None
+        self._state = None
+        self._started = time.perf_counter()
+
+    # ══════════════════════════════════════════════════════════
+    #   PER FRAME
+    # ══════════════════════════════════════════════════════════
+
+    def on_events(self, events, state):
+        """
+        Call right after pygame.event.get()
+
+        Args:
+            events: Events of this frame
+            state: Game.state before the events are handled
+        """
+        now = time.perf_counter()
+        self._last_poll, self._poll = self._poll, now
+        self._last_mark = now
+        self._state = state
+        ticks = None
+        for event in events:
+            kind = INPUT_EVENTS.get(event.type)
+            if kind is None:
+                continue
+            arrival = now
+            stamp = getattr(event, 'timestamp', None)
+            if stamp:
+                # SDL timestamp (ms, same base as get_ticks) -> perf_counter time
+                if ticks is None:
+                    ticks = pygame.time.get_ticks()
+                arrival = now - max(0, ticks - stamp) / 1000.0
+            self._pending.append((arrival, state, kind))
+            if self._last_poll is not None:
+                self.queue_wait[(state, kind)].append((now - self._last_poll) * 1000.0)
+
+    def mark(self, stage):
+        """
+        End of a frame stage ('handle', 'update', 'draw')
+        """
+        now = time.perf_counter()
+        if self._last_mark is not None:
+            self.stage_ms[self._state][stage].append((now - self._last_mark) * 1000.0)
+        self._last_mark = now
+
+    def presented(self):
+        """Call right after the flip: closes every input of this frame"""
+        now = time.perf_counter()
+        self.mark('present')
+        for arrival, state, kind in self._pending:
+            self.latency[(state, kind)].append((now - arrival) * 1000.0)
+        self._pending.clear()
+        if self._last_flip is not None:
+            self.intervals[self._state].append((now - self._last_flip) * 1000.0)
+        self._last_flip = now
+        self.frames += 1
+
+    # ══════════════════════════════════════════════════════════
+    #   REPORT
+    # ══════════════════════════════════════════════════════════
+
+    def report(self):
+        """
+        Returns:
+            str: Human-readable report
+        """
+        target_ms = self.target * 1000.0
+        lines = ["═══ INPUT LATENCY ═══",
+                 f"frames {self.frames}  |  {time.perf_counter() - self._started:.1f} s  |  "
+                 f"target {target_ms:.2f} ms/frame"]
+
+        if not self.latency:
+            lines.append("(chua co click / phim nao)")
+        for (state, kind), values in sorted(self.latency.items(), key=lambda kv: (str(kv[0][0]), kv[0][1])):
+            ordered = sorted(values)
+            waits = sorted(self.queue_wait.get((state, kind), ()))
+            lines.append("")
+            lines.append(f"{state} / {kind}: n={len(ordered)}  p50 {_percentile(ordered, 0.5):.1f} ms  "
+                         f"p95 {_percentile(ordered, 0.95):.1f} ms  max {ordered[-1]:.1f} ms")
+            if waits:
+                lines.append(f"    + up to {_percentile(waits, 0.5):.1f} ms (p50) / "
+                             f"{_percentile(waits, 0.95):.1f} ms (p95) waiting in the queue before the poll")
+            lines.extend(histogram_lines(ordered))
+
+        lines.append("")
+        lines.append("═══ FRAME PACING ═══")
+        for state, values in self.intervals.items():
+            ordered = sorted(values)
+            jitter = sorted(abs(v - target_ms) for v in values)
+            late = sum(1 for v in values if v > target_ms * 1.5)
+            lines.append("")
+            lines.append(f"{state}: n={len(ordered)}  mean {sum(ordered) / len(ordered):.2f} ms  "
+                         f"jitter p50 {_percentile(jitter, 0.5):.2f} / p95 {_percentile(jitter, 0.95):.2f} ms  "
+                         f"missed {late} ({late * 100.0 / len(ordered):.1f}%)")
+            stages = self.stage_ms.get(state, {})
+            lines.append("    " + "  ".join(
+                f"{stage} {sum(stages[stage]) / len(stages[stage]):.2f} ms"
+                for stage in STAGES if stages.get(stage)))
+            lines.extend(histogram_lines(ordered))
+
+        return "\n".join(lines) + "\n"
+
+    def close(self):
+        """Write the report"""
+        text = self.report()
+        try:
+            folder = os.path.dirname(self.report_path)
+            if folder:
+                os.makedirs(folder, exist_ok=True)
+            with open(self.report_path, 'w', encoding='utf-8') as f:
+                f.write(text)
+            print(f"Da ghi bao cao do tre: {self.report_path}")
+        except OSError as e:
+            print(f"Khong ghi duoc bao cao do tre: {e}")
+            print(text)
+        return text
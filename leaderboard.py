@@ -0,0 +1,168 @@
+"""
+═══════════════════════════════════════════════════════════════════
+LEADERBOARD STORE
+═══════════════════════════════════════════════════════════════════
+Keeps every finished game in an SQLite table (data/rankings.db)
+instead of a top-10 JSON file.
+
+- One INSERT per game (no full rewrites)
+- B-tree indexes on score, player name and date: top-K and player
+  history walk the index and stop after the rows they return; a
+  rank is one COUNT over the score index
+- The row count is cached (page flips don't re-count the table)
+- Paged reads for the ranking screen (LIMIT / OFFSET: a page still
+  steps over the rows before it, fine for a few hundred pages)
+- Imports the legacy data/rankings.json once (PRAGMA user_version
+  records it, so a reset board stays empty after a restart)
+═══════════════════════════════════════════════════════════════════
+"""
+
+import json
+import os
+import sqlite3
+
+
+class LeaderboardStore:
+    """
+    Indexed, append-only store of game results
+    """
+
+    SCHEMA_VERSION = 1  # user_version once the legacy JSON was imported
+    COLUMNS = ('name', 'score', 'won', 'monsters_killed', 'date')
+
+    def __init__(self, path='data/rankings.db', legacy_json='data/rankings.json'):
+        """
+        Args:
+            path: SQLite file, or ':memory:' for a throwaway store
+            legacy_json: Old top-10 rankings file imported once
+        """
+        self.path = path
+        if path != ':memory:':
+            folder = os.path.dirname(path)
+            if folder:
+                os.makedirs(folder, exist_ok=True)
+
+        self._count = None  # cached COUNT(*), dropped by add / reset
+        self.db = sqlite3.connect(path)
+        self.db.row_factory = sqlite3.Row
+        if path != ':memory:':
+            self.db.execute("PRAGMA journal_mode=WAL")
+            self.db.execute("PRAGMA synchronous=NORMAL")
+
+        self.db.executescript("""
+            CREATE TABLE IF NOT EXISTS rankings (
+                id INTEGER PRIMARY KEY,
+                name TEXT NOT NULL,
+                score INTEGER NOT NULL,
+                won INTEGER NOT NULL,
+                monsters_killed INTEGER NOT NULL DEFAULT 0,
+                date TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_rankings_score ON rankings(score DESC, id);
+            CREATE INDEX IF NOT EXISTS idx_rankings_name ON rankings(name, date);
+            CREATE INDEX IF NOT EXISTS idx_rankings_date ON rankings(date);
+        """)
+        self.db.commit()
+
+        if self.db.execute("PRAGMA user_version").fetchone()[0] < self.SCHEMA_VERSION:
+            if legacy_json and self.count() == 0:
+                self._import_legacy(legacy_json)
+            self.db.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
+            self.db.commit()
+
+    def _import_legacy(self, legacy_json):
+        try:
+            if os.path.exists(legacy_json):
+                with open(legacy_json, 'r', encoding='utf-8') as f:
+                    rows = json.load(f)
+                for row in rows:
+                    self.add(row, commit=False)
+                self.db.commit()
+        except Exception as e:
+            print(f"Khong doc duoc {legacy_json}: {e}")
+
+    @staticmethod
+    def _to_dict(row):
+        return {
+            'name': row['name'],
+            'score': row['score'],
+            'won': bool(row['won']),
+            'monsters_killed': row['monsters_killed'],
+            'date': row['date']
+        }
+
+    # ══════════════════════════════════════════════════════════
+    #   WRITES
+    # ══════════════════════════════════════════════════════════
+
+    def add(self, entry, commit=True):
+        """
+        Append one result
+
+        Args:
+            entry: dict with name, score, won, monsters_killed, date
+            commit: False to batch several inserts in one transaction
+        """
+        self.db.execute(
+            "INSERT INTO rankings (name, score, won, monsters_killed, date) VALUES (?, ?, ?, ?, ?)",
+            (entry['name'], int(entry['score']), int(bool(entry['won'])),
+             int(entry.get('monsters_killed', 0)), entry['date'])
+        )
+        self._count = None
+        if commit:
+            self.db.commit()
+
+    def reset(self):
+        """Delete all results"""
+        self.db.execute("DELETE FROM rankings")
+        self.db.commit()
+        self._count = None
+
+    # ══════════════════════════════════════════════════════════
+    #   QUERIES
+    # ══════════════════════════════════════════════════════════
+
+    def count(self):
+        """Number of stored results (cached until the next add / reset)"""
+        if self._count is None:
+            self._count = self.db.execute("SELECT COUNT(*) FROM rankings").fetchone()[0]
+        return self._count
+
+    def page(self, page, per_page):
+        """
+        Results ordered by score (highest first)
+
+        Args:
+            page: 0-based page number
+            per_page: Rows per page
+
+        Returns:
+            list: Ranking dicts for that page only
+        """
+        rows = self.db.execute(
+            "SELECT * FROM rankings ORDER BY score DESC, id LIMIT ? OFFSET ?",
+            (per_page, page * per_page)
+        ).fetchall()
+        return [self._to_dict(r) for r in rows]
+
+    def top(self, k=10):
+        """Top-k results"""
+        return self.page(0, k)
+
+    def player_history(self, name, limit=50):
+        """Most recent results of one player"""
+        rows = self.db.execute(
+            "SELECT * FROM rankings WHERE name = ? ORDER BY date DESC LIMIT ?",
+            (name, limit)
+        ).fetchall()
+        return [self._to_dict(r) for r in rows]
+
+    def rank_of(self, score):
+        """1-based rank a score would have (ties share the best rank)"""
+        higher = self.db.execute(
+            "SELECT COUNT(*) FROM rankings WHERE score > ?", (int(score),)
+        ).fetchone()[0]
+        return higher + 1
+
+    def close(self):
+        self.db.close()
@@ -1,38 +1,206 @@
 import pygame
 import sys
+import os
+import argparse
 from game import Game
+from render_scaler import RenderScaler
+
+# Idle mode (static screens): redraw on input, else at least every IDLE_TIMEOUT_MS (caret blink)
+IDLE_TIMEOUT_MS = 500
+MAX_IDLE_DT = 1 / 30
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Monster Quiz Shooter")
+    parser.add_argument('--record', metavar='FILE',
+                        help="Ghi lai phien choi (input, dt, seed) vao FILE")
+    parser.add_argument('--replay', metavar='FILE',
+                        help="Chay lai FILE khong can cua so, toc do toi da")
+    parser.add_argument('--no-draw', action='store_true',
+                        help="Khi replay: chi chay logic, bo qua draw")
+    parser.add_argument('--display', metavar='WxH',
+                        help="Kich thuoc cua so, vd 1920x1080 (mac dinh 1280x720)")
+    parser.add_argument('--fullscreen', action='store_true',
+                        help="Toan man hinh o do phan giai man hinh")
+    parser.add_argument('--fast-scale', action='store_true',
+                        help="Phong to kieu nearest-neighbour thay vi smoothscale")
+    parser.add_argument('--class-id', default='', metavar='LOP',
+                        help="Ma lop ghi kem moi cau tra loi (data/analytics.db)")
+    parser.add_argument('--memprofile', nargs='?', const='data/memprofile.txt', metavar='FILE',
+                        help="Dem Surface moi frame + tracemalloc theo trang thai, ghi bao cao ra FILE")
+    parser.add_argument('--latency', nargs='?', const='data/latency.txt', metavar='FILE',
+                        help="Do do tre click/phim -> flip va do deu frame, ghi histogram ra FILE")
+    parser.add_argument('--trace', action='store_true',
+                        help="Bat tracing tu dau (F9: bat / tat + xuat data/trace-*.json)")
+    parser.add_argument('--no-idle', action='store_true',
+                        help="Luon ve 60 FPS, ke ca o menu / bang xep hang")
+    parser.add_argument('--no-resume', action='store_true',
+                        help="Khong luu / khoi phuc van choi dang do (data/session.snap)")
+    parser.add_argument('--server', metavar='HOST:PORT',
+                        help="Choi tren session server (session_server.py): cau hoi va cham diem o server")
+    parser.add_argument('--renderer', choices=('software', 'sdl2', 'sdl2-software'), default='software',
+                        help="sdl2: ghep cac lop bang SDL Renderer/Texture")
+    args = parser.parse_args()
+    if args.display:
+        try:
+            args.display = tuple(int(v) for v in args.display.lower().split('x'))
+        except ValueError:
+            parser.error("--display phai co dang WxH, vd 1920x1080")
+    return args
+
+def replay(path, draw=True):
+    from replay import SessionReplay
+    
+    # Headless: không cần cửa sổ thật
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    pygame.init()
+    screen = pygame.display.set_mode((1280, 720))
+    
+    session = SessionReplay(path)
+    game = Game(screen, analytics=False, persist=False)
+    stats = session.run(game, draw=draw)
+    
+    print(f"Replay {path}: {stats['frames']} frames")
+    if stats['frames']:
+        print(f"  total {stats['total_ms']:.1f} ms | mean {stats['mean_ms']:.2f} ms | "
+              f"p99 {stats['p99_ms']:.2f} ms | max {stats['max_ms']:.2f} ms")
+        print(f"  final state {stats['final_state']} | score {stats['final_score']}")
+    pygame.quit()
 
 def main():
+    args = parse_args()
+    if args.replay:
+        replay(args.replay, draw=not args.no_draw)
+        sys.exit()
+    
     pygame.init()
     
-    # Cấu hình màn hình
+    # Cấu hình màn hình: game luôn vẽ ở 1280x720, scaler phóng ra cửa sổ
     SCREEN_WIDTH = 1280
     SCREEN_HEIGHT = 720
     
-    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-    pygame.display.set_caption("Monster Quiz Shooter")
+    scaler = None
+    if args.renderer.startswith('sdl2'):
+        try:
+            from sdl2_backend import Sdl2Backend
+            scaler = Sdl2Backend((SCREEN_WIDTH, SCREEN_HEIGHT),
+                                 software=args.renderer == 'sdl2-software')
+        except Exception as e:
+            print(f"Khong mo duoc SDL2 renderer, dung software: {e}")
+    if scaler is None:
+        scaler = RenderScaler((SCREEN_WIDTH, SCREEN_HEIGHT), args.display,
+                              smooth=not args.fast_scale, fullscreen=args.fullscreen)
+    screen = scaler.open("Monster Quiz Shooter")
+    scaler.install_mouse_mapping()
+    
+    client = None
+    if args.server:
+        from session_server import SessionClient
+        host, _, port = args.server.rpartition(':')
+        try:
+            client = SessionClient(host or '127.0.0.1', int(port))
+        except (OSError, ValueError) as e:
+            print(f"Khong ket noi duoc session server {args.server}, choi offline: {e}")
     
     clock = pygame.time.Clock()
-    game = Game(screen)
+    game = Game(screen, class_id=args.class_id, server=client)
+    if hasattr(scaler, 'queue_layer'):
+        game.set_compositor(scaler)
+    
+    profiler = None
+    if args.memprofile:
+        from mem_profiler import MemProfiler
+        profiler = MemProfiler(args.memprofile)
+        profiler.start()
+    
+    # Built in, free while off: F9 starts it / stops and exports
+    from tracing import Tracer
+    tracer = Tracer()
+    if args.trace:
+        tracer.enable()
+    
+    probe = None
+    if args.latency:
+        from latency_probe import LatencyProbe
+        probe = LatencyProbe(args.latency, target_fps=60)
+    
+    recorder = None
+    if args.record and client is None:
+        from replay import SessionRecorder
+        recorder = SessionRecorder(args.record, game)
+    
+    # Save / resume in-progress games (not while recording: the replay starts from MENU;
+    # not networked: the run lives on the server)
+    autosaver = None
+    if not args.no_resume and recorder is None and client is None:
+        import session_snapshot
+        session_snapshot.resume(game)
+        autosaver = session_snapshot.Autosaver()
     
     # Hide mouse cursor in game
     
     running = True
     while running:
+        # Static screen: sleep until input or the idle timeout instead of spinning a core
+        woke = None
+        idle = not args.no_idle and not game.is_animating()
+        if idle:
+            woke = pygame.event.wait(IDLE_TIMEOUT_MS)
         dt = clock.tick(60) / 1000.0  # Delta time in seconds
+        if idle:
+            dt = min(dt, MAX_IDLE_DT)  # time spent blocked is not simulation time
+        
+        if recorder:
+            recorder.begin_frame()
+        raw_events = pygame.event.get()
+        if woke is not None and woke.type != pygame.NOEVENT:
+            raw_events.insert(0, woke)
+        events = [scaler.map_event(e) for e in raw_events]
+        if probe:
+            probe.on_events(events, game.state)
+        if recorder:
+            recorder.record_frame(dt, events)
         
-        for event in pygame.event.get():
+        for event in events:
             if event.type == pygame.QUIT:
                 running = False
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_F9:
+                tracer.toggle()
+                continue
             game.handle_event(event)
+        if probe:
+            probe.mark('handle')
         
         game.update(dt)
+        if probe:
+            probe.mark('update')
         game.draw()
+        if probe:
+            probe.mark('draw')
         
-        pygame.display.flip()
+        scaler.present()
+        if probe:
+            probe.presented()
+        if profiler:
+            profiler.end_frame(game)
+        if autosaver:
+            autosaver.tick(game, dt)
     
+    if autosaver:
+        autosaver.close(game)
+    if recorder:
+        recorder.close()
+    if game.analytics is not None:
+        game.analytics.close()
+    if profiler:
+        profiler.close()
+    if probe:
+        probe.close()
+    tracer.close()
+    if client is not None:
+        client.close()
+    scaler.uninstall_mouse_mapping()
     pygame.quit()
     sys.exit()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
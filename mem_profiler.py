@@ -0,0 +1,220 @@
+"""
+═══════════════════════════════════════════════════════════════════
+MEMORY / ALLOCATION PROFILER (diagnostic mode)
+═══════════════════════════════════════════════════════════════════
+python main.py --memprofile [FILE]
+
+- Counts pygame.Surface constructions per frame, attributed to the
+  calling function in the draw modules (WATCHED_FILES)
+- tracemalloc snapshot on every Game.state transition, diffed
+  against the previous one -> top allocators per transition
+- Snapshot each time a game starts: growth between the first and
+  the latest game points at leaks across repeated games (only those
+  two snapshots are kept, so the profiler does not grow per game)
+- Report written on exit (default data/memprofile.txt)
+
+Costs a lot of CPU (tracemalloc + frame walks): never on by default.
+═══════════════════════════════════════════════════════════════════
+"""
+
+import collections
+import fnmatch
+import os
+import re
+import sys
+import time
+import tracemalloc
+
+import pygame
+
+
+WATCHED_FILES = ('ui.py', 'monster.py', 'robot_display.py', 'weapon_controller.py',
+                 'camera_system.py', 'game.py', 'muzzle_flash.py', 'fps_renderer.py')
+
+
+def _caller(watched=WATCHED_FILES):
+    """(file, function) of the nearest watched frame up the stack"""
+    frame = sys._getframe(2)
+    while frame is not None:
+        name = os.path.basename(frame.f_code.co_filename)
+        if name in watched:
+            return f"{name}:{frame.f_code.co_name}"
+        frame = frame.f_back
+    return "<other>"
+
+
+class MemProfiler:
+    """
+    Surface construction counter + tracemalloc snapshots per game state
+    """
+
+    def __init__(self, report_path='data/memprofile.txt', top=15, frames=10):
+        """
+        Args:
+            report_path: Text report written by close()
+            top: Allocators listed per section
+            frames: Traceback depth kept by tracemalloc
+        """
+        self.report_path = report_path
+        self.top = top
+        self.frames = frames
+
+        self.surface_calls = collections.Counter()  # caller -> constructions (whole run)
+        self.state_surfaces = collections.defaultdict(collections.Counter)  # state -> caller -> count
+        self.state_frames = collections.Counter()
+        self.peak_frame = (0, None, None)  # (surfaces, state, frame index)
+        self._frame_callers = collections.Counter()
+        self._frame_index = 0
+
+        self.transitions = []  # (from, to, frame, [StatisticDiff])
+        self.game_traced = []  # (game number, traced bytes at its start)
+        self._first_game = None  # Snapshot at the start of game 1
+        self._latest_game = None  # Snapshot at the start of the latest game (replaced)
+        self._last_state = None
+        self._last_snapshot = None
+        self._orig_surface = None
+        self._started = None
+
+    # ══════════════════════════════════════════════════════════
+    #   INSTALL
+    # ══════════════════════════════════════════════════════════
+
+    def start(self):
+        """Start tracemalloc and count Surface constructions"""
+        tracemalloc.start(self.frames)
+        self._started = time.perf_counter()
+        self._orig_surface = pygame.Surface
+        profiler = self
+
+        class CountingSurface(self._orig_surface):
+            def __init__(self, *args, **kwargs):
+                profiler._frame_callers[_caller()] += 1
+                super().__init__(*args, **kwargs)
+
+        pygame.Surface = CountingSurface
+
+    def stop(self):
+        if self._orig_surface is not None:
+            pygame.Surface = self._orig_surface
+            self._orig_surface = None
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+    def _snapshot(self):
+        # Leave out the profiler's own bookkeeping (tracemalloc filters compile fnmatch regexes)
+        return tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, fnmatch.__file__),
+            tracemalloc.Filter(False, os.path.join(os.path.dirname(re.__file__), '*')),
+            tracemalloc.Filter(False, __file__),
+        ))
+
+    # ══════════════════════════════════════════════════════════
+    #   PER FRAME
+    # ══════════════════════════════════════════════════════════
+
+    def end_frame(self, game):
+        """
+        Call once per frame after game.update()/draw()
+
+        Args:
+            game: Game instance (its state drives the snapshots)
+        """
+        state = game.state
+        self.state_frames[state] += 1
+        frame_total = sum(self._frame_callers.values())
+        if frame_total > self.peak_frame[0]:
+            self.peak_frame = (frame_total, state, self._frame_index)
+        if frame_total:
+            self.surface_calls.update(self._frame_callers)
+            self.state_surfaces[state].update(self._frame_callers)
+            self._frame_callers.clear()
+        self._frame_index += 1
+
+        if state == self._last_state:
+            return
+
+        snapshot = self._snapshot()
+        if self._last_snapshot is not None:
+            diff = snapshot.compare_to(self._last_snapshot, 'lineno')
+            self.transitions.append((self._last_state, state, self._frame_index, diff[:self.top]))
+        if state == "GAME":
+            self.game_traced.append((len(self.game_traced) + 1, tracemalloc.get_traced_memory()[0]))
+            if self._first_game is None:
+                self._first_game = snapshot
+            else:
+                self._latest_game = snapshot
+        self._last_snapshot = snapshot
+        self._last_state = state
+
+    # ══════════════════════════════════════════════════════════
+    #   REPORT
+    # ══════════════════════════════════════════════════════════
+
+    def report(self):
+        """
+        Returns:
+            str: Human-readable report
+        """
+        lines = []
+        elapsed = time.perf_counter() - self._started if self._started else 0.0
+        current, peak = tracemalloc.get_traced_memory() if tracemalloc.is_tracing() else (0, 0)
+        lines.append("═══ MEMORY PROFILE ═══")
+        lines.append(f"frames {self._frame_index}  |  {elapsed:.1f} s  |  "
+                     f"traced {current / 1e6:.2f} MB (peak {peak / 1e6:.2f} MB)")
+
+        lines.append("")
+        lines.append("═══ pygame.Surface constructions (whole run) ═══")
+        for caller, count in self.surface_calls.most_common(self.top):
+            lines.append(f"{count:>10}  {caller}")
+        count, state, index = self.peak_frame
+        lines.append(f"worst frame: {count} surfaces (frame {index}, state {state})")
+
+        lines.append("")
+        lines.append("═══ Surfaces per frame by state ═══")
+        for state, callers in self.state_surfaces.items():
+            frames = max(1, self.state_frames[state])
+            total = sum(callers.values())
+            lines.append(f"{str(state):>12}: {total / frames:8.2f} / frame over {frames} frames")
+            for caller, n in callers.most_common(5):
+                lines.append(f"{'':>14}{n / frames:8.2f}  {caller}")
+
+        lines.append("")
+        lines.append("═══ Top allocators per state transition ═══")
+        for old, new, index, diff in self.transitions:
+            lines.append(f"{old} -> {new} (frame {index})")
+            for stat in diff:
+                if stat.size_diff:
+                    lines.append(f"    {stat.size_diff / 1024:+10.1f} KiB {stat.count_diff:+7}  "
+                                 f"{stat.traceback[0]}")
+
+        lines.append("")
+        lines.append("═══ Growth across games ═══")
+        if self._latest_game is None:
+            lines.append("(can it nhat 2 van choi de so sanh)")
+        else:
+            for number, traced in self.game_traced:
+                lines.append(f"game {number:>3}: {traced / 1e6:8.2f} MB at start")
+            lines.append(f"top growth game 1 -> game {self.game_traced[-1][0]}:")
+            for stat in self._latest_game.compare_to(self._first_game, 'lineno')[:self.top]:
+                if stat.size_diff > 0:
+                    lines.append(f"    {stat.size_diff / 1024:+10.1f} KiB {stat.count_diff:+7}  "
+                                 f"{stat.traceback[0]}")
+
+        return "\n".join(lines) + "\n"
+
+    def close(self):
+        """Write the report and restore pygame.Surface"""
+        text = self.report()
+        self.stop()
+        try:
+            folder = os.path.dirname(self.report_path)
+            if folder:
+                os.makedirs(folder, exist_ok=True)
+            with open(self.report_path, 'w', encoding='utf-8') as f:
+                f.write(text)
+            print(f"Da ghi bao cao bo nho: {self.report_path}")
+        except OSError as e:
+            print(f"Khong ghi duoc bao cao bo nho: {e}")
+            print(text)
+        return text
@@ -0,0 +1,178 @@
+"""
+═══════════════════════════════════════════════════════════════════
+MUZZLE FLASH SPRITE BANK
+═══════════════════════════════════════════════════════════════════
+Flash, glow, ray and smoke sprites pre-rendered once at quantized
+intensities (STEPS levels) instead of allocating alpha surfaces on
+every frame of a shot.
+
+- weapon_layers(): core + 3 glow discs (WeaponController)
+- doom_discs() / doom_burst() / smoke_puff(): first-person gun
+  flash drawn by UI.draw_gun_doom
+- screen_glow(): screen-space additive glow as one BLEND_RGB_ADD fill
+
+One bank is shared by every user (shared_bank()); prewarm() renders
+all levels up front so the first shot does not pay for it.
+═══════════════════════════════════════════════════════════════════
+"""
+
+import math
+import random
+
+import pygame
+
+
+STEPS = 16
+BURST_VARIANTS = 6
+BURST_RAYS = 18
+BURST_SIZE = 220
+PUFF_COUNT = 4
+
+
+def _disc(radius, rgba):
+    """(surface, offset) of a translucent disc centred on the anchor point"""
+    surf = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+    pygame.draw.circle(surf, rgba, (radius, radius), radius)
+    return surf, (-radius, -radius)
+
+
+def screen_glow(screen, color, alpha):
+    """
+    Additive full-screen glow (color scaled by alpha/255) in one fill
+
+    Args:
+        screen: Target surface
+        color: Glow RGB
+        alpha: Strength 0-255
+    """
+    if alpha <= 0:
+        return
+    screen.fill(tuple(c * alpha // 255 for c in color), special_flags=pygame.BLEND_RGB_ADD)
+
+
+class MuzzleFlashBank:
+    """
+    Pre-rendered flash sprites indexed by quantized intensity
+    """
+
+    def __init__(self, steps=STEPS, seed=7):
+        """
+        Args:
+            steps: Number of intensity levels
+            seed: Seed for the baked star-burst jitter
+        """
+        self.steps = steps
+        self.seed = seed
+        self._weapon = {}
+        self._discs = {}
+        self._puffs = {}
+        self._bursts = None
+
+    def level(self, intensity):
+        """Quantize 0.0 - 1.0 to 0 - steps (0 = nothing to draw)"""
+        if intensity <= 0:
+            return 0
+        return min(self.steps, math.ceil(intensity * self.steps))
+
+    def prewarm(self):
+        """Render every level now (called while loading assets)"""
+        for level in range(1, self.steps + 1):
+            intensity = level / self.steps
+            self.weapon_layers(intensity)
+            self.doom_discs(intensity)
+            for i in range(PUFF_COUNT):
+                self.smoke_puff(i, intensity)
+        self.doom_burst()
+
+    # ══════════════════════════════════════════════════════════
+    #   WEAPON CONTROLLER FLASH
+    # ══════════════════════════════════════════════════════════
+
+    def weapon_layers(self, intensity):
+        """
+        Core + outer glow discs, drawn in order
+
+        Returns:
+            list: [(surface, (dx, dy)), ...] relative to the flash point
+        """
+        level = self.level(intensity)
+        layers = self._weapon.get(level)
+        if layers is None:
+            i = level / self.steps
+            layers = []
+            core_size = int(25 * i)
+            if core_size > 0:
+                layers.append(_disc(core_size, (255, 255, 235, int(255 * i))))
+            for k in range(3):
+                glow_size = int((40 + k * 20) * i)
+                if glow_size > 0:
+                    layers.append(_disc(glow_size, (255, 230, 180, int((120 - k * 40) * i))))
+            self._weapon[level] = layers
+        return layers
+
+    # ══════════════════════════════════════════════════════════
+    #   FIRST-PERSON GUN FLASH (UI)
+    # ══════════════════════════════════════════════════════════
+
+    def doom_discs(self, intensity):
+        """Large expanding flash core, outer disc first"""
+        level = self.level(intensity)
+        layers = self._discs.get(level)
+        if layers is None:
+            i = level / self.steps
+            layers = []
+            for radius in range(75, 18, -13):
+                alpha = int(i * 255 * (radius / 75))
+                color = (255, 238, 125) if radius > 42 else (255, 198, 85)
+                layers.append(_disc(radius, (*color, alpha)))
+            self._discs[level] = layers
+        return layers
+
+    def doom_burst(self, rng=random):
+        """
+        One of BURST_VARIANTS pre-jittered star bursts (full alpha)
+
+        Returns:
+            tuple: (surface, (dx, dy)); scale with surface.set_alpha()
+        """
+        if self._bursts is None:
+            bake_rng = random.Random(self.seed)
+            self._bursts = [self._render_burst(bake_rng) for _ in range(BURST_VARIANTS)]
+        return rng.choice(self._bursts)
+
+    def _render_burst(self, rng):
+        surf = pygame.Surface((BURST_SIZE, BURST_SIZE), pygame.SRCALPHA)
+        centre = BURST_SIZE // 2
+        for ray_i in range(BURST_RAYS):
+            angle = (ray_i / BURST_RAYS) * 2 * math.pi + rng.uniform(-0.18, 0.18)
+            length = rng.randint(55, 100)
+            width = rng.randint(4, 8)
+
+            ray_surf = pygame.Surface((6, length), pygame.SRCALPHA)
+            pygame.draw.line(ray_surf, (255, 238, 155, 255), (3, 0), (3, length), width)
+            ray_surf = pygame.transform.rotate(ray_surf, -math.degrees(angle) - 90)
+            surf.blit(ray_surf, (centre - ray_surf.get_width() // 2,
+                                 centre - ray_surf.get_height() // 2))
+        return surf, (-centre, -centre)
+
+    def smoke_puff(self, index, intensity):
+        """Smoke puff disc number index (0 - 3) at the given opacity"""
+        level = self.level(intensity)
+        key = (index, level)
+        puff = self._puffs.get(key)
+        if puff is None:
+            size = 17 + index * 9
+            puff = _disc(size, (95, 95, 95, int(level / self.steps * 85)))
+            self._puffs[key] = puff
+        return puff
+
+
+_BANK = None
+
+
+def shared_bank():
+    """The process-wide bank used by UI and WeaponController"""
+    global _BANK
+    if _BANK is None:
+        _BANK = MuzzleFlashBank()
+    return _BANK
@@ -0,0 +1,99 @@
+"""
+═══════════════════════════════════════════════════════════════════
+SMOOTH NOISE TABLES
+═══════════════════════════════════════════════════════════════════
+Precomputed 1D value noise, sampled by time:
+
+- values[i]: scalar lattice in [-1, 1]
+- vectors[i]: 2D lattice (random direction, length 0.7-1.0: the
+  distribution the per-frame random.uniform shake used)
+- sample(x) / sample2(x): smoothstep interpolation between lattice
+  points, no trig and no RNG per sample; wraps every `size` points
+
+One table (fixed seed) is shared by camera shake and weapon sway;
+callers pick a seeded offset into it, so a recorded seed replays the
+same motion.
+═══════════════════════════════════════════════════════════════════
+"""
+
+import math
+import random
+
+
+TABLE_SIZE = 256  # Power of two (index wrap is a mask)
+TABLE_SEED = 0x5EED
+
+
+class NoiseTable:
+    """
+    Lattice of scalar and 2D values + smooth interpolation
+    """
+
+    def __init__(self, seed=TABLE_SEED, size=TABLE_SIZE):
+        """
+        Args:
+            seed: Table contents seed
+            size: Lattice points (power of two)
+        """
+        rng = random.Random(seed)
+        self.size = size
+        self.mask = size - 1
+        self.values = [rng.uniform(-1.0, 1.0) for _ in range(size)]
+        self.vectors = []
+        for _ in range(size):
+            angle = rng.uniform(0, math.pi * 2)
+            length = rng.uniform(0.7, 1.0)
+            self.vectors.append((math.cos(angle) * length, math.sin(angle) * length))
+
+    def _locate(self, x):
+        i = math.floor(x)
+        f = x - i
+        return i & self.mask, (i + 1) & self.mask, f * f * (3.0 - 2.0 * f)
+
+    def sample(self, x):
+        """
+        Args:
+            x: Position in lattice units (time * frequency + offset)
+
+        Returns:
+            float: Smooth noise in [-1, 1]
+        """
+        i, j, f = self._locate(x)
+        a = self.values[i]
+        return a + (self.values[j] - a) * f
+
+    def sample2(self, x):
+        """
+        Returns:
+            tuple: Smooth 2D noise (x, y), length <= 1
+        """
+        i, j, f = self._locate(x)
+        ax, ay = self.vectors[i]
+        bx, by = self.vectors[j]
+        return (ax + (bx - ax) * f, ay + (by - ay) * f)
+
+    def offset(self, seed):
+        """
+        Lattice offset for a seed (distinct seeds read distinct stretches)
+
+        Returns:
+            float: in [0, size); fractional, so seeds aren't limited to
+            `size` starting points (sampling wraps at size either way)
+        """
+        # splitmix64 finalizer: nearby seeds land far apart
+        h = (seed * 0x9E3779B97F4A7C15) & 0xFFFFFFFFFFFFFFFF
+        h = ((h ^ (h >> 30)) * 0xBF58476D1CE4E5B9) & 0xFFFFFFFFFFFFFFFF
+        h = ((h ^ (h >> 27)) * 0x94D049BB133111EB) & 0xFFFFFFFFFFFFFFFF
+        h ^= h >> 31
+        return h / 2.0 ** 64 * self.size
+
+
+_shared = None
+
+
+def shared_table():
+    """Process-wide table used by CameraSystem and WeaponController"""
+    global _shared
+    if _shared is None:
+        _shared = NoiseTable()
+    return _shared
@@ -0,0 +1,220 @@
+"""
+═══════════════════════════════════════════════════════════════════
+QUESTION SEARCH INDEX
+═══════════════════════════════════════════════════════════════════
+Token inverted index over every loaded question (question text,
+context and answers), for the in-game search in the file manager.
+
+- Vietnamese accent folding: "Đường thẳng" -> "duong thang", so a
+  query typed without diacritics still matches
+- AND of all query tokens; the last token also matches as a prefix
+  (results update while typing)
+- Filters by level, type and file are set intersections
+- A prefix covering many tokens is not merged when the other terms
+  leave few hits: those hits' tokens are checked instead; 1-2 letter
+  prefixes are merged at most once until the index changes
+- Maintained incrementally: add_file() on upload, remove_file() on
+  delete (no rebuild of the other files)
+═══════════════════════════════════════════════════════════════════
+"""
+
+import bisect
+import functools
+import heapq
+import re
+import time
+import unicodedata
+
+
+TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+SHORT_PREFIX = 2  # Merged postings of prefixes this short are cached
+TOKEN_CHECK_RATIO = 4  # Check hits' tokens when hits <= this * tokens under the prefix
+
+
+def fold(text):
+    """Lowercase, strip Vietnamese diacritics (đ -> d)"""
+    text = unicodedata.normalize('NFD', str(text).lower())
+    text = ''.join(c for c in text if unicodedata.category(c) != 'Mn')
+    return text.replace('đ', 'd')
+
+
+@functools.lru_cache(maxsize=65536)
+def _fold_token(token):
+    return fold(token)
+
+
+def tokenize(text):
+    """Folded word tokens (each distinct raw word is folded once, then cached)"""
+    return [_fold_token(t) for t in TOKEN_RE.findall(str(text).lower())]
+
+
+def _question_text(question):
+    parts = [question.get('question', ''), question.get('context', ''),
+             question.get('correct_answer', '')]
+    for answer in question.get('answers', []):
+        parts.append(answer['text'] if isinstance(answer, dict) else answer)
+    return ' '.join(str(p) for p in parts if p)
+
+
+class QuestionIndex:
+    """
+    token -> set(doc id), plus level / type / file facets
+    """
+
+    def __init__(self):
+        self.postings = {}
+        self.docs = {}  # doc id -> (question, file name)
+        self.by_level = {}
+        self.by_type = {}
+        self.by_file = {}  # file key -> set(doc id)
+        self.file_names = {}  # file key -> display name
+        self._doc_tokens = {}
+        self._next_id = 0
+        self._vocab = None  # sorted tokens for prefix lookups, rebuilt lazily
+        self._short_prefixes = {}  # short prefix -> merged postings (until the next add / remove)
+        self._all_ids = None  # every doc id in order (unfiltered pages), rebuilt lazily
+
+    def __len__(self):
+        return len(self.docs)
+
+    # ══════════════════════════════════════════════════════════
+    #   MAINTENANCE
+    # ══════════════════════════════════════════════════════════
+
+    def add_file(self, file_key, file_name, questions):
+        """
+        Index the questions of one uploaded file
+
+        Args:
+            file_key: Hashable identity of the file record
+            file_name: Name shown in results
+            questions: Question dicts of that file
+        """
+        ids = self.by_file.setdefault(file_key, set())
+        self.file_names[file_key] = file_name
+        self._short_prefixes.clear()
+        self._all_ids = None
+        for question in questions:
+            doc = self._next_id
+            self._next_id += 1
+            tokens = set(tokenize(_question_text(question)))
+            self.docs[doc] = (question, file_name)
+            self._doc_tokens[doc] = tokens
+            for token in tokens:
+                posting = self.postings.get(token)
+                if posting is None:
+                    self.postings[token] = {doc}
+                    self._vocab = None
+                else:
+                    posting.add(doc)
+            self.by_level.setdefault(question.get('level'), set()).add(doc)
+            self.by_type.setdefault(question.get('type', 'multiple_choice'), set()).add(doc)
+            ids.add(doc)
+
+    def remove_file(self, file_key):
+        """Drop every question of a file"""
+        self._short_prefixes.clear()
+        self._all_ids = None
+        for doc in self.by_file.pop(file_key, ()):
+            question, _ = self.docs.pop(doc)
+            for token in self._doc_tokens.pop(doc):
+                posting = self.postings[token]
+                posting.discard(doc)
+                if not posting:
+                    del self.postings[token]
+                    self._vocab = None
+            self.by_level.get(question.get('level'), set()).discard(doc)
+            self.by_type.get(question.get('type', 'multiple_choice'), set()).discard(doc)
+        self.file_names.pop(file_key, None)
+
+    # ══════════════════════════════════════════════════════════
+    #   SEARCH
+    # ══════════════════════════════════════════════════════════
+
+    def _prefix_docs(self, prefix):
+        if len(prefix) <= SHORT_PREFIX:
+            docs = self._short_prefixes.get(prefix)
+            if docs is None:
+                docs = self._short_prefixes[prefix] = self._merge_prefix(prefix)
+            return docs
+        return self._merge_prefix(prefix)
+
+    def _prefix_range(self, prefix):
+        """Slice of the sorted vocabulary starting with prefix"""
+        if self._vocab is None:
+            self._vocab = sorted(self.postings)
+        vocab = self._vocab
+        return bisect.bisect_left(vocab, prefix), bisect.bisect_left(vocab, prefix + '\U0010ffff')
+
+    def _merge_prefix(self, prefix):
+        lo, hi = self._prefix_range(prefix)
+        docs = set()
+        for token in self._vocab[lo:hi]:
+            docs |= self.postings[token]
+        return docs
+
+    def search(self, query='', level=None, q_type=None, file_key=None, page=0, per_page=5):
+        """
+        Args:
+            query: Free text (accents optional)
+            level / q_type / file_key: Facet filters, None = all
+            page: Page number (0-based)
+            per_page: Results per page
+
+        Returns:
+            dict: total, page, pages, elapsed_ms, results [(question, file name), ...]
+        """
+        start = time.perf_counter()
+        sets = []
+        tokens = tokenize(query)
+        prefix = None
+        if tokens and not query[-1:].isspace():
+            prefix = tokens.pop()
+        for token in tokens:
+            sets.append(self.postings.get(token, set()))
+        if level is not None:
+            sets.append(self.by_level.get(level, set()))
+        if q_type is not None:
+            sets.append(self.by_type.get(q_type, set()))
+        if file_key is not None:
+            sets.append(self.by_file.get(file_key, set()))
+        if prefix is not None and (not sets or prefix in self._short_prefixes):
+            sets.append(self._prefix_docs(prefix))
+            prefix = None
+
+        hits = None  # None = every doc
+        if sets:
+            sets.sort(key=len)
+            hits = set(sets[0])
+            for s in sets[1:]:
+                if not hits:
+                    break
+                hits &= s
+            if prefix is not None:
+                lo, hi = self._prefix_range(prefix)
+                if len(hits) <= (hi - lo) * TOKEN_CHECK_RATIO:
+                    # Fewer hits than tokens to merge: check the hits' tokens
+                    doc_tokens = self._doc_tokens
+                    hits = {doc for doc in hits
+                            if any(t.startswith(prefix) for t in doc_tokens[doc])}
+                else:
+                    hits &= self._prefix_docs(prefix)
+
+        total = len(self.docs) if hits is None else len(hits)
+        pages = max(1, (total + per_page - 1) // per_page)
+        page = max(0, min(page, pages - 1))
+        # Upload order; only the requested page is materialized
+        first = page * per_page
+        if hits is None:
+            if self._all_ids is None:
+                self._all_ids = list(self.docs)  # ids only grow, dict keeps that order
+            ordered = self._all_ids[first:first + per_page]
+        else:
+            ordered = heapq.nsmallest(first + per_page, hits)[first:]
+        return {
+            'total': total,
+            'page': page,
+            'pages': pages,
+            'elapsed_ms': (time.perf_counter() - start) * 1000.0,
+            'results': [self.docs[doc] for doc in ordered]
+        }
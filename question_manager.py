@@ -1,14 +1,52 @@
 import os
 import json
 import random
+import threading
 from datetime import datetime
+from weighted_sampler import FenwickSampler
+from question_index import QuestionIndex
+
+
+def miss_weight(attempts, wrong):
+    """Selection weight from a question's record: missed more often = drawn more (Laplace-smoothed)"""
+    return 0.25 + (wrong + 1) / (attempts + 2)
 
 class QuestionManager:
-    def __init__(self):
+    def __init__(self, persist=True, questions=None):
+        """
+        Args:
+            persist: False = never write data/ (replay, simulation)
+            questions: Shared read-only question list (session server):
+                       nothing is loaded from or written to data/
+        """
         self.questions = []
         self.uploaded_files = []
         self.used_questions = []
-        self.load_saved_data()
+        self.persist = persist and questions is None
+        self.rng = random.Random()
+        self.seed = None
+        
+        # Weighted selection (see weighted_sampler.py): one tree per level + one over all
+        self.adaptive = True  # False = uniform weights
+        self.results = {}  # question index -> [attempts, wrong] (this process)
+        self._samplers = None
+        self._sampler_key = None
+        self._used_idx = []
+        
+        # Search index for the file manager (see question_index.py), keyed by
+        # file_info['key'] (a counter stored in the file record)
+        self.index = QuestionIndex()
+        self._index_thread = None  # Startup build in progress (see rebuild_index)
+        self._next_file_key = 1
+        if questions is None:
+            self.load_saved_data()
+        else:
+            self.questions = questions
+    
+    def reseed(self, seed):
+        """Seed the question/answer shuffles (used by session recording/replay)"""
+        self.seed = seed
+        self.rng.seed(seed)
     
     def load_saved_data(self):
         """Load questions and file list from saved data"""
@@ -20,9 +58,79 @@ class QuestionManager:
                     self.uploaded_files = data.get('files', [])
         except:
             pass
+        self.rebuild_index()
+    
+    def rebuild_index(self, background=True):
+        """
+        Index every file's slice of self.questions (startup, or after the
+        question list was replaced)
+        
+        Args:
+            background: Build on a daemon thread (100k questions take
+                        seconds); index users wait for it (_wait_index)
+        """
+        self._wait_index()
+        taken = [f['key'] for f in self.uploaded_files if isinstance(f.get('key'), int)]
+        self._next_file_key = max(taken, default=0) + 1
+        if len(set(taken)) != len(taken):
+            for file_info in self.uploaded_files:
+                file_info.pop('key', None)  # duplicated records: renumber all
+            self._next_file_key = 1
+        files = [(self._file_key(f), f.get('name', ''), f.get('question_count', 0))
+                 for f in self.uploaded_files]
+        questions = self.questions
+        
+        def build():
+            index = QuestionIndex()
+            start = 0
+            for key, name, count in files:
+                index.add_file(key, name, questions[start:start + count])
+                start += count
+            self.index = index
+        
+        if background and files:
+            self._index_thread = threading.Thread(target=build, name="question-index", daemon=True)
+            self._index_thread.start()
+        else:
+            build()
+    
+    def _wait_index(self):
+        """Block until a background index build has been swapped in"""
+        if self._index_thread is not None:
+            self._index_thread.join()
+            self._index_thread = None
+    
+    def _file_key(self, file_info):
+        """Stable search-index key of a file record (assigned once, saved with it)"""
+        key = file_info.get('key')
+        if key is None:
+            key = file_info['key'] = self._next_file_key
+            self._next_file_key += 1
+        return key
+    
+    def search_questions(self, query='', level=None, q_type=None, file_index=None, page=0, per_page=5):
+        """
+        Search loaded questions (accent-insensitive)
+        
+        Args:
+            query: Free text
+            level / q_type: Filters, None = all
+            file_index: Index into uploaded_files, None = all files
+            page / per_page: Paging
+        
+        Returns:
+            dict: See QuestionIndex.search
+        """
+        self._wait_index()
+        file_key = None
+        if file_index is not None and 0 <= file_index < len(self.uploaded_files):
+            file_key = self._file_key(self.uploaded_files[file_index])
+        return self.index.search(query, level, q_type, file_key, page, per_page)
     
     def save_data(self):
         """Save questions and file list"""
+        if not self.persist:
+            return
         os.makedirs('data', exist_ok=True)
         with open('data/questions_data.json', 'w', encoding='utf-8') as f:
             json.dump({
@@ -48,8 +156,10 @@ class QuestionManager:
                 'upload_date': datetime.now().strftime("%Y-%m-%d %H:%M:%S")
             }
             
+            self._wait_index()  # the build thread slices self.questions
             self.uploaded_files.append(file_info)
             self.questions.extend(parsed)
+            self.index.add_file(self._file_key(file_info), file_info['name'], parsed)
             self.save_data()
             
             return len(parsed)
@@ -188,100 +298,242 @@ class QuestionManager:
         
         return questions
     
-    def get_random_question(self, level=None):
-        """Get a random question with shuffled answers"""
-        available = [q for q in self.questions if q not in self.used_questions]
+    # ══════════════════════════════════════════════════════════
+    #   WEIGHTED SELECTION
+    # ══════════════════════════════════════════════════════════
+    
+    def question_weight(self, index):
+        """
+        Selection weight of an unused question: questions missed more
+        often come up more (Laplace-smoothed miss rate), 1.0 if uniform
+        """
+        if not self.adaptive:
+            return 1.0
+        return miss_weight(*self.results.get(index, (0, 0)))
+    
+    def _ensure_samplers(self):
+        """(Re)build the trees when the question list was replaced or extended"""
+        key = (id(self.questions), len(self.questions))
+        if self._samplers is not None and self._sampler_key == key:
+            if not self.used_questions and self._used_idx:
+                # used_questions was cleared from outside (replay)
+                self.reset_used_questions()
+            return
+        
+        # Tree None holds every question at position == question index
+        members = {None: list(range(len(self.questions)))}
+        for i, q in enumerate(self.questions):
+            members.setdefault(q.get('level'), []).append(i)
+        
+        self._samplers = {}
+        self._positions = {}  # question index -> [(level key, position in that tree)]
+        for level, indices in members.items():
+            self._samplers[level] = (FenwickSampler(self.question_weight(i) for i in indices), indices)
+            for pos, i in enumerate(indices):
+                self._positions.setdefault(i, []).append((level, pos))
+        if self._sampler_key is None or self._sampler_key[0] != key[0]:
+            self.results = {}  # List replaced: indices now point at other questions
+        self._sampler_key = key
+        self._used_idx = []
+        self.used_questions = []
+    
+    def _set_weight(self, index, weight):
+        for level, pos in self._positions.get(index, ()):
+            self._samplers[level][0].set(pos, weight)
+    
+    def _draw_index(self, level):
+        """Weighted draw: unused of the level, else any unused, else any of the level"""
+        for key in ((level, None) if level else (None,)):
+            entry = self._samplers.get(key)
+            if entry is not None:
+                pos = entry[0].sample(self.rng)
+                if pos is not None:
+                    return entry[1][pos]
         
-        if level:
-            level_questions = [q for q in available if q['level'] == level]
-            if level_questions:
-                available = level_questions
+        # Everything used: reuse (uniform) within the level if possible
+        entry = self._samplers.get(level) if level else None
+        indices = entry[1] if entry else self._samplers[None][1]
+        return self.rng.choice(indices) if indices else None
+    
+    def record_result(self, question, correct):
+        """
+        Feed an answer outcome back into the weights (O(log n))
         
-        if not available:
-            available = self.questions
-            if level:
-                level_questions = [q for q in available if q['level'] == level]
-                if level_questions:
-                    available = level_questions
+        Args:
+            question: Question returned by get_random_question
+            correct: Grading result
+        """
+        index = question.get('_index') if question else None
+        if index is None or self._samplers is None:
+            return
+        stats = self.results.setdefault(index, [0, 0])
+        stats[0] += 1
+        if not correct:
+            stats[1] += 1
+        # Used questions stay at weight 0 until reset_used_questions
+        if self._samplers[None][0].get(index) > 0:
+            self._set_weight(index, self.question_weight(index))
+    
+    def get_random_question(self, level=None):
+        """Get a weighted random question with shuffled answers"""
+        if not self.questions:
+            return None
+        self._ensure_samplers()
         
-        if available:
-            question = random.choice(available).copy()
+        index = self._draw_index(level)
+        if index is not None:
+            if self._samplers[None][0].get(index) > 0:
+                self._set_weight(index, 0.0)
+                self._used_idx.append(index)
+            question = self.questions[index].copy()
+            question['_index'] = index
             self.used_questions.append(question)
             
-            if 'type' not in question:
-                question['type'] = 'multiple_choice'
+            return self.shuffle_answers(question, self.rng)
+        
+        return None
+    
+    @staticmethod
+    def shuffle_answers(question, rng):
+        """
+        Shuffle a drawn question's answers (remapping the correct indices)
+        
+        Args:
+            question: Own copy of a bank question
+            rng: random.Random drawing the shuffle
+        
+        Returns:
+            dict | None: Question to show, None if it has no answers
+        """
+        if 'type' not in question:
+            question['type'] = 'multiple_choice'
+        
+        # Handle different question types
+        if question['type'] == 'multiple_choice':
+            answers = question.get('answers', [])
+            if not answers:
+                return None
             
-            # Handle different question types
-            if question['type'] == 'multiple_choice':
-                answers = question.get('answers', [])
-                if not answers:
-                    return None
-                
-                formatted_answers = []
-                for i, ans in enumerate(answers):
-                    if isinstance(ans, dict):
-                        formatted_answers.append((i, ans['text']))
-                    else:
-                        formatted_answers.append((i, ans))
-                
-                random.shuffle(formatted_answers)
-                
-                shuffled_question = question.copy()
-                shuffled_question['answers'] = [ans for _, ans in formatted_answers]
-                
-                for new_idx, (old_idx, _) in enumerate(formatted_answers):
-                    if old_idx == question.get('correct'):
-                        shuffled_question['correct'] = new_idx
-                        break
-                
-                return shuffled_question
+            formatted_answers = []
+            for i, ans in enumerate(answers):
+                if isinstance(ans, dict):
+                    formatted_answers.append((i, ans['text']))
+                else:
+                    formatted_answers.append((i, ans))
             
-            elif question['type'] == 'true_false':
-                # Shuffle statements vÃ  update correct_answers indices
-                shuffled_question = question.copy()
-                answers = question.get('answers', [])
-                correct_answers = question.get('correct_answers', [question.get('correct')])
-                
-                # Handle None in correct_answers
-                correct_answers = [c for c in correct_answers if c is not None]
-                
-                statements = []
-                for i, a in enumerate(answers):
-                    text = a['text'] if isinstance(a, dict) else a
-                    is_correct = (i in correct_answers)
-                    statements.append((i, text, is_correct))
-                
-                random.shuffle(statements)
-                
-                shuffled_question['statements'] = statements
-                shuffled_question['answers'] = [s[1] for s in statements]
-                
-                # Update correct_answers vá»›i shuffled indices
-                new_correct_answers = []
-                for new_idx, (old_idx, text, is_correct) in enumerate(statements):
-                    if is_correct:
-                        new_correct_answers.append(new_idx)
-                
-                shuffled_question['correct_answers'] = new_correct_answers
-                
-                # Set correct to first correct answer (for compatibility)
-                if new_correct_answers:
-                    shuffled_question['correct'] = new_correct_answers[0]
-                
-                return shuffled_question
+            rng.shuffle(formatted_answers)
+            
+            shuffled_question = question.copy()
+            shuffled_question['answers'] = [ans for _, ans in formatted_answers]
             
-            elif question['type'] == 'short_answer':
-                return question
+            for new_idx, (old_idx, _) in enumerate(formatted_answers):
+                if old_idx == question.get('correct'):
+                    shuffled_question['correct'] = new_idx
+                    break
+            
+            return shuffled_question
+        
+        elif question['type'] == 'true_false':
+            # Shuffle statements vÃ  update correct_answers indices
+            shuffled_question = question.copy()
+            answers = question.get('answers', [])
+            correct_answers = question.get('correct_answers', [question.get('correct')])
+            
+            # Handle None in correct_answers
+            correct_answers = [c for c in correct_answers if c is not None]
+            
+            statements = []
+            for i, a in enumerate(answers):
+                text = a['text'] if isinstance(a, dict) else a
+                is_correct = (i in correct_answers)
+                statements.append((i, text, is_correct))
+            
+            rng.shuffle(statements)
+            
+            shuffled_question['statements'] = statements
+            shuffled_question['answers'] = [s[1] for s in statements]
+            
+            # Update correct_answers vá»›i shuffled indices
+            new_correct_answers = []
+            for new_idx, (old_idx, text, is_correct) in enumerate(statements):
+                if is_correct:
+                    new_correct_answers.append(new_idx)
+            
+            shuffled_question['correct_answers'] = new_correct_answers
+            
+            # Set correct to first correct answer (for compatibility)
+            if new_correct_answers:
+                shuffled_question['correct'] = new_correct_answers[0]
+            
+            return shuffled_question
+        
+        elif question['type'] == 'short_answer':
+            return question
         
         return None
     
     def has_unused_questions(self):
         """Check if there are unused questions"""
+        if self._samplers is not None and self._sampler_key == (id(self.questions), len(self.questions)):
+            return self._samplers[None][0].live > 0
         return len(self.used_questions) < len(self.questions)
     
     def reset_used_questions(self):
-        """Reset the list of used questions"""
+        """Reset the list of used questions (restores their weights)"""
         self.used_questions = []
+        if self._samplers is not None:
+            for index in self._used_idx:
+                self._set_weight(index, self.question_weight(index))
+        self._used_idx = []
+    
+    def session_state(self):
+        """
+        Draw state of the current run (see session_snapshot.py)
+        
+        Returns:
+            dict: Plain builtins only (marshal-able)
+        """
+        return {
+            'bank': self.bank_fingerprint(),
+            'used': [q.get('_index') for q in self.used_questions],
+            'results': self.results,
+            'rng': self.rng.getstate(),
+            'seed': self.seed
+        }
+    
+    def restore_session(self, state):
+        """
+        Inverse of session_state()
+        
+        Returns:
+            bool: False if the question bank changed since the snapshot
+        """
+        if tuple(state.get('bank', ())) != self.bank_fingerprint():
+            return False
+        self._ensure_samplers()
+        self.results = {int(k): list(v) for k, v in state.get('results', {}).items()}
+        for index in self.results:
+            self._set_weight(index, self.question_weight(index))
+        for index in state.get('used', ()):
+            if index is None or not 0 <= index < len(self.questions):
+                continue
+            question = self.questions[index].copy()
+            question['_index'] = index
+            self.used_questions.append(question)
+            if self._samplers[None][0].get(index) > 0:
+                self._set_weight(index, 0.0)
+                self._used_idx.append(index)
+        rng_state = state.get('rng')
+        if rng_state is not None:
+            self.rng.setstate((rng_state[0], tuple(rng_state[1]), rng_state[2]))
+        self.seed = state.get('seed')
+        return True
+    
+    def bank_fingerprint(self):
+        """Cheap identity of the loaded bank (question indices are only valid for the same one)"""
+        return (len(self.questions),) + tuple(
+            (f.get('name', ''), f.get('question_count', 0), f.get('upload_date', ''))
+            for f in self.uploaded_files)
     
     def delete_file(self, index):
         """Delete a file and its questions"""
@@ -297,5 +549,7 @@ class QuestionManager:
             )
             
             self.uploaded_files.pop(index)
+            self._wait_index()
+            self.index.remove_file(self._file_key(file_info))
             
             self.save_data()
\ No newline at end of file
@@ -0,0 +1,71 @@
+"""
+═══════════════════════════════════════════════════════════════════
+QUIZ RULES
+═══════════════════════════════════════════════════════════════════
+Pure game rules shared by the local Game and the session server:
+- which question level a body part asks for
+- damage dealt per body part
+- grading of the three question types
+No pygame import, safe to use from servers and simulations.
+═══════════════════════════════════════════════════════════════════
+"""
+
+MAX_WRONG = 2
+MONSTER_MAX_HP = 100
+SCORE_PER_DAMAGE = 10
+MONSTER_COUNT = 7
+
+PARTS = ('head', 'body', 'left_arm', 'right_arm', 'left_leg', 'right_leg')
+
+
+def get_level_from_part(part):
+    if part == "head":
+        return "vandung"
+    elif part == "body":
+        return "thonghieu"
+    else:
+        return "nhanbiet"
+
+
+def get_damage_from_part(part):
+    if part == "head":
+        return 40
+    elif part == "body":
+        return 25
+    else:
+        return 15
+
+
+def grade_answer(question, selected_answer=None, selected_answers=(), user_input=""):
+    """
+    Grade an answer against a (shuffled) question dict
+
+    Args:
+        question: Question as returned by QuestionManager.get_random_question
+        selected_answer: Chosen index (multiple_choice)
+        selected_answers: Chosen indices (true_false)
+        user_input: Typed answer (short_answer)
+
+    Returns:
+        bool, or None if there is nothing to grade yet
+    """
+    q_type = question.get('type', 'multiple_choice')
+
+    if q_type == 'multiple_choice':
+        if selected_answer is None:
+            return None
+        return selected_answer == question.get('correct')
+
+    elif q_type == 'true_false':
+        if len(selected_answers) == 0:
+            return None
+        correct_answers = question.get('correct_answers', [question.get('correct')])
+        return set(selected_answers) == set(correct_answers)
+
+    elif q_type == 'short_answer':
+        if not user_input.strip():
+            return None
+        correct_ans = question.get('correct_answer', '').strip().lower()
+        return user_input.strip().lower() == correct_ans
+
+    return None
@@ -0,0 +1,126 @@
+"""
+═══════════════════════════════════════════════════════════════════
+RENDER SCALER
+═══════════════════════════════════════════════════════════════════
+Decouples the 1280x720 logical canvas from the window size.
+
+- Game always draws into a logical 1280x720 frame (all draw code
+  uses absolute coordinates, HUD and text included)
+- The frame is scaled once onto a display of any size; mouse
+  positions are mapped back to logical coordinates
+- With the default display == logical size the frame IS the display
+  surface: no extra pass at all
+
+Not a render-resolution knob: nothing is drawn below 1280x720, and
+on a 1080p display the HUD / text are upscaled with the rest of the
+frame (not re-rendered at display resolution).
+═══════════════════════════════════════════════════════════════════
+"""
+
+import pygame
+
+
+MOUSE_POS_EVENTS = (pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.MOUSEMOTION)
+
+
+def scale_into(source, dest, smooth=True):
+    """Scale source to fill dest in one pass (no intermediate surface)"""
+    if source.get_size() == dest.get_size():
+        dest.blit(source, (0, 0))
+    elif smooth and source.get_bitsize() >= 24 and dest.get_bitsize() >= 24:
+        pygame.transform.smoothscale(source, dest.get_size(), dest)
+    else:
+        pygame.transform.scale(source, dest.get_size(), dest)
+
+
+class RenderScaler:
+    """
+    Owns the display surface and the logical frame
+    """
+
+    def __init__(self, logical_size=(1280, 720), display_size=None, smooth=True, fullscreen=False):
+        """
+        Args:
+            logical_size: Canvas size the game draws at
+            display_size: Window size, None = logical size (or native in fullscreen)
+            smooth: smoothscale (bilinear) instead of nearest-neighbour scale
+            fullscreen: Open a fullscreen display
+        """
+        self.logical_size = tuple(logical_size)
+        self.requested_display_size = tuple(display_size) if display_size else None
+        self.smooth = smooth
+        self.fullscreen = fullscreen
+
+        self.display = None
+        self.display_size = None
+        self.frame = None
+        self._orig_get_pos = None
+
+    def open(self, caption=None):
+        """
+        Create the window
+
+        Returns:
+            pygame.Surface: The logical frame Game should draw into
+        """
+        flags = pygame.FULLSCREEN if self.fullscreen else 0
+        size = self.requested_display_size or ((0, 0) if self.fullscreen else self.logical_size)
+        self.display = pygame.display.set_mode(size, flags)
+        self.display_size = self.display.get_size()
+        if caption:
+            pygame.display.set_caption(caption)
+
+        if self.display_size == self.logical_size:
+            self.frame = self.display
+        else:
+            self.frame = pygame.Surface(self.logical_size).convert()
+        return self.frame
+
+    @property
+    def scaled_output(self):
+        return self.frame is not self.display
+
+    # ══════════════════════════════════════════════════════════
+    #   SCALING
+    # ══════════════════════════════════════════════════════════
+
+    def present(self):
+        """Scale the frame to the display (if needed) and flip"""
+        if self.scaled_output:
+            scale_into(self.frame, self.display, self.smooth)
+        pygame.display.flip()
+
+    # ══════════════════════════════════════════════════════════
+    #   INPUT MAPPING
+    # ══════════════════════════════════════════════════════════
+
+    def to_logical(self, pos):
+        if not self.scaled_output:
+            return pos
+        lw, lh = self.logical_size
+        dw, dh = self.display_size
+        return (pos[0] * lw // dw, pos[1] * lh // dh)
+
+    def map_event(self, event):
+        """Return event with mouse positions in logical coordinates"""
+        if not self.scaled_output or event.type not in MOUSE_POS_EVENTS:
+            return event
+        attrs = dict(event.__dict__)
+        attrs['pos'] = self.to_logical(event.pos)
+        if 'rel' in attrs:
+            lw, lh = self.logical_size
+            dw, dh = self.display_size
+            attrs['rel'] = (event.rel[0] * lw // dw, event.rel[1] * lh // dh)
+        return pygame.event.Event(event.type, attrs)
+
+    def install_mouse_mapping(self):
+        """Make pygame.mouse.get_pos() return logical coordinates"""
+        if not self.scaled_output or self._orig_get_pos is not None:
+            return
+        self._orig_get_pos = pygame.mouse.get_pos
+        pygame.mouse.get_pos = lambda: self.to_logical(self._orig_get_pos())
+
+    def uninstall_mouse_mapping(self):
+        if self._orig_get_pos is not None:
+            pygame.mouse.get_pos = self._orig_get_pos
+            self._orig_get_pos = None
@@ -0,0 +1,343 @@
+"""
+═══════════════════════════════════════════════════════════════════
+SESSION RECORDING & HEADLESS REPLAY
+═══════════════════════════════════════════════════════════════════
+Records everything that makes a play session non-deterministic and
+feeds it back through Game at maximum speed without a window.
+
+Captured per frame:
+- dt passed to Game.update
+- pygame.time.get_ticks() (sampled once per frame)
+- mouse position (sampled once per frame)
+- every event passed to Game.handle_event
+
+Captured once (header):
+- The QuestionManager RNG seed (the only RNG Game's rules draw from)
+- The question bank and top rankings the session started with
+
+File format (little endian):
+    header  : MAGIC, version(H), seed(Q), bank_len(I), bank(zlib json)
+    frame   : dt(d), ticks(I), mouse_x(h), mouse_y(h), event_count(H)
+    event   : type(I), payload (layout depends on type, see _EVENT_CODECS)
+
+Usage:
+    python main.py --record session.mqr
+    python main.py --replay session.mqr
+═══════════════════════════════════════════════════════════════════
+"""
+
+import json
+import os
+import random
+import struct
+import time
+import zlib
+
+import pygame
+
+from leaderboard import LeaderboardStore
+
+
+MAGIC = b"MQSR"
+VERSION = 2  # 1 also stored camera / weapon seeds that nothing applied
+
+_HEADER = struct.Struct("<4sHQI")
+_FRAME = struct.Struct("<dIhhH")
+_EVENT_TYPE = struct.Struct("<I")
+_TEXT_LEN = struct.Struct("<H")
+
+
+# ══════════════════════════════════════════════════════════
+#   EVENT CODECS
+# ══════════════════════════════════════════════════════════
+
+def _pack_mouse_button(event):
+    return struct.pack("<hhB", event.pos[0], event.pos[1], event.button)
+
+
+def _unpack_mouse_button(data, offset):
+    x, y, button = struct.unpack_from("<hhB", data, offset)
+    return {'pos': (x, y), 'button': button}, offset + 5
+
+
+def _pack_mouse_motion(event):
+    buttons = sum(1 << i for i, pressed in enumerate(event.buttons[:8]) if pressed)
+    return struct.pack("<hhhhB", event.pos[0], event.pos[1], event.rel[0], event.rel[1], buttons)
+
+
+def _unpack_mouse_motion(data, offset):
+    x, y, rx, ry, mask = struct.unpack_from("<hhhhB", data, offset)
+    buttons = tuple(1 if mask & (1 << i) else 0 for i in range(3))
+    return {'pos': (x, y), 'rel': (rx, ry), 'buttons': buttons}, offset + 9
+
+
+def _pack_text(text):
+    raw = text.encode('utf-8')
+    return _TEXT_LEN.pack(len(raw)) + raw
+
+
+def _unpack_text(data, offset):
+    (length,) = _TEXT_LEN.unpack_from(data, offset)
+    offset += _TEXT_LEN.size
+    return data[offset:offset + length].decode('utf-8'), offset + length
+
+
+def _pack_key(event):
+    return struct.pack("<iHi", event.key, event.mod, getattr(event, 'scancode', 0)) + \
+        _pack_text(getattr(event, 'unicode', ''))
+
+
+def _unpack_key(data, offset):
+    key, mod, scancode = struct.unpack_from("<iHi", data, offset)
+    text, offset = _unpack_text(data, offset + 10)
+    return {'key': key, 'mod': mod, 'scancode': scancode, 'unicode': text}, offset
+
+
+def _pack_wheel(event):
+    return struct.pack("<hh", event.x, event.y)
+
+
+def _unpack_wheel(data, offset):
+    x, y = struct.unpack_from("<hh", data, offset)
+    return {'x': x, 'y': y}, offset + 4
+
+
+def _pack_text_input(event):
+    return _pack_text(event.text)
+
+
+def _unpack_text_input(data, offset):
+    text, offset = _unpack_text(data, offset)
+    return {'text': text}, offset
+
+
+_EVENT_CODECS = {
+    pygame.MOUSEBUTTONDOWN: (_pack_mouse_button, _unpack_mouse_button),
+    pygame.MOUSEBUTTONUP: (_pack_mouse_button, _unpack_mouse_button),
+    pygame.MOUSEMOTION: (_pack_mouse_motion, _unpack_mouse_motion),
+    pygame.KEYDOWN: (_pack_key, _unpack_key),
+    pygame.KEYUP: (_pack_key, _unpack_key),
+    pygame.MOUSEWHEEL: (_pack_wheel, _unpack_wheel),
+    pygame.TEXTINPUT: (_pack_text_input, _unpack_text_input),
+}
+
+
+def encode_event(event):
+    """Encode a pygame event; unknown types keep only their type"""
+    codec = _EVENT_CODECS.get(event.type)
+    payload = codec[0](event) if codec else b""
+    return _EVENT_TYPE.pack(event.type) + payload
+
+
+def decode_event(data, offset):
+    """Decode one event at offset, returns (event, new_offset)"""
+    (event_type,) = _EVENT_TYPE.unpack_from(data, offset)
+    offset += _EVENT_TYPE.size
+    codec = _EVENT_CODECS.get(event_type)
+    attrs = {}
+    if codec:
+        attrs, offset = codec[1](data, offset)
+    return pygame.event.Event(event_type, attrs), offset
+
+
+# ══════════════════════════════════════════════════════════
+#   FRAME INPUTS (virtual clock + mouse)
+# ══════════════════════════════════════════════════════════
+
+class FrameInputs:
+    """
+    Freezes pygame.time.get_ticks() and pygame.mouse.get_pos() to one
+    value per frame, both while recording and while replaying, so the
+    recorded values are exactly the ones the game code observed.
+    """
+
+    def __init__(self):
+        self.ticks = 0
+        self.mouse_pos = (0, 0)
+        self._orig_get_ticks = None
+        self._orig_get_pos = None
+
+    def install(self):
+        self._orig_get_ticks = pygame.time.get_ticks
+        self._orig_get_pos = pygame.mouse.get_pos
+        pygame.time.get_ticks = lambda: self.ticks
+        pygame.mouse.get_pos = lambda: self.mouse_pos
+
+    def uninstall(self):
+        if self._orig_get_ticks is not None:
+            pygame.time.get_ticks = self._orig_get_ticks
+            pygame.mouse.get_pos = self._orig_get_pos
+            self._orig_get_ticks = None
+            self._orig_get_pos = None
+
+    def sample_live(self):
+        """Sample the real clock and mouse for the coming frame"""
+        self.ticks = self._orig_get_ticks()
+        self.mouse_pos = self._orig_get_pos()
+
+
+# ══════════════════════════════════════════════════════════
+#   RECORDER
+# ══════════════════════════════════════════════════════════
+
+class SessionRecorder:
+    """
+    Writes a session recording while the game runs normally
+    """
+
+    RANKING_ROWS = 100  # Leaderboard rows embedded for the ranking screen
+
+    def __init__(self, path, game):
+        """
+        Args:
+            path: Output file (.mqr)
+            game: Game instance being recorded
+        """
+        self.path = path
+        self.frames = 0
+        self.inputs = FrameInputs()
+
+        seed = random.getrandbits(63)
+        game.question_manager.reseed(seed)
+
+        bank = zlib.compress(json.dumps({
+            'questions': game.question_manager.questions,
+            'files': game.question_manager.uploaded_files,
+            'rankings': game.leaderboard.top(self.RANKING_ROWS)
+        }, ensure_ascii=False).encode('utf-8'))
+
+        folder = os.path.dirname(path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        self._file = open(path, 'wb')
+        self._file.write(_HEADER.pack(MAGIC, VERSION, seed, len(bank)))
+        self._file.write(bank)
+
+        self.inputs.install()
+
+    def begin_frame(self):
+        """Sample clock and mouse; call right before reading events"""
+        self.inputs.sample_live()
+
+    def record_frame(self, dt, events):
+        """
+        Append one frame
+
+        Args:
+            dt: Delta time passed to Game.update
+            events: Events passed to Game.handle_event this frame
+        """
+        x, y = self.inputs.mouse_pos
+        chunks = [_FRAME.pack(dt, self.inputs.ticks & 0xFFFFFFFF, x, y, len(events))]
+        chunks.extend(encode_event(event) for event in events)
+        self._file.write(b"".join(chunks))
+        self.frames += 1
+
+    def close(self):
+        if self._file:
+            self._file.close()
+            self._file = None
+            self.inputs.uninstall()
+            print(f"Da ghi {self.frames} frame vao {self.path}")
+
+
+# ══════════════════════════════════════════════════════════
+#   REPLAY
+# ══════════════════════════════════════════════════════════
+
+class SessionReplay:
+    """
+    Reads a recording and drives a Game with it
+    """
+
+    def __init__(self, path):
+        with open(path, 'rb') as f:
+            data = f.read()
+
+        magic, version, seed, bank_len = _HEADER.unpack_from(data, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a session recording")
+        if version != VERSION:
+            raise ValueError(f"Unsupported recording version {version}")
+
+        offset = _HEADER.size
+        self.seed = seed
+        self.bank = json.loads(zlib.decompress(data[offset:offset + bank_len]).decode('utf-8'))
+        self._data = data
+        self._frames_offset = offset + bank_len
+
+    def frames(self):
+        """Yield (dt, ticks, mouse_pos, events) for each recorded frame"""
+        data = self._data
+        offset = self._frames_offset
+        end = len(data)
+        while offset + _FRAME.size <= end:
+            dt, ticks, x, y, count = _FRAME.unpack_from(data, offset)
+            offset += _FRAME.size
+            events = []
+            for _ in range(count):
+                event, offset = decode_event(data, offset)
+                events.append(event)
+            yield dt, ticks, (x, y), events
+
+    def prepare(self, game):
+        """Load the recorded bank/seed into game and disable disk writes
+
+        game should be built with Game(..., persist=False) so nothing under
+        data/ is opened for writing before this runs.
+        """
+        # Headless: a recorded upload click must not open a file dialog
+        game.ask_question_file = lambda: ""
+        qm = game.question_manager
+        qm.persist = False
+        qm.questions = self.bank['questions']
+        qm.uploaded_files = self.bank['files']
+        qm.rebuild_index(background=False)
+        qm.used_questions = []
+        game.leaderboard = LeaderboardStore(':memory:', legacy_json=None)
+        for entry in self.bank['rankings']:
+            game.leaderboard.add(entry, commit=False)
+        qm.reseed(self.seed)
+
+    def run(self, game, draw=True):
+        """
+        Feed the recording through game as fast as possible
+
+        Args:
+            game: Freshly constructed Game
+            draw: Also run Game.draw + display.flip (profiles rendering)
+
+        Returns:
+            dict: frame count and frame time statistics (ms)
+        """
+        self.prepare(game)
+        inputs = FrameInputs()
+        inputs.install()
+        frame_times = []
+        try:
+            for dt, ticks, mouse_pos, events in self.frames():
+                start = time.perf_counter()
+                inputs.ticks = ticks
+                inputs.mouse_pos = mouse_pos
+                for event in events:
+                    game.handle_event(event)
+                game.update(dt)
+                if draw:
+                    game.draw()
+                    pygame.display.flip()
+                frame_times.append((time.perf_counter() - start) * 1000.0)
+        finally:
+            inputs.uninstall()
+
+        if not frame_times:
+            return {'frames': 0}
+        ordered = sorted(frame_times)
+        return {
+            'frames': len(frame_times),
+            'total_ms': sum(frame_times),
+            'mean_ms': sum(frame_times) / len(frame_times),
+            'p99_ms': ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))],
+            'max_ms': ordered[-1],
+            'final_state': game.state,
+            'final_score': game.score
+        }
@@ -0,0 +1,413 @@
+"""
+═══════════════════════════════════════════════════════════════════
+ROBOT DISPLAY LISTS
+═══════════════════════════════════════════════════════════════════
+Robots are data (data/robots/<type>.json), compiled once into flat
+display lists and replayed by a small executor.
+
+Robot file:
+    name, description, palette {primary, secondary, dark, accent, glow},
+    bob (idle float multiplier, default 1), primitives [...]
+    subpixel (default false): keep the bobbing y origin fractional, for
+    robots whose original draw code placed shapes at float positions
+
+Primitive (coordinates relative to the robot centre):
+    {"op": "rect",    "rect": [x, y, w, h], "width": 0, "radius": 0}
+    {"op": "polygon", "points": [[x, y], ...], "width": 0}
+    {"op": "line",    "start": [x, y], "end": [x, y], "width": 1}
+    {"op": "ellipse", "rect": [x, y, w, h], "width": 0}
+    {"op": "circle",  "center": [x, y], "radius": r, "width": 0}
+    {"op": "sprite",  "pos": [x, y], "size": [w, h], "items": [...],
+                      "fixed": false}     alpha layer, pre-rendered
+    {"op": "effect",  "effect": name, ...} animated geometry (EFFECTS)
+
+    "color": palette role | [r, g, b] | {"cycle": {...}} | {"pulse": {...}}
+    "part":  body part; the primitive turns accent while it is targeted
+    "alpha": per-item alpha inside a sprite
+
+Compiled once per robot type: one op tuple list per highlight state
+with colors resolved, sprites rendered and vertices precomputed; per
+frame only the translation (and animated colors/effects) is applied.
+═══════════════════════════════════════════════════════════════════
+"""
+
+import json
+import math
+import os
+import random
+
+import pygame
+
+
+ROBOT_DIR = 'data/robots'
+DEFAULT_ROBOT = 'titan_bot'
+PART_NAMES = ('head', 'body', 'left_arm', 'right_arm', 'left_leg', 'right_leg')
+
+RECT, POLYGON, LINE, ELLIPSE, CIRCLE, SPRITE, EFFECT = range(7)
+
+# (x, y, w, h) around the robot centre that every robot in data/robots draws
+# inside, idle bob and effects included (measured, ~35 px margin)
+DRAW_BOUNDS = (-160, -270, 320, 600)
+
+
+def load_robot(name, folder=ROBOT_DIR):
+    """Read one robot definition"""
+    with open(os.path.join(folder, f"{name}.json"), 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def available_robots(folder=ROBOT_DIR):
+    """Robot types that have a data file"""
+    try:
+        return sorted(n[:-5] for n in os.listdir(folder) if n.endswith('.json'))
+    except OSError:
+        return []
+
+
+def clamp_color(color):
+    return tuple(min(255, max(0, int(c))) for c in color)
+
+
+def hexagon(cx, cy, width, height):
+    return [
+        (cx, cy - height),
+        (cx + width, cy - height // 2),
+        (cx + width, cy + height // 2),
+        (cx, cy + height),
+        (cx - width, cy + height // 2),
+        (cx - width, cy - height // 2)
+    ]
+
+
+def diamond(x, y, size):
+    """Diamond with its top vertex at (x, y)"""
+    return [(x, y), (x + size, y + size), (x, y + size * 2), (x - size, y + size)]
+
+
+# ══════════════════════════════════════════════════════════
+#   COLORS
+# ══════════════════════════════════════════════════════════
+
+def _resolve(color, palette):
+    if color is None:
+        return None
+    if isinstance(color, str):
+        return tuple(palette[color])
+    return tuple(color)
+
+
+def _compile_color_anim(spec, palette):
+    """
+    Animated color -> callable(t, oy) returning an RGB tuple or None (skip)
+
+    cycle: colors[1] while lo <= int(t / period + phase) % modulo < hi
+           (int() truncates toward zero, like the original draw code)
+    pulse: base + gain * int(|sin(t / period + phase + (oy + y) / phase_y)| * 155 + 100)
+    """
+    if 'cycle' in spec:
+        c = spec['cycle']
+        period = c['period']
+        phase = c.get('phase', 0)
+        modulo = c.get('modulo', 2)
+        lo, hi = c.get('on', (1, modulo))
+        off_color, on_color = (_resolve(col, palette) for col in c['colors'])
+
+        def cycle(t, oy):
+            return on_color if lo <= int(t / period + phase) % modulo < hi else off_color
+        return cycle
+
+    if 'pulse' in spec:
+        p = spec['pulse']
+        period = p['period']
+        phase = p.get('phase', 0)
+        phase_y = p.get('phase_y')
+        ref_y = p.get('y', 0)
+        base = p.get('base', (0, 0, 0))
+        gain = p.get('gain', (1, 1, 1))
+
+        def pulse(t, oy):
+            angle = t / period + phase
+            if phase_y:
+                angle += (oy + ref_y) / phase_y
+            intensity = int(abs(math.sin(angle)) * 155 + 100)
+            return clamp_color([b + g * intensity for b, g in zip(base, gain)])
+        return pulse
+
+    raise ValueError(f"Unknown color animation {spec}")
+
+
+# ══════════════════════════════════════════════════════════
+#   EFFECTS (animated geometry, parameters come from data)
+# ══════════════════════════════════════════════════════════
+
+def _effect_pulse_layers(screen, ox, oy, t, spec):
+    """Nested translucent hex/diamond layers breathing in size"""
+    size = int(spec['base'] + abs(math.sin(t / spec['period'])) * spec['amp'])
+    ax, ay = spec['at']
+    cache = spec['_cache']
+    for i in range(spec['layers']):
+        s = size - i * spec['step']
+        surf = cache.get((s, i))
+        if surf is None:
+            alpha = spec['alpha'][0] - i * spec['alpha'][1]
+            color = (*spec['_color'], alpha)
+            if spec['shape'] == 'hex':
+                inset_w, inset_h = spec.get('inset', (0, 0))
+                surf = pygame.Surface((s * 2, s * 2), pygame.SRCALPHA)
+                pygame.draw.polygon(surf, color, hexagon(s, s, s - inset_w, s - inset_h))
+            else:
+                surf = pygame.Surface((s * 2 + 20, s * 2 + 20), pygame.SRCALPHA)
+                c = s + 10
+                pygame.draw.polygon(surf, color, [(c, c - s), (c + s, c), (c, c + s), (c - s, c)])
+            cache[(s, i)] = surf
+        half = surf.get_width() // 2
+        screen.blit(surf, (ox + ax - half, oy + ay - half))
+
+
+def _effect_rotor(screen, ox, oy, t, spec):
+    """Line spinning around a pivot (t / period degrees)"""
+    ax, ay = ox + spec['at'][0], oy + spec['at'][1]
+    angle = math.radians((t / spec['period']) % 360)
+    r = spec['radius']
+    pygame.draw.line(screen, spec['_color'], (ax, ay),
+                     (ax + math.cos(angle) * r, ay + math.sin(angle) * r), spec.get('width', 1))
+
+
+def _effect_orbit(screen, ox, oy, t, spec):
+    """Diamonds circling a centre"""
+    cx, cy = ox + spec['at'][0], oy + spec['at'][1]
+    r = spec['radius']
+    size = spec['size']
+    for angle in spec['angles']:
+        rad = math.radians(angle + t / spec['period'])
+        pygame.draw.polygon(screen, spec['_color'],
+                            diamond(cx + math.cos(rad) * r, cy + math.sin(rad) * r, size))
+
+
+def _effect_pulse_rect(screen, ox, oy, t, spec):
+    """Rect whose width/height follow |sin|"""
+    pulse = abs(math.sin(t / spec['period'] + spec.get('phase', 0)))
+    w = spec['w'][0] + int(pulse * spec['w'][1])
+    h = spec['h'][0] + int(pulse * spec['h'][1])
+    x, y = ox + spec['at'][0], oy + spec['at'][1]
+    if spec.get('anchor') == 'center':
+        x -= w // 2
+        y -= h // 2
+    pygame.draw.rect(screen, spec['_color'], (x, y, w, h), 0, spec.get('radius', 0))
+
+
+def _effect_sparks(screen, ox, oy, t, spec):
+    """Random particle under a hover pad"""
+    if random.random() > 1 - spec['chance']:
+        x = ox + spec['at'][0] + random.randint(*spec['dx'])
+        y = oy + spec['at'][1] + random.randint(*spec['dy'])
+        pygame.draw.polygon(screen, spec['_color'], diamond(x, y, spec['size']))
+
+
+def _effect_pulse_slit(screen, ox, oy, t, spec):
+    """Trapezoid slit (eye) whose width follows |sin|"""
+    pulse = abs(math.sin(t / spec['period']))
+    half = int(spec['w'][0] + pulse * spec['w'][1]) // 2
+    x, top = ox + spec['at'][0], oy + spec['at'][1]
+    bottom = top + spec['height']
+    inset = spec['inset']
+    pygame.draw.polygon(screen, spec['_color'], [
+        (x - half, top), (x + half, top),
+        (x + half - inset, bottom), (x - half + inset, bottom)
+    ])
+
+
+def _effect_pulse_alpha_bars(screen, ox, oy, t, spec):
+    """Translucent bars whose alpha follows |sin|"""
+    fade = 0.5 + abs(math.sin(t / spec['period'])) * 0.5
+    cache = spec['_cache']
+    for x, y, w, h, alpha in spec['bars']:
+        a = int(alpha * fade)
+        surf = cache.get((w, h, a))
+        if surf is None:
+            surf = pygame.Surface((w, h), pygame.SRCALPHA)
+            surf.fill((*spec['_color'], a))
+            cache[(w, h, a)] = surf
+        screen.blit(surf, (ox + x, oy + y))
+
+
+def _effect_signal_waves(screen, ox, oy, t, spec):
+    """Diamonds travelling out of an antenna tip and fading"""
+    travel = (t / spec['period']) % 20
+    tx, ty = spec['at']
+    cache = spec['_cache']
+    for i in range(spec['waves']):
+        dist = 8 + i * 6 + travel
+        alpha = int(200 - i * 60 - travel * 8)
+        if alpha <= 0:
+            continue
+        surf = cache.get(alpha)
+        if surf is None:
+            surf = pygame.Surface((10, 10), pygame.SRCALPHA)
+            pygame.draw.polygon(surf, (*spec['_color'], alpha), [(5, 0), (8, 5), (5, 10), (2, 5)])
+            cache[alpha] = surf
+        screen.blit(surf, (ox + tx + spec['dir'] * dist - 5, oy + ty - dist // 2 - 5))
+
+
+EFFECTS = {
+    'pulse_layers': _effect_pulse_layers,
+    'rotor': _effect_rotor,
+    'orbit': _effect_orbit,
+    'pulse_rect': _effect_pulse_rect,
+    'sparks': _effect_sparks,
+    'pulse_slit': _effect_pulse_slit,
+    'pulse_alpha_bars': _effect_pulse_alpha_bars,
+    'signal_waves': _effect_signal_waves,
+}
+
+
+# ══════════════════════════════════════════════════════════
+#   COMPILER
+# ══════════════════════════════════════════════════════════
+
+def _render_sprite(prim, palette):
+    surf = pygame.Surface(prim['size'], pygame.SRCALPHA)
+    for item in prim['items']:
+        color = (*_resolve(item['color'], palette), item.get('alpha', 255))
+        width = item.get('width', 0)
+        kind = item['op']
+        if kind == 'rect':
+            pygame.draw.rect(surf, color, item['rect'], width, item.get('radius', 0))
+        elif kind == 'polygon':
+            pygame.draw.polygon(surf, color, item['points'], width)
+        elif kind == 'ellipse':
+            pygame.draw.ellipse(surf, color, item['rect'], width)
+        elif kind == 'circle':
+            pygame.draw.circle(surf, color, item['center'], item['radius'], width)
+        elif kind == 'line':
+            pygame.draw.line(surf, color, item['start'], item['end'], width or 1)
+    return surf
+
+
+def _compile_op(prim, palette, highlighted, sprites, effects):
+    kind = prim['op']
+
+    if kind == 'sprite':
+        key = id(prim)
+        if key not in sprites:
+            sprites[key] = _render_sprite(prim, palette)
+        x, y = prim['pos']
+        return (SPRITE, sprites[key], None, x, y, prim.get('fixed', False))
+
+    if kind == 'effect':
+        key = id(prim)
+        if key not in effects:
+            spec = dict(prim)
+            spec['_color'] = _resolve(prim.get('color', 'glow'), palette)
+            spec['_cache'] = {}
+            effects[key] = spec
+        return (EFFECT, None, EFFECTS[prim['effect']], effects[key])
+
+    color_spec = prim['color']
+    anim = None
+    if prim.get('part') is not None and prim['part'] == highlighted:
+        color = tuple(palette['accent'])
+    elif isinstance(color_spec, dict):
+        color = None
+        anim = _compile_color_anim(color_spec, palette)
+    else:
+        color = _resolve(color_spec, palette)
+
+    width = prim.get('width', 0)
+    if kind == 'rect':
+        x, y, w, h = prim['rect']
+        return (RECT, color, anim, x, y, w, h, width, prim.get('radius', 0))
+    if kind == 'polygon':
+        return (POLYGON, color, anim, tuple((x, y) for x, y in prim['points']), width)
+    if kind == 'line':
+        return (LINE, color, anim, *prim['start'], *prim['end'], width or 1)
+    if kind == 'ellipse':
+        x, y, w, h = prim['rect']
+        return (ELLIPSE, color, anim, x, y, w, h, width)
+    if kind == 'circle':
+        return (CIRCLE, color, anim, *prim['center'], prim['radius'], width)
+    raise ValueError(f"Unknown primitive {kind}")
+
+
+class DisplayList:
+    """
+    A robot compiled into per-highlight op lists
+    """
+
+    def __init__(self, data):
+        self.name = data['name']
+        self.palette = {k: tuple(v) for k, v in data['palette'].items()}
+        self.bob = data.get('bob', 1.0)
+        self.subpixel = data.get('subpixel', False)
+
+        sprites = {}
+        effects = {}
+        primitives = data['primitives']
+        self.ops = {
+            highlighted: tuple(_compile_op(p, self.palette, highlighted, sprites, effects)
+                               for p in primitives)
+            for highlighted in (None,) + PART_NAMES
+        }
+
+    def draw(self, screen, x, y, idle_offset, highlighted_part, t):
+        """
+        Execute the display list
+
+        Args:
+            screen: Target surface
+            x, y: Robot centre
+            idle_offset: Current idle float (scaled by bob)
+            highlighted_part: Targeted part or None
+            t: pygame ticks (ms)
+        """
+        ops = self.ops.get(highlighted_part) or self.ops[None]
+        ox = int(x)
+        base_y = int(y)
+        oy = y + idle_offset * self.bob
+        if not self.subpixel:
+            oy = int(oy)
+
+        draw_rect = pygame.draw.rect
+        draw_polygon = pygame.draw.polygon
+        draw_line = pygame.draw.line
+        blit = screen.blit
+
+        for op in ops:
+            kind = op[0]
+            if kind == SPRITE:
+                blit(op[1], (ox + op[3], (base_y if op[5] else oy) + op[4]))
+                continue
+            if kind == EFFECT:
+                op[2](screen, ox, oy, t, op[3])
+                continue
+
+            color = op[1] if op[2] is None else op[2](t, oy)
+            if color is None:
+                continue
+
+            if kind == RECT:
+                draw_rect(screen, color, (ox + op[3], oy + op[4], op[5], op[6]), op[7], op[8])
+            elif kind == POLYGON:
+                draw_polygon(screen, color, [(ox + px, oy + py) for px, py in op[3]], op[4])
+            elif kind == LINE:
+                draw_line(screen, color, (ox + op[3], oy + op[4]), (ox + op[5], oy + op[6]), op[7])
+            elif kind == ELLIPSE:
+                pygame.draw.ellipse(screen, color, (ox + op[3], oy + op[4], op[5], op[6]), op[7])
+            elif kind == CIRCLE:
+                pygame.draw.circle(screen, color, (ox + op[3], oy + op[4]), op[5], op[6])
+
+
+_COMPILED = {}
+
+
+def get_display_list(name, folder=ROBOT_DIR):
+    """Compiled display list for a robot type (compiled once per process)"""
+    key = (folder, name)
+    if key not in _COMPILED:
+        try:
+            data = load_robot(name, folder)
+        except (OSError, ValueError) as e:
+            print(f"Khong doc duoc robot {name}: {e}")
+            data = load_robot(DEFAULT_ROBOT, folder)
+        _COMPILED[key] = DisplayList(data)
+    return _COMPILED[key]
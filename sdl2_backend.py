@@ -0,0 +1,223 @@
+"""
+═══════════════════════════════════════════════════════════════════
+SDL2 RENDERER BACKEND (optional)
+═══════════════════════════════════════════════════════════════════
+Composites cached layers with pygame._sdl2.video Renderer/Texture
+instead of software Surface.blit.
+
+- Baked layers (background static, the animated background details,
+  the monster) are textures drawn by the renderer; a layer is uploaded
+  again only when its version changes, and only its area
+- Alpha fades are per-texture alpha / color mod, not surface blits
+- Everything else drawn per frame goes into one transparent frame;
+  only the rects marked dirty this frame (mark_dirty) are uploaded and
+  drawn, then cleared (no marks = the whole frame, e.g. menus)
+- Works with SDL's software renderer too (--renderer sdl2-software)
+- Same interface as RenderScaler (present, map_event, ...) so main.py
+  can use either; software blitting stays the default / fallback
+═══════════════════════════════════════════════════════════════════
+"""
+
+import pygame
+
+try:
+    from pygame._sdl2.video import Window, Renderer, Texture
+    SDL2_AVAILABLE = True
+except ImportError:
+    SDL2_AVAILABLE = False
+
+
+# SDL_ComposeCustomBlendMode(ONE, ONE_MINUS_SRC_ALPHA, ADD, ONE, ONE_MINUS_SRC_ALPHA, ADD).
+# Alpha blits onto a transparent pygame surface produce premultiplied colors,
+# so the frame texture has to be composited with this mode to keep glows bright.
+BLENDMODE_PREMULTIPLIED = 1 | (2 << 4) | (6 << 8) | (1 << 16) | (2 << 20) | (6 << 24)
+BLENDMODE_BLEND = 1
+BLENDMODE_NONE = 0
+
+
+def disjoint_rects(rects, bounds):
+    """
+    Split rects into non-overlapping pieces covering the same pixels
+    (overlaps would be blended twice; a union would blend empty space)
+
+    Args:
+        rects: Rects in any order
+        bounds: Clip rect
+
+    Returns:
+        list: pygame.Rect pieces
+    """
+    pieces = []
+    for rect in rects:
+        todo = [pygame.Rect(rect).clip(bounds)]
+        for done in pieces:
+            split = []
+            for r in todo:
+                if not r.colliderect(done):
+                    split.append(r)
+                    continue
+                # r minus done: full-width bands above / below, side bands in between
+                top, bottom = max(r.top, done.top), min(r.bottom, done.bottom)
+                if r.top < top:
+                    split.append(pygame.Rect(r.left, r.top, r.w, top - r.top))
+                if bottom < r.bottom:
+                    split.append(pygame.Rect(r.left, bottom, r.w, r.bottom - bottom))
+                if r.left < done.left:
+                    split.append(pygame.Rect(r.left, top, done.left - r.left, bottom - top))
+                if done.right < r.right:
+                    split.append(pygame.Rect(done.right, top, r.right - done.right, bottom - top))
+            todo = split
+        pieces.extend(r for r in todo if r.w > 0 and r.h > 0)
+    return pieces
+
+
+class Sdl2Backend:
+    """
+    Window + Renderer compositing texture layers under the frame
+    """
+
+    def __init__(self, size=(1280, 720), title="Monster Quiz Shooter", software=False, vsync=False):
+        """
+        Args:
+            size: Window size (= logical size, no scaling)
+            title: Window title
+            software: Use SDL's software renderer (no GPU needed)
+            vsync: Sync present to the display refresh
+        """
+        if not SDL2_AVAILABLE:
+            raise RuntimeError("pygame._sdl2.video khong kha dung")
+
+        self.logical_size = tuple(size)
+        self.display_size = self.logical_size
+        self.window = Window(title, size=self.logical_size)
+        self.renderer = Renderer(self.window, accelerated=0 if software else -1, vsync=vsync)
+
+        self.frame = pygame.Surface(self.logical_size, pygame.SRCALPHA)
+        self.frame_texture = Texture(self.renderer, self.logical_size, streaming=True)
+        try:
+            self.frame_texture.blend_mode = BLENDMODE_PREMULTIPLIED
+        except Exception:
+            # Renderer without custom blend modes (SDL software): glows come out a bit darker
+            self.frame_texture.blend_mode = BLENDMODE_BLEND
+
+        self._layers = {}  # name -> [source surface, Texture, version]
+        self._areas = {}  # name -> (area list, its disjoint pieces)
+        self._queued = []
+        self._dirty = []
+        self._bounds = pygame.Rect((0, 0), self.logical_size)
+
+    def open(self, caption=None):
+        """Return the frame Game should draw into (RenderScaler compatible)"""
+        if caption:
+            self.window.title = caption
+        return self.frame
+
+    # ══════════════════════════════════════════════════════════
+    #   LAYERS
+    # ══════════════════════════════════════════════════════════
+
+    def layer_texture(self, name, surface, areas=None, version=None):
+        """
+        Texture for a baked surface, uploaded when the surface or its version changes
+
+        Args:
+            areas: Disjoint rects to upload again (None = all of it)
+        """
+        cached = self._layers.get(name)
+        if cached is not None and cached[0] is surface:
+            if cached[2] != version:
+                texture = cached[1]
+                for rect in (None,) if areas is None else areas:
+                    texture.update(surface.subsurface(rect) if rect else surface, rect)
+                cached[2] = version
+            return cached[1]
+        texture = Texture.from_surface(self.renderer, surface)
+        if surface.get_flags() & pygame.SRCALPHA:
+            try:
+                texture.blend_mode = BLENDMODE_PREMULTIPLIED
+            except Exception:
+                texture.blend_mode = BLENDMODE_BLEND
+        self._layers[name] = [surface, texture, version]
+        return texture
+
+    def queue_layer(self, name, surface, alpha=255, color=(255, 255, 255), area=None, version=None):
+        """
+        Draw a cached layer under this frame, in queue order
+
+        Args:
+            name: Layer name
+            surface: Baked surface (logical size)
+            alpha: Per-texture alpha (fades)
+            color: Per-texture color modulation
+            area: Rect or list of rects holding all of the layer's content
+                  (only these are uploaded / drawn; None = everything).
+                  Pass the same list every frame; it is split only once
+            version: Content key; the layer is uploaded again when it changes
+        """
+        areas = None
+        if isinstance(area, pygame.Rect):
+            areas = disjoint_rects([area], self._bounds)
+        elif area is not None:
+            # Area lists are fixed per layer; split them once
+            cached = self._areas.get(name)
+            if cached is None or cached[0] is not area:
+                cached = self._areas[name] = (area, disjoint_rects(area, self._bounds))
+            areas = cached[1]
+        texture = self.layer_texture(name, surface, areas, version)
+        if texture.blend_mode == BLENDMODE_PREMULTIPLIED and alpha < 255:
+            # Premultiplied colors fade with the alpha too
+            color = tuple(c * alpha // 255 for c in color)
+        self._queued.append((texture, areas, alpha, color))
+
+    def mark_dirty(self, rect):
+        """Frame region drawn into this frame (only these are uploaded)"""
+        self._dirty.append(pygame.Rect(rect))
+
+    def _dirty_rects(self):
+        """This frame's dirty rects as disjoint pieces (none marked = the whole frame)"""
+        if not self._dirty:
+            return [self._bounds]
+        pieces = disjoint_rects(self._dirty, self._bounds)
+        self._dirty.clear()
+        return pieces
+
+    # ══════════════════════════════════════════════════════════
+    #   PRESENT
+    # ══════════════════════════════════════════════════════════
+
+    def present(self):
+        renderer = self.renderer
+        queued = self._queued
+        if not queued or queued[0][1] is not None or queued[0][0].blend_mode != BLENDMODE_NONE:
+            # No opaque full-window layer at the bottom to cover last frame
+            renderer.draw_color = (0, 0, 0, 255)
+            renderer.clear()
+
+        for texture, areas, alpha, color in queued:
+            texture.alpha = alpha
+            texture.color = color
+            if areas is None:
+                texture.draw()
+            else:
+                for rect in areas:
+                    texture.draw(srcrect=rect, dstrect=rect)
+        queued.clear()
+
+        # Frame: upload / draw only what was drawn, then clear it for the next frame
+        frame = self.frame
+        for rect in self._dirty_rects():
+            self.frame_texture.update(frame.subsurface(rect), rect)
+            self.frame_texture.draw(srcrect=rect, dstrect=rect)
+            frame.fill((0, 0, 0, 0), rect)
+        renderer.present()
+
+    # ═══ RenderScaler interface (window == logical, nothing to map) ═══
+
+    def map_event(self, event):
+        return event
+
+    def install_mouse_mapping(self):
+        pass
+
+    def uninstall_mouse_mapping(self):
+        pass
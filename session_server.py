@@ -0,0 +1,653 @@
+"""
+═══════════════════════════════════════════════════════════════════
+CLASSROOM SESSION SERVER
+═══════════════════════════════════════════════════════════════════
+asyncio server hosting many concurrent quiz games for one class.
+
+- One read-only QuestionBank shared by every session, weighted
+  samplers included; a session keeps only its RNG and used set
+- Each Session drives its own GameEngine (question draw with the
+  weighted sampler, grading, damage/score, wrong-answer limit, win
+  rule): the server and the local Game share one set of rules
+- The pygame Game is a thin client when started with --server:
+  RemoteEngine sends shoot / answer over SessionClient and only
+  plays the feedback / death / spawn animation locally
+
+Protocol: newline-delimited JSON over TCP, one request -> one reply
+    {"op": "hello", "name": "An", "class": "10A"}   (class optional)
+    {"op": "shoot", "part": "head"}
+    {"op": "answer", "answer": 2}              multiple_choice
+    {"op": "answer", "answers": [0, 3]}        true_false
+    {"op": "answer", "text": "..."}            short_answer
+    {"op": "state"} / {"op": "stats"}
+
+Usage:
+    python session_server.py --port 8765
+    python session_server.py --simulate 500     (prints p99 grading latency)
+═══════════════════════════════════════════════════════════════════
+"""
+
+import argparse
+import asyncio
+import collections
+import datetime
+import itertools
+import json
+import random
+import socket
+import time
+
+import quiz_rules
+from game_engine import GameEngine
+from question_manager import QuestionManager, miss_weight
+from weighted_sampler import FenwickSampler
+
+
+# ══════════════════════════════════════════════════════════
+#   SHARED QUESTION BANK
+# ══════════════════════════════════════════════════════════
+
+class QuestionBank:
+    """
+    Question bank shared by all sessions (the questions are read-only)
+
+    The weighted samplers (one per level + one over all questions) are
+    built once here; a session only owns its RNG and used set (see
+    SessionQuestions). Weights follow the class's answers: questions
+    the class misses come up more for everyone.
+    """
+
+    def __init__(self, questions):
+        self.questions = tuple(questions)
+        self.results = {}  # question index -> [attempts, wrong] (all sessions)
+
+        members = {None: list(range(len(self.questions)))}
+        for i, q in enumerate(self.questions):
+            members.setdefault(q.get('level'), []).append(i)
+        weight = miss_weight(0, 0)
+        self.samplers = {level: (FenwickSampler([weight] * len(indices)), indices)
+                         for level, indices in members.items()}
+        # Position of each question in its level's tree (its position in tree None is its index)
+        self.level_pos = [0] * len(self.questions)
+        for level, indices in members.items():
+            if level is not None:
+                for pos, i in enumerate(indices):
+                    self.level_pos[i] = pos
+
+    @classmethod
+    def from_saved_data(cls):
+        """Load the bank the local game uses (data/questions_data.json)"""
+        return cls(QuestionManager(persist=False).questions)
+
+    def __len__(self):
+        return len(self.questions)
+
+    def session_questions(self, seed):
+        """
+        Per-session question source over the shared bank
+
+        Args:
+            seed: Seed of the session's draws / answer shuffles
+
+        Returns:
+            SessionQuestions: Own RNG and used set only
+        """
+        return SessionQuestions(self, seed)
+
+    def record_result(self, index, correct):
+        """Feed one graded answer into the shared weights (O(log n))"""
+        stats = self.results.setdefault(index, [0, 0])
+        stats[0] += 1
+        if not correct:
+            stats[1] += 1
+        weight = miss_weight(*stats)
+        self.samplers[None][0].set(index, weight)
+        self.samplers[self.questions[index].get('level')][0].set(self.level_pos[index], weight)
+
+    @staticmethod
+    def public_view(question):
+        """What the client may see (no answer key)"""
+        return {
+            'type': question.get('type', 'multiple_choice'),
+            'question': question.get('question', ''),
+            'context': question.get('context', ''),
+            'answers': question.get('answers', []),
+            'level': question.get('level')
+        }
+
+
+class SessionQuestions:
+    """
+    One session's draws over a QuestionBank (the QuestionManager
+    interface GameEngine uses): unused questions are drawn by
+    rejection from the shared weighted trees
+    """
+
+    __slots__ = ('bank', 'rng', 'used', 'used_per_level')
+
+    # Rejected draws before falling back to a scan of the level's unused questions
+    MAX_REJECTS = 32
+
+    def __init__(self, bank, seed):
+        self.bank = bank
+        self.rng = random.Random(seed)
+        self.used = set()  # question indices drawn this run
+        self.used_per_level = collections.Counter()
+
+    @property
+    def questions(self):
+        return self.bank.questions
+
+    def reset_used_questions(self):
+        self.used.clear()
+        self.used_per_level.clear()
+
+    def has_unused_questions(self):
+        return len(self.used) < len(self.bank.questions)
+
+    def record_result(self, question, correct):
+        index = question.get('_index') if question else None
+        if index is not None:
+            self.bank.record_result(index, correct)
+
+    def _draw_unused(self, key):
+        tree, indices = self.bank.samplers[key]
+        used = self.used
+        for _ in range(self.MAX_REJECTS):
+            pos = tree.sample(self.rng)
+            if pos is None:
+                break
+            if indices[pos] not in used:
+                return indices[pos]
+        # Mostly used: weighted pick among what is left
+        unused = [(i, tree.get(pos)) for pos, i in enumerate(indices) if i not in used]
+        return self.rng.choices([i for i, _ in unused], [w for _, w in unused])[0]
+
+    def _draw_index(self, level):
+        """Weighted draw: unused of the level, else any unused, else any of the level"""
+        samplers = self.bank.samplers
+        for key in ((level, None) if level else (None,)):
+            entry = samplers.get(key)
+            if entry is not None:
+                used = len(self.used) if key is None else self.used_per_level[key]
+                if used < len(entry[1]):
+                    return self._draw_unused(key)
+
+        # Everything used: reuse (uniform) within the level if possible
+        entry = samplers.get(level) if level else None
+        indices = entry[1] if entry else samplers[None][1]
+        return self.rng.choice(indices) if indices else None
+
+    def get_random_question(self, level=None):
+        """Weighted draw of an unused question, answers shuffled (see QuestionManager)"""
+        index = self._draw_index(level)
+        if index is None:
+            return None
+        question = self.bank.questions[index].copy()
+        if index not in self.used:
+            self.used.add(index)
+            self.used_per_level[question.get('level')] += 1
+        question['_index'] = index
+        return QuestionManager.shuffle_answers(question, self.rng)
+
+
+# ══════════════════════════════════════════════════════════
+#   PER-CLIENT SESSION
+# ══════════════════════════════════════════════════════════
+
+class Session:
+    """Compact state of one student's game (the run itself is a GameEngine)"""
+
+    __slots__ = ('id', 'name', 'class_id', 'engine', 'asked_at')
+
+    def __init__(self, session_id, name, class_id, question_manager):
+        self.id = session_id
+        self.name = name
+        self.class_id = class_id
+        self.engine = GameEngine(question_manager)
+        self.asked_at = 0.0
+
+    @property
+    def state(self):
+        engine = self.engine
+        if engine.state == "RESULT":
+            return "WON" if engine.won else "LOST"
+        return engine.state
+
+    def snapshot(self):
+        engine = self.engine
+        return {
+            'state': self.state,
+            'score': engine.score,
+            'wrong': engine.wrong_answers,
+            'max_wrong': engine.max_wrong,
+            'monsters_killed': engine.monsters_killed,
+            'monster_index': engine.current_monster_index % quiz_rules.MONSTER_COUNT,
+            'monster_hp': engine.monster_hp
+        }
+
+
+# ══════════════════════════════════════════════════════════
+#   SERVER
+# ══════════════════════════════════════════════════════════
+
+class SessionServer:
+    """
+    Hosts concurrent sessions over newline-delimited JSON/TCP
+    """
+
+    def __init__(self, bank, leaderboard=None, seed=None, analytics=None):
+        """
+        Args:
+            bank: QuestionBank shared by all sessions
+            leaderboard: Optional LeaderboardStore receiving finished games
+            seed: Seed for the shared RNG (reproducible simulations)
+            analytics: Optional analytics.AnswerLog receiving every graded answer
+        """
+        self.bank = bank
+        self.leaderboard = leaderboard
+        self.analytics = analytics
+        self.rng = random.Random(seed)
+        self.sessions = {}
+        self._ids = itertools.count(1)
+        self.grading_latency = collections.deque(maxlen=200000)  # seconds
+        self.requests = 0
+
+    # ═══ REQUEST HANDLING (pure, no I/O) ═══
+
+    def handle_request(self, session, msg):
+        """
+        Apply one request to a session
+
+        Returns:
+            (session, reply dict)
+        """
+        if not isinstance(msg, dict):
+            return session, {'ok': False, 'error': 'bad request'}
+        op = msg.get('op')
+
+        if op == 'hello':
+            if session is not None:
+                self.sessions.pop(session.id, None)
+            session = Session(next(self._ids), str(msg.get('name', ''))[:20],
+                              str(msg.get('class', ''))[:20],
+                              self.bank.session_questions(self.rng.getrandbits(32)))
+            if not session.engine.start():
+                return None, {'ok': False, 'error': 'empty bank'}
+            self.sessions[session.id] = session
+            return session, {'ok': True, 'session': session.id, 'questions': len(self.bank),
+                             **session.snapshot()}
+
+        if op == 'stats':
+            return session, {'ok': True, **self.latency_report()}
+
+        if session is None:
+            return session, {'ok': False, 'error': 'hello first'}
+
+        if op == 'state':
+            return session, {'ok': True, **session.snapshot()}
+
+        if session.state != "GAME":
+            return session, {'ok': False, 'error': 'game over', **session.snapshot()}
+
+        if op == 'shoot':
+            part = msg.get('part')
+            if part not in quiz_rules.PARTS:
+                return session, {'ok': False, 'error': 'unknown part'}
+            engine = session.engine
+            if engine.current_question is not None:
+                return session, {'ok': False, 'error': 'answer pending'}
+            engine.apply(('shoot', part))
+            if engine.current_question is None:
+                return session, {'ok': False, 'error': 'empty bank'}
+            session.asked_at = time.perf_counter()
+            return session, {'ok': True, 'part': part,
+                             'question': QuestionBank.public_view(engine.current_question)}
+
+        if op == 'answer':
+            start = time.perf_counter()
+            reply = self._grade(session, msg)
+            self.grading_latency.append(time.perf_counter() - start)
+            return session, reply
+
+        return session, {'ok': False, 'error': f'unknown op {op}'}
+
+    def _grade(self, session, msg):
+        engine = session.engine
+        question = engine.current_question
+        if question is None:
+            return {'ok': False, 'error': 'no question'}
+        part = engine.target_part
+        q_type = question.get('type', 'multiple_choice')
+        answer = msg.get('answer')
+        answers = msg.get('answers') or []
+        if not (_is_index(answer) or answer is None) or \
+                not (isinstance(answers, list) and all(map(_is_index, answers))):
+            return {'ok': False, 'error': 'bad answer'}
+
+        # The request carries the whole answer: replace any earlier selection
+        engine.selected_answer = None
+        engine.selected_answers = []
+        engine.user_input = ""
+        if q_type == 'multiple_choice' and answer is not None:
+            engine.apply(('select', answer))
+        elif q_type == 'true_false':
+            for index in dict.fromkeys(answers):
+                engine.apply(('select', index))
+        elif q_type == 'short_answer':
+            engine.apply(('input', str(msg.get('text', ''))))
+        events = engine.apply(('submit',))
+        if not events:
+            return {'ok': False, 'error': 'empty answer'}
+        is_correct = engine.is_correct
+        if self.analytics is not None:
+            self.analytics.record(session.id, question, part,
+                                  time.perf_counter() - session.asked_at, is_correct, session.class_id)
+
+        # The client plays feedback / death / spawn on its own clock: resolve them now
+        while engine.state == "GAME" and not engine.accepts_input:
+            events += engine.step(max(engine.feedback_timer, engine.transition_timer, 0.0) + 1e-3)
+
+        damage = 0
+        for event in events:
+            if event[0] == 'damage':
+                damage = event[1]
+            elif event[0] == 'game_over':
+                self._finish(session)
+
+        return {
+            'ok': True,
+            'correct': is_correct,
+            'damage': damage,
+            'answer_key': {
+                'correct': question.get('correct'),
+                'correct_answers': question.get('correct_answers', []),
+                'correct_answer': question.get('correct_answer', '')
+            },
+            **session.snapshot()
+        }
+
+    def _finish(self, session):
+        if self.leaderboard is not None:
+            self.leaderboard.add({
+                'name': session.name,
+                **session.engine.result(),
+                'date': datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            })
+
+    # ═══ NETWORK ═══
+
+    async def handle_client(self, reader, writer):
+        session = None
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    msg = json.loads(line)
+                except ValueError:
+                    reply = {'ok': False, 'error': 'bad json'}
+                else:
+                    session, reply = self.handle_request(session, msg)
+                self.requests += 1
+                writer.write(json.dumps(reply, ensure_ascii=False).encode('utf-8') + b"\n")
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            if session is not None:
+                self.sessions.pop(session.id, None)
+            writer.close()
+
+    async def serve(self, host='127.0.0.1', port=8765):
+        server = await asyncio.start_server(self.handle_client, host, port, limit=1 << 20)
+        return server
+
+    def latency_report(self):
+        """p50/p99/max server-side grading latency in milliseconds"""
+        return summarize_ms(self.grading_latency, prefix='grading') | {
+            'sessions': len(self.sessions),
+            'requests': self.requests
+        }
+
+
+def _is_index(value):
+    """Answer index sent by a client (bool is an int subclass, reject it)"""
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def summarize_ms(samples, prefix):
+    ordered = sorted(samples)
+    if not ordered:
+        return {f'{prefix}_count': 0}
+
+    def pct(p):
+        return ordered[min(len(ordered) - 1, int(len(ordered) * p))] * 1000.0
+
+    return {
+        f'{prefix}_count': len(ordered),
+        f'{prefix}_p50_ms': pct(0.50),
+        f'{prefix}_p99_ms': pct(0.99),
+        f'{prefix}_max_ms': ordered[-1] * 1000.0
+    }
+
+
+# ══════════════════════════════════════════════════════════
+#   CLIENT
+# ══════════════════════════════════════════════════════════
+
+class SessionClient:
+    """
+    Blocking protocol client (scripts, RemoteEngine)
+    """
+
+    def __init__(self, host='127.0.0.1', port=8765, timeout=5.0):
+        self.sock = socket.create_connection((host, port), timeout=timeout)
+        self.file = self.sock.makefile('rwb')
+
+    def request(self, **msg):
+        self.file.write(json.dumps(msg, ensure_ascii=False).encode('utf-8') + b"\n")
+        self.file.flush()
+        return json.loads(self.file.readline())
+
+    def hello(self, name):
+        return self.request(op='hello', name=name)
+
+    def shoot(self, part):
+        return self.request(op='shoot', part=part)
+
+    def answer(self, answer=None, answers=None, text=None):
+        msg = {'op': 'answer'}
+        if answer is not None:
+            msg['answer'] = answer
+        if answers is not None:
+            msg['answers'] = list(answers)
+        if text is not None:
+            msg['text'] = text
+        return self.request(**msg)
+
+    def close(self):
+        self.file.close()
+        self.sock.close()
+
+
+class _RemoteQuestions:
+    """Question source of a RemoteEngine: a draw is a shoot request"""
+
+    def __init__(self, engine):
+        self.engine = engine
+        self.questions = ()  # range(bank size) once the server answered hello
+
+    def reset_used_questions(self):
+        pass
+
+    def record_result(self, question, correct):
+        pass  # Recorded by the server
+
+    def has_unused_questions(self):
+        return self.engine.server_state != "WON"
+
+    def get_random_question(self, level=None):
+        reply = self.engine.call(op='shoot', part=self.engine.target_part)
+        return reply['question'] if reply.get('ok') else None
+
+
+class RemoteEngine(GameEngine):
+    """
+    GameEngine of the pygame client playing on a SessionServer
+
+    Question draw and grading run on the server; this copy only plays
+    the feedback / death / spawn timers the renderer shows, from the
+    server's verdicts (same quiz_rules: damage, score and the
+    wrong-answer limit match the server's session)
+    """
+
+    def __init__(self, client, name, class_id=''):
+        """
+        Args:
+            client: Connected SessionClient
+            name: Callable returning the player name (read at start)
+            class_id: Class sent with hello
+        """
+        self.client = client
+        self.name = name
+        self.class_id = class_id
+        self.server_state = "GAME"  # Session state in the server's last reply
+        super().__init__(_RemoteQuestions(self))
+
+    def call(self, **msg):
+        try:
+            return self.client.request(**msg)
+        except (OSError, ValueError) as e:
+            print(f"Mat ket noi toi session server: {e}")
+            return {'ok': False, 'error': 'connection'}
+
+    def start(self):
+        reply = self.call(op='hello', name=self.name(), **{'class': self.class_id})
+        if not reply.get('ok'):
+            return False
+        self.server_state = reply['state']
+        self.question_manager.questions = range(reply.get('questions', 0))
+        return super().start()
+
+    def submit_answer(self):
+        question = self.current_question
+        if question is None or quiz_rules.grade_answer(question, self.selected_answer,
+                                                       self.selected_answers, self.user_input) is None:
+            return []
+        q_type = question.get('type', 'multiple_choice')
+        if q_type == 'multiple_choice':
+            reply = self.call(op='answer', answer=self.selected_answer)
+        elif q_type == 'true_false':
+            reply = self.call(op='answer', answers=list(self.selected_answers))
+        else:
+            reply = self.call(op='answer', text=self.user_input)
+        if not reply.get('ok'):
+            return []
+
+        # Answer key for the feedback screen, then the local timers as usual
+        question.update(reply['answer_key'])
+        self.server_state = reply['state']
+        super().submit_answer()
+        self.is_correct = reply['correct']
+        return [('correct' if self.is_correct else 'wrong', self.target_part)]
+
+
+async def _simulated_student(student_id, host, port, games, round_trips, rng):
+    reader, writer = await asyncio.open_connection(host, port)
+
+    async def call(msg):
+        writer.write(json.dumps(msg).encode('utf-8') + b"\n")
+        await writer.drain()
+        return json.loads(await reader.readline())
+
+    try:
+        for _ in range(games):
+            await call({'op': 'hello', 'name': f"bot{student_id}"})
+            state = "GAME"
+            while state == "GAME":
+                shot = await call({'op': 'shoot', 'part': rng.choice(quiz_rules.PARTS)})
+                if not shot.get('ok'):
+                    break
+                question = shot['question']
+                n = max(1, len(question['answers']))
+                if question['type'] == 'multiple_choice':
+                    msg = {'op': 'answer', 'answer': rng.randrange(n)}
+                elif question['type'] == 'true_false':
+                    msg = {'op': 'answer', 'answers': rng.sample(range(n), rng.randint(1, n))}
+                else:
+                    msg = {'op': 'answer', 'text': rng.choice(['a', 'b', '42'])}
+                start = time.perf_counter()
+                result = await call(msg)
+                round_trips.append(time.perf_counter() - start)
+                state = result.get('state', "LOST")
+    finally:
+        writer.close()
+
+
+async def simulate(students=500, games=5, host='127.0.0.1', port=0, seed=1):
+    """
+    Run a server and N simulated students in one event loop
+
+    Returns:
+        dict: server-side grading and client round-trip latency (ms)
+    """
+    bank = QuestionBank.from_saved_data()
+    if len(bank) == 0:
+        raise SystemExit("Ngan hang cau hoi trong - hay tai file cau hoi truoc")
+    server = SessionServer(bank, seed=seed)
+    tcp = await server.serve(host, port)
+    port = tcp.sockets[0].getsockname()[1]
+
+    rng = random.Random(seed)
+    round_trips = []
+    start = time.perf_counter()
+    async with tcp:
+        await asyncio.gather(*[
+            _simulated_student(i, host, port, games, round_trips, random.Random(rng.random()))
+            for i in range(students)
+        ])
+    elapsed = time.perf_counter() - start
+
+    report = server.latency_report()
+    report.update(summarize_ms(round_trips, prefix='round_trip'))
+    report['students'] = students
+    report['elapsed_s'] = elapsed
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Monster Quiz classroom session server")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--simulate', type=int, metavar='N',
+                        help="Chay N hoc sinh gia lap va in do tre cham diem p99")
+    parser.add_argument('--games', type=int, default=5, help="So van moi hoc sinh gia lap")
+    args = parser.parse_args()
+
+    if args.simulate:
+        report = asyncio.run(simulate(args.simulate, args.games, args.host, 0))
+        for key, value in report.items():
+            print(f"{key:>22}: {value:.3f}" if isinstance(value, float) else f"{key:>22}: {value}")
+        return
+
+    async def run():
+        from leaderboard import LeaderboardStore
+        from analytics import AnswerLog
+        server = SessionServer(QuestionBank.from_saved_data(), leaderboard=LeaderboardStore(),
+                               analytics=AnswerLog())
+        tcp = await server.serve(args.host, args.port)
+        print(f"Session server dang chay tai {args.host}:{args.port} "
+              f"({len(server.bank)} cau hoi)")
+        try:
+            async with tcp:
+                await tcp.serve_forever()
+        finally:
+            server.analytics.close()
+
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,216 @@
+"""
+═══════════════════════════════════════════════════════════════════
+SESSION SNAPSHOT (save / resume an in-progress game)
+═══════════════════════════════════════════════════════════════════
+A game closed mid-run (lab machines shut down mid-lesson) resumes on
+the next launch: score, wrong answers, current monster and its HP,
+the question on screen, used questions and the shuffle RNG.
+
+- capture(): plain builtins -> marshal (compact binary, ~0.1 ms);
+  done on the frame thread so the blob is a consistent frame
+- Autosave: every `interval` s and at every Game.state change; only
+  the disk write runs on a background thread (latest blob wins)
+- Atomic write (tmp file + os.replace): a power cut never leaves a
+  half-written snapshot
+- Only a snapshot taken in state GAME is resumed; a finished run
+  overwrites it with its RESULT state
+
+File: data/session.snap = MAGIC + marshal blob
+═══════════════════════════════════════════════════════════════════
+"""
+
+import marshal
+import os
+import threading
+import time
+
+import pygame
+
+
+MAGIC = b"MQS1"
+VERSION = 1
+DEFAULT_PATH = 'data/session.snap'
+
+
+# ══════════════════════════════════════════════════════════
+#   CAPTURE / RESTORE
+# ══════════════════════════════════════════════════════════
+
+def capture(game):
+    """
+    Args:
+        game: Game instance
+
+    Returns:
+        bytes: Snapshot blob
+    """
+    data = {
+        'version': VERSION,
+        'time': time.time(),
+        'state': game.state,
+        'player_name': game.player_name,
+        'session_id': game.session_id,
+        'class_id': game.class_id,
+        'engine': game.engine.snapshot(),
+        'monster_hp': [monster.hp for monster in game.monsters],
+        'questions': game.question_manager.session_state()
+    }
+    return MAGIC + marshal.dumps(data, 4)
+
+
+def decode(blob):
+    """
+    Returns:
+        dict | None: Snapshot data, None if the blob is not a valid snapshot
+    """
+    if not blob or not blob.startswith(MAGIC):
+        return None
+    try:
+        data = marshal.loads(blob[len(MAGIC):])
+    except (EOFError, ValueError, TypeError):
+        return None
+    if not isinstance(data, dict) or data.get('version') != VERSION:
+        return None
+    return data
+
+
+def restore(game, data):
+    """
+    Put a game back into the snapshot's run
+
+    Args:
+        game: Freshly created Game
+        data: decode() result
+
+    Returns:
+        bool: False if there is nothing to resume (finished run, other question bank)
+    """
+    if data.get('state') != "GAME" or data['engine'].get('state') != "GAME":
+        return False
+    if not game.question_manager.restore_session(data['questions']):
+        print("Bo cau hoi da thay doi, khong tiep tuc van choi cu")
+        return False
+
+    game.engine.restore(data['engine'])
+    for monster, hp in zip(game.monsters, data.get('monster_hp', ())):
+        monster.reset()
+        monster.hp = hp
+    game.player_name = data.get('player_name', "")
+    game.session_id = data.get('session_id')
+    game.class_id = game.class_id or data.get('class_id', '')
+    game.state = "GAME"
+    pygame.mouse.set_visible(False)
+    return True
+
+
+# ══════════════════════════════════════════════════════════
+#   FILE I/O
+# ══════════════════════════════════════════════════════════
+
+def write_atomic(path, blob):
+    folder = os.path.dirname(path)
+    if folder:
+        os.makedirs(folder, exist_ok=True)
+    tmp = path + ".tmp"
+    with open(tmp, 'wb') as f:
+        f.write(blob)
+    os.replace(tmp, path)
+
+
+def load(path=DEFAULT_PATH):
+    """
+    Returns:
+        dict | None: Snapshot data from disk
+    """
+    try:
+        with open(path, 'rb') as f:
+            return decode(f.read())
+    except OSError:
+        return None
+
+
+def resume(game, path=DEFAULT_PATH):
+    """Restore the last in-progress game on launch; True if one was resumed"""
+    data = load(path)
+    if data is None or not restore(game, data):
+        return False
+    print(f"Tiep tuc van choi cua {game.player_name} (diem {game.engine.score})")
+    return True
+
+
+# ══════════════════════════════════════════════════════════
+#   AUTOSAVE
+# ══════════════════════════════════════════════════════════
+
+class Autosaver:
+    """
+    Periodic + on-transition snapshots, written by a background thread
+    """
+
+    def __init__(self, path=DEFAULT_PATH, interval=5.0):
+        """
+        Args:
+            path: Snapshot file
+            interval: Seconds between periodic snapshots while in GAME
+        """
+        self.path = path
+        self.interval = interval
+        self._elapsed = 0.0
+        self._last_state = None
+        self._pending = None
+        self._cond = threading.Condition()
+        self._stopping = False
+        self._thread = threading.Thread(target=self._writer, name="session-autosave", daemon=True)
+        self._thread.start()
+
+    def tick(self, game, dt):
+        """
+        Call once per frame
+
+        Args:
+            game: Game instance
+            dt: Frame time in seconds
+        """
+        self._elapsed += dt
+        transition = game.state != self._last_state
+        periodic = game.state == "GAME" and self._elapsed >= self.interval
+        if transition and self._last_state is None:
+            transition = False  # launch: keep the snapshot until something changes
+        self._last_state = game.state
+        if transition or periodic:
+            self.save(game)
+
+    def save(self, game):
+        """Snapshot now (blob built here, written in the background)"""
+        self._elapsed = 0.0
+        blob = capture(game)
+        with self._cond:
+            self._pending = blob
+            self._cond.notify()
+
+    def _writer(self):
+        while True:
+            with self._cond:
+                while self._pending is None and not self._stopping:
+                    self._cond.wait()
+                blob, self._pending = self._pending, None
+                if blob is None:
+                    return
+            try:
+                write_atomic(self.path, blob)
+            except OSError as e:
+                print(f"Khong luu duoc phien choi: {e}")
+
+    def close(self, game=None):
+        """
+        Final snapshot (if game given) and stop the writer
+
+        Args:
+            game: Game to save one last time, e.g. on window close
+        """
+        if game is not None:
+            self.save(game)
+        with self._cond:
+            self._stopping = True
+            self._cond.notify()
+        self._thread.join(5.0)
@@ -0,0 +1,109 @@
+"""
+═══════════════════════════════════════════════════════════════════
+TEXT METRICS (cached glyph advances)
+═══════════════════════════════════════════════════════════════════
+Width arithmetic without rendering:
+
+- One font.metrics() lookup per (font, character), cached
+- prefix_widths(text): P[i] = width of text[:i], O(n)
+- fit_tail / fit_head / caret_x: bisect on the prefix array instead
+  of render-and-measure loops (O(n), not O(n^2) renders)
+
+Widths are sums of advances (no kerning): close enough to decide
+where to cut, the single final render is still exact.
+═══════════════════════════════════════════════════════════════════
+"""
+
+import bisect
+
+
+class FontMetrics:
+    """
+    Advance-width cache of one pygame font
+    """
+
+    def __init__(self, font):
+        self.font = font
+        self.advances = {}
+
+    def advance(self, ch):
+        adv = self.advances.get(ch)
+        if adv is None:
+            try:
+                m = self.font.metrics(ch)[0]
+                adv = m[4] if m is not None else self.font.size(ch)[0]
+            except Exception:
+                adv = self.font.size(ch)[0] if ch else 0
+            self.advances[ch] = adv
+        return adv
+
+    def width(self, text):
+        adv = self.advance
+        return sum(adv(ch) for ch in text)
+
+    def prefix_widths(self, text):
+        """
+        Returns:
+            list: len(text) + 1 cumulative widths, P[0] = 0
+        """
+        adv = self.advance
+        widths = [0]
+        total = 0
+        for ch in text:
+            total += adv(ch)
+            widths.append(total)
+        return widths
+
+    def fit_tail(self, text, max_width):
+        """
+        Longest suffix that fits (input fields scroll to show the end)
+
+        Returns:
+            str: text[start:]
+        """
+        widths = self.prefix_widths(text)
+        over = widths[-1] - max_width
+        if over <= 0:
+            return text
+        return text[bisect.bisect_left(widths, over):]
+
+    def fit_head(self, text, max_width, ellipsis="..."):
+        """
+        Longest prefix that fits, with ellipsis if cut
+
+        Returns:
+            str: Fitted text
+        """
+        widths = self.prefix_widths(text)
+        if widths[-1] <= max_width:
+            return text
+        room = max_width - self.width(ellipsis)
+        return text[:max(0, bisect.bisect_right(widths, room) - 1)] + ellipsis
+
+    def caret_x(self, text, index):
+        """x offset of a caret before text[index]"""
+        return self.width(text[:index])
+
+    def wrap(self, text, max_width):
+        """
+        Word wrap (same rules as UI.wrap_text)
+
+        Returns:
+            list: Lines
+        """
+        space = self.advance(' ')
+        lines = []
+        cur = []
+        cur_w = 0
+        for word in text.split(' '):
+            w = self.width(word)
+            if not cur or cur_w + space + w <= max_width:
+                cur_w = cur_w + space + w if cur else w
+                cur.append(word)
+            else:
+                lines.append(' '.join(cur))
+                cur = [word]
+                cur_w = w
+        if cur:
+            lines.append(' '.join(cur))
+        return lines or [""]
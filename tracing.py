@@ -0,0 +1,167 @@
+"""
+═══════════════════════════════════════════════════════════════════
+FRAME PHASE TRACING (Chrome / Perfetto trace-event export)
+═══════════════════════════════════════════════════════════════════
+python main.py --trace        (start traced)
+F9 in game                    (start / stop + export)
+
+- Wraps TRACE_POINTS with begin ("B") / end ("E") events
+- Events go to an in-memory ring buffer (last `capacity` events):
+  tracing for hours never grows memory
+- Export: data/trace-<time>.json -> open in chrome://tracing or
+  ui.perfetto.dev
+- Disabled = the original functions are put back: zero overhead,
+  so it stays built in and can be switched on in the field
+═══════════════════════════════════════════════════════════════════
+"""
+
+import collections
+import functools
+import importlib
+import json
+import os
+import threading
+import time
+
+
+# (module, class or None, attribute)
+TRACE_POINTS = (
+    ('game', 'Game', 'handle_event'),
+    ('game', 'Game', 'update'),
+    ('game', 'Game', 'draw'),
+    ('ui', 'UI', 'draw_background'),
+    ('monster', 'Monster', 'draw'),
+    ('ui', 'UI', 'draw_hud'),
+    ('ui', 'UI', 'draw_gun'),
+    ('ui', 'UI', 'draw_question_panel'),
+    ('pygame.display', None, 'flip'),
+)
+
+
+class Tracer:
+    """
+    Ring buffer of begin/end events + the wrappers feeding it
+    """
+
+    def __init__(self, capacity=200000, folder='data'):
+        """
+        Args:
+            capacity: Events kept (oldest dropped first)
+            folder: Where export() writes trace files
+        """
+        self.events = collections.deque(maxlen=capacity)
+        self.folder = folder
+        self.enabled = False
+        self._originals = []  # (owner, attribute, original)
+        self._epoch = time.perf_counter()
+
+    # ══════════════════════════════════════════════════════════
+    #   ON / OFF
+    # ══════════════════════════════════════════════════════════
+
+    def _wrap(self, name, func):
+        events = self.events
+        clock = time.perf_counter
+        epoch = self._epoch
+        get_tid = threading.get_ident
+
+        @functools.wraps(func)
+        def traced(*args, **kwargs):
+            tid = get_tid()
+            events.append((name, 'B', clock() - epoch, tid))
+            try:
+                return func(*args, **kwargs)
+            finally:
+                events.append((name, 'E', clock() - epoch, tid))
+
+        traced.__traced__ = func
+        return traced
+
+    def enable(self, points=TRACE_POINTS):
+        """Install the wrappers"""
+        if self.enabled:
+            return
+        for module_name, class_name, attr in points:
+            try:
+                owner = importlib.import_module(module_name)
+                if class_name is not None:
+                    owner = getattr(owner, class_name)
+                original = getattr(owner, attr)
+            except (ImportError, AttributeError):
+                continue
+            label = f"{class_name}.{attr}" if class_name else f"{module_name}.{attr}"
+            setattr(owner, attr, self._wrap(label, original))
+            self._originals.append((owner, attr, original))
+        self.enabled = True
+        print("Tracing: BAT (F9 de dung va xuat file)")
+
+    def disable(self):
+        """Put the original functions back"""
+        for owner, attr, original in reversed(self._originals):
+            setattr(owner, attr, original)
+        self._originals = []
+        self.enabled = False
+
+    def toggle(self):
+        """Hotkey: start tracing, or stop and export"""
+        if self.enabled:
+            self.disable()
+            return self.export()
+        self.events.clear()
+        self.enable()
+        return None
+
+    # ══════════════════════════════════════════════════════════
+    #   EXPORT
+    # ══════════════════════════════════════════════════════════
+
+    def trace_events(self):
+        """
+        Returns:
+            list: Chrome trace-event dicts (ts in microseconds)
+        """
+        pid = os.getpid()
+        out = []
+        open_spans = collections.Counter()
+        for name, ph, ts, tid in list(self.events):
+            if ph == 'E':
+                # Ring buffer may have dropped the matching begin
+                if not open_spans[(name, tid)]:
+                    continue
+                open_spans[(name, tid)] -= 1
+            else:
+                open_spans[(name, tid)] += 1
+            out.append({'name': name, 'ph': ph, 'ts': round(ts * 1e6, 1), 'pid': pid, 'tid': tid})
+        return out
+
+    def export(self, path=None):
+        """
+        Write the buffer as trace JSON
+
+        Args:
+            path: Output file (default data/trace-YYYYmmdd-HHMMSS.json)
+
+        Returns:
+            str | None: Path written
+        """
+        if not self.events:
+            return None
+        if path is None:
+            path = os.path.join(self.folder, time.strftime("trace-%Y%m%d-%H%M%S.json"))
+        try:
+            folder = os.path.dirname(path)
+            if folder:
+                os.makedirs(folder, exist_ok=True)
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump({'traceEvents': self.trace_events(), 'displayTimeUnit': 'ms'}, f)
+        except OSError as e:
+            print(f"Khong ghi duoc trace: {e}")
+            return None
+        print(f"Da ghi trace: {path} (mo bang chrome://tracing hoac ui.perfetto.dev)")
+        return path
+
+    def close(self):
+        """At exit: export if tracing, then unwrap"""
+        path = self.export() if self.enabled else None
+        self.disable()
+        return path
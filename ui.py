@@ -2,12 +2,55 @@ import pygame
 import os
 import math
 import random
+import muzzle_flash
+from animation import FLASH_TIME, gun_animation
+from asset_cache import AssetCache
+from text_metrics import FontMetrics
+
+# Unit hexagon (pointy sides left/right), angles 30 + 60*i
+HEX_UNIT = tuple((math.cos(math.radians(60 * i + 30)), math.sin(math.radians(60 * i + 30)))
+                 for i in range(6))
+
+# File manager list viewport (x, y, w, h) and row geometry
+FILE_LIST_RECT = (100, 185, 520, 425)
+FILE_ROW_STEP = 85
+FILE_ROW_H = 75
+
+# Wall panel indicator lights: lit one phase in 4
+PANEL_LIGHT_MS = 580
 
 class UI:
-    def __init__(self, width, height):
+    def __init__(self, width, height, persist=True):
         self.width  = width
         self.height = height
         pygame.font.init()
+        
+        # Baked layers (see asset_cache.py); persist=False never writes data/asset_cache
+        self.asset_cache = AssetCache(persist=persist)
+        self._bg_static = None
+        self._bg_light_patches = None  # [(panel index, pos, lit pixels)] (see _load_background_static)
+        self._bg_panels = None
+        self._hex_floor = None
+        self._name_input_static = None
+        self._name_text_cache = {}
+        self._file_row_cache = {}  # file record values -> row surface
+        self._file_delete_btn = None  # "Xoa" button surfaces (normal, hover)
+        self._font_metrics = {}  # font -> FontMetrics (glyph advances)
+        self._text_cache = {}  # (font, text, color) -> rendered line
+        
+        # Gun recoil / kickback / flash (see animation.py; advanced by update_animations)
+        self.anim = gun_animation()
+        
+        # File manager list: scroll offset (px) + kinetic velocity (px/s)
+        self._file_scroll = 0.0
+        self._file_scroll_velocity = 0.0
+        self._file_drag = None  # (last mouse y, last time) while dragging
+        
+        # Optional layer compositor (sdl2_backend.Sdl2Backend): baked layers become
+        # textures under the frame instead of being blitted into it
+        self.compositor = None
+        self._bg_dynamic_layer = None  # (surface, area) while compositing
+        self._bg_dynamic_key = None
 
         font_file = 'fonts/DejaVuSans.ttf'
         if os.path.exists(font_file):
@@ -19,11 +62,6 @@ class UI:
                 self.tiny_font   = pygame.font.Font(font_file, 21)
                 self.micro_font  = pygame.font.Font(font_file, 17)
                 self.buttons = {}
-                # Animation states
-                self._gun_recoil = 0.0
-                self._gun_kickback = 0.0
-                self._muzzle_flash_timer = 0.0
-                self._shoot_frame = 0
                 print("OK Font DejaVuSans")
                 return
             except: pass
@@ -36,24 +74,26 @@ class UI:
         self.medium_font=mk(36); self.small_font=mk(28)
         self.tiny_font=mk(21); self.micro_font=mk(17)
         self.buttons={}
-        self._gun_recoil=0.0; self._gun_kickback=0.0
-        self._muzzle_flash_timer=0.0; self._shoot_frame=0
 
     # ══════════════════════════════════════════════════════════
     #   HELPER FUNCTIONS
     # ══════════════════════════════════════════════════════════
     def wrap_text(self, text, font, max_width):
-        words=text.split(' '); lines=[]; cur=[]
-        for w in words:
-            test=' '.join(cur+[w])
-            try:
-                if font.size(test)[0]<=max_width: cur.append(w)
-                else:
-                    if cur: lines.append(' '.join(cur))
-                    cur=[w]
-            except: cur.append(w)
-        if cur: lines.append(' '.join(cur))
-        return lines or [""]
+        return self.metrics(font).wrap(text, max_width)
+
+    def metrics(self, font):
+        m=self._font_metrics.get(font)
+        if m is None: m=self._font_metrics[font]=FontMetrics(font)
+        return m
+
+    def render_cached(self, font, text, color):
+        """safe_render, rendered once per distinct (font, text, color)"""
+        key=(font,text,color)
+        s=self._text_cache.get(key)
+        if s is None:
+            if len(self._text_cache)>256: self._text_cache.clear()
+            s=self._text_cache[key]=self.safe_render(font,text,color)
+        return s
 
     def safe_render(self, font, text, color):
         try: return font.render(text, True, color)
@@ -67,7 +107,7 @@ class UI:
         ts=self.safe_render(self.medium_font,text,(255,255,255))
         if ts.get_width()>w-10: ts=self.safe_render(self.small_font,text,(255,255,255))
         screen.blit(ts,ts.get_rect(center=(x+w//2,y+h//2)))
-        self.buttons[bid]=(x,y,w,h)
+        if bid is not None: self.buttons[bid]=(x,y,w,h)
 
     def check_button_click(self,x,y,bid):
         if bid in self.buttons:
@@ -75,15 +115,72 @@ class UI:
             return bx<=x<=bx+bw and by<=y<=by+bh
         return False
 
+    def preload_assets(self):
+        """Load (or bake on first launch) the cached layers before the first frame"""
+        self.static_background()
+        muzzle_flash.shared_bank().prewarm()
+
+    def _load_background_static(self):
+        """
+        Static layer with every panel light off + the lit pixels of each light
+        
+        The panel lights sit under the ceiling lights / fog / doorway, so their
+        lit state is baked in that same order and only each light's own rect is
+        kept (an atlas, see _bake_panel_light_atlas) and blitted per frame.
+        """
+        size = (self.width, self.height)
+        static = self.asset_cache.get('background_static', size, self._bake_background_static)
+        lights, atlas_size = self._panel_light_layout()
+        patches = []
+        if lights:
+            atlas = self.asset_cache.get('background_panel_lights', atlas_size,
+                                         lambda surface: self._bake_panel_light_atlas(surface, lights))
+            patches = [(i, rect.topleft, atlas.subsurface((atlas_x, 0, rect.w, rect.h)))
+                       for i, rect, atlas_x in lights]
+        self._bg_light_patches = patches
+        return static
+    
+    def _panel_light_layout(self):
+        """
+        Returns:
+            tuple: ([(panel index, screen rect, atlas x)], atlas size)
+        """
+        bounds = pygame.Rect(0, 0, self.width, self.height)
+        lights = []
+        atlas_w = atlas_h = 0
+        for x, y, w, h, depth, i in self._background_panels():
+            rect = self._panel_light_rect(x, y, w, h, depth)
+            if rect is None:
+                continue
+            rect = rect.clip(bounds)
+            lights.append((i, rect, atlas_w))
+            atlas_w += rect.w
+            atlas_h = max(atlas_h, rect.h)
+        return lights, (atlas_w, atlas_h)
+    
+    def _bake_panel_light_atlas(self, atlas, lights):
+        # Lights blink in 4 phase groups (index % 4); lights of one group are lit
+        # together, so each group gets its own full bake and overlapping rects
+        # of different groups never carry each other's light
+        full = pygame.Surface((self.width, self.height))
+        for group in range(4):
+            self._bake_background_static(full, lit_group=group)
+            for i, rect, atlas_x in lights:
+                if i % 4 == group:
+                    atlas.blit(full, (atlas_x, 0), rect)
+
     # ══════════════════════════════════════════════════════════
     #   TRIGGER SHOOT EFFECT
     # ══════════════════════════════════════════════════════════
     def trigger_shoot_effect(self):
         """Trigger shooting animation"""
-        self._gun_recoil = 1.0
-        self._gun_kickback = 25.0
-        self._muzzle_flash_timer = 0.15
-        self._shoot_frame = 0
+        self.anim.kick('recoil', 1.0)
+        self.anim.kick('kickback', 25.0)
+        self.anim.kick('flash', FLASH_TIME)
+
+    def update_animations(self, dt):
+        """Advance recoil / flash / sway once per frame (draw code only reads them)"""
+        self.anim.update(dt)
 
     # ══════════════════════════════════════════════════════════
     #   ★★★ ULTRA BEAUTIFUL DOOM BACKGROUND ★★★
@@ -98,9 +195,116 @@ class UI:
         - Volumetric ceiling lights
         - Atmospheric depth fog
         - Industrial doorway nơi monster đứng
+        
+        Static layer is baked once (AssetCache, persisted under data/);
+        only the blinking/animated details are drawn per frame.
+        Post effects that belong under the lights (FPSRenderer's depth of
+        field) call the two halves separately.
         """
-        W, H = self.width, self.height
+        self.draw_background_static(screen)
+        self.draw_background_dynamic(screen)
+    
+    def static_background(self):
+        """The baked static background layer (loaded / baked on first use)"""
+        if self._bg_static is None:
+            self._bg_static = self._load_background_static()
+        return self._bg_static
+    
+    def draw_background_static(self, screen):
+        """Baked corridor (every blinking light off)"""
+        static = self.static_background()
+        if self.compositor is not None:
+            self.compositor.queue_layer('background_static', static)
+        else:
+            screen.blit(static, (0, 0))
+    
+    def draw_background_dynamic(self, screen):
+        """Blinking / animated details over the static layer"""
         t = pygame.time.get_ticks()
+        if self.compositor is None:
+            self._draw_background_dynamic(screen, t)
+            return
+        
+        # Compositing: a layer of its own, re-baked only when a blink / stripe step changes
+        if self._bg_dynamic_layer is None:
+            self._bg_dynamic_layer = (pygame.Surface((self.width, self.height), pygame.SRCALPHA),
+                                      self._background_dynamic_areas())
+        layer, areas = self._bg_dynamic_layer
+        key = (t // 95, t // 420, t // PANEL_LIGHT_MS, t // 750)
+        if key != self._bg_dynamic_key:
+            for rect in areas:
+                layer.fill((0, 0, 0, 0), rect)
+            self._draw_background_dynamic(layer, t)
+            self._bg_dynamic_key = key
+        self.compositor.queue_layer('background_dynamic', layer, area=areas, version=key)
+    
+    def _background_dynamic_areas(self):
+        """Rects holding everything _draw_background_dynamic draws (may overlap)"""
+        self.static_background()  # sets the light patches
+        door_w, door_h = 250, 275
+        door_x = (self.width - door_w) // 2
+        door_y = self.height // 2 - door_h // 2
+        glow = 28 + 4 * 15  # widest warning light glow
+        areas = [pygame.Rect(0, 0, glow * 2 + 1, glow * 2 + 1).move(x - glow, door_y + 30 - glow)
+                 for x in (door_x - 30, door_x + door_w + 18)]
+        areas += [pygame.Rect(door_x - 46, y, door_w + 124, 8)  # hazard stripes
+                  for y in (door_y - 11, door_y + door_h + 3)]
+        warning = pygame.Rect((0, 0), self.tiny_font.size("⚠ DANGER ZONE ⚠"))
+        warning.center = (door_x + door_w // 2, door_y - 28)
+        areas.append(warning.inflate(4, 4))
+        areas += [patch.get_rect(topleft=pos) for _, pos, patch in self._bg_light_patches]
+        return areas
+    
+    def _background_panels(self):
+        """Wall panel rects (x, y, w, h, depth, index) - also used for their lights"""
+        if self._bg_panels is not None:
+            return self._bg_panels
+        W, H = self.width, self.height
+        vanish_y = H // 2
+        wall_left_near = int(W * 0.02)
+        wall_left_far = int(W * 0.22)
+        wall_right_near = int(W * 0.98)
+        wall_right_far = int(W * 0.78)
+        
+        panels = []
+        num_panels = 10
+        for i in range(num_panels):
+            depth = i / num_panels
+            
+            # Calculate panel position với perspective
+            panel_y_top = int(vanish_y - 115 + (H * 0.2 - vanish_y + 115) * depth)
+            panel_y_bot = int(vanish_y + 115 + (H - vanish_y - 115) * depth)
+            
+            if panel_y_bot >= H or panel_y_top < 0:
+                continue
+            
+            panel_h = panel_y_bot - panel_y_top
+            
+            # Left panels
+            panel_x_l = int(wall_left_near + (wall_left_far - wall_left_near) * (1 - depth))
+            panel_w_l = max(28, int(48 * (1 - depth * 0.65)))
+            
+            if panel_x_l > 15 and panel_x_l < W * 0.35:
+                panels.append((panel_x_l - panel_w_l, panel_y_top, panel_w_l, panel_h, depth, i))
+            
+            # Right panels
+            panel_x_r = int(wall_right_near + (wall_right_far - wall_right_near) * (1 - depth))
+            panel_w_r = max(28, int(48 * (1 - depth * 0.65)))
+            
+            if panel_x_r < W - 15 and panel_x_r > W * 0.65:
+                panels.append((panel_x_r, panel_y_top, panel_w_r, panel_h, depth, i))
+        
+        self._bg_panels = panels
+        return panels
+    
+    def _bake_background_static(self, screen, lit_group=None):
+        """
+        Vẽ tất cả phần tĩnh của background (không phụ thuộc thời gian)
+        
+        Args:
+            lit_group: Draw the panel lights with index % 4 == lit_group lit
+        """
+        W, H = self.width, self.height
         
         # ═══ CEILING GRADIENT (DARK SKY) ═══
         for y in range(H // 2):
@@ -171,34 +375,10 @@ class UI:
         screen.blit(shadow_surf, (0, 0))
         
         # ═══ DETAILED WALL PANELS với RIVETS ═══
-        num_panels = 10
-        for i in range(num_panels):
-            depth = i / num_panels
-            
-            # Calculate panel position với perspective
-            panel_y_top = int(vanish_y - 115 + (H * 0.2 - vanish_y + 115) * depth)
-            panel_y_bot = int(vanish_y + 115 + (H - vanish_y - 115) * depth)
-            
-            if panel_y_bot >= H or panel_y_top < 0:
-                continue
-            
-            panel_h = panel_y_bot - panel_y_top
-            
-            # Left panels
-            panel_x_l = int(wall_left_near + (wall_left_far - wall_left_near) * (1 - depth))
-            panel_w_l = max(28, int(48 * (1 - depth * 0.65)))
-            
-            if panel_x_l > 15 and panel_x_l < W * 0.35:
-                self._draw_industrial_panel(screen, panel_x_l - panel_w_l, panel_y_top,
-                                            panel_w_l, panel_h, depth, t, i, True)
-            
-            # Right panels
-            panel_x_r = int(wall_right_near + (wall_right_far - wall_right_near) * (1 - depth))
-            panel_w_r = max(28, int(48 * (1 - depth * 0.65)))
-            
-            if panel_x_r < W - 15 and panel_x_r > W * 0.65:
-                self._draw_industrial_panel(screen, panel_x_r, panel_y_top,
-                                            panel_w_r, panel_h, depth, t, i, False)
+        for x, y, w, h, depth, i in self._background_panels():
+            self._draw_industrial_panel(screen, x, y, w, h, depth)
+            if lit_group is not None and i % 4 == lit_group:
+                self._draw_panel_light(screen, x, y, w, h, depth, (-i % 4) * PANEL_LIGHT_MS, i)
         
         # ═══ VOLUMETRIC CEILING LIGHTS ═══
         num_lights = 7
@@ -215,28 +395,10 @@ class UI:
                 
                 if fixture_w > 18:
                     self._draw_volumetric_light(screen, light_x, light_y, 
-                                                fixture_w, fixture_h, depth, t, i)
+                                                fixture_w, fixture_h, depth, 0, i)
         
         # ═══ HEXAGONAL FLOOR GRID ═══
-        grid_start_y = vanish_y + 145
-        hex_base_size = 48
-        
-        for row in range(9):
-            row_depth = row / 9
-            row_y = int(grid_start_y + row * 38 + row_depth * 25)
-            
-            if row_y <= H // 2 or row_y >= H:
-                continue
-            
-            scale = 1.0 - row_depth * 0.55
-            hex_size = int(hex_base_size * scale)
-            num_hex = int(6 + row * 0.9)
-            
-            for col in range(-num_hex // 2, num_hex // 2 + 1):
-                hex_x = int(vanish_x + col * hex_size * 1.65 * scale)
-                
-                if -hex_size < hex_x < W + hex_size:
-                    self._draw_hex_tile(screen, hex_x, row_y, hex_size, row_depth, t, row, col)
+        self._draw_hex_floor(screen)
         
         # ═══ ATMOSPHERIC FOG OVERLAY ═══
         fog_surf = pygame.Surface((W, H // 3), pygame.SRCALPHA)
@@ -272,6 +434,30 @@ class UI:
                            (0, y), (door_w, y))
         screen.blit(interior_surf, (door_x, door_y))
         
+        # Warning light housings (unlit state, lit state is drawn per frame)
+        for offset_x in (-30, door_w + 18):
+            light_x = door_x + offset_x
+            light_y = door_y + 30
+            pygame.draw.circle(screen, (78, 26, 26), (light_x, light_y), 13)
+            pygame.draw.circle(screen, (95, 16, 16), (light_x, light_y), 10)
+    
+    def _draw_background_dynamic(self, screen, t):
+        """Blinking panel lights, warning lights, hazard stripes, warning text"""
+        W, H = self.width, self.height
+        vanish_y = H // 2
+        
+        # Panel lights: lit pixels baked in draw order (under fog / doorway)
+        phase = t // PANEL_LIGHT_MS
+        for i, pos, patch in self._bg_light_patches:
+            if (phase + i) % 4 == 0:
+                screen.blit(patch, pos)
+        
+        door_w = 250
+        door_h = 275
+        door_x = (W - door_w) // 2
+        door_y = vanish_y - door_h // 2
+        frame_t = 14
+        
         # Blinking warning lights (red)
         for side, offset_x in [("left", -30), ("right", door_w + 18)]:
             light_x = door_x + offset_x
@@ -296,9 +482,6 @@ class UI:
                     pygame.draw.circle(glow_surf, (*light_color, alpha), 
                                      (glow_r, glow_r), glow_r)
                     screen.blit(glow_surf, (light_x - glow_r, light_y - glow_r))
-            else:
-                pygame.draw.circle(screen, (78, 26, 26), (light_x, light_y), 13)
-                pygame.draw.circle(screen, (95, 16, 16), (light_x, light_y), 10)
         
         # Animated hazard stripes
         stripe_w = 32
@@ -323,8 +506,8 @@ class UI:
             warning = self.tiny_font.render("⚠ DANGER ZONE ⚠", True, (255, 195, 0))
             screen.blit(warning, warning.get_rect(center=(door_x + door_w // 2, door_y - 28)))
     
-    def _draw_industrial_panel(self, screen, x, y, w, h, depth, time_ms, index, is_left):
-        """Vẽ wall panel với industrial details"""
+    def _draw_industrial_panel(self, screen, x, y, w, h, depth):
+        """Vẽ wall panel với industrial details (phần tĩnh)"""
         if h < 12 or w < 12:
             return
         
@@ -372,17 +555,34 @@ class UI:
                 # Rivet center
                 pygame.draw.circle(screen, (36, 42, 52), (int(rx), int(ry)), 
                                  max(1, rivet_r - 2))
-        
-        # Blinking indicator light
-        if h > 32:
-            light_phase = (time_ms // 580 + index) % 4
+    
+    def _panel_light_geometry(self, x, y, w, h, depth):
+        """(light_x, light_y, light_w, light_h) of a panel's indicator, None if it has none"""
+        if h < 12 or w < 12 or h <= 32:
+            return None
+        return (int(x + w // 2), int(y + h * 0.14),
+                max(4, int(19 * (1 - depth * 0.55))), max(3, int(10 * (1 - depth * 0.55))))
+    
+    def _panel_light_rect(self, x, y, w, h, depth):
+        """Every pixel _draw_panel_light can touch (bar + glow)"""
+        geometry = self._panel_light_geometry(x, y, w, h, depth)
+        if geometry is None:
+            return None
+        light_x, light_y, light_w, light_h = geometry
+        rect = pygame.Rect(light_x - light_w // 2, light_y, light_w, light_h)
+        if light_w > 6:
+            rect.union_ip((light_x - light_w, light_y - light_h // 2, light_w * 2, light_h * 2))
+        return rect
+    
+    def _draw_panel_light(self, screen, x, y, w, h, depth, time_ms, index):
+        """Blinking indicator light của wall panel"""
+        geometry = self._panel_light_geometry(x, y, w, h, depth)
+        if geometry is not None:
+            light_phase = (time_ms // PANEL_LIGHT_MS + index) % 4
             
             if light_phase == 0:
                 light_color = (0, 255, 135)
-                light_y = int(y + h * 0.14)
-                light_x = int(x + w // 2)
-                light_w = max(4, int(19 * (1 - depth * 0.55)))
-                light_h = max(3, int(10 * (1 - depth * 0.55)))
+                light_x, light_y, light_w, light_h = geometry
                 
                 # Light bar
                 pygame.draw.rect(screen, light_color, 
@@ -422,49 +622,93 @@ class UI:
                                   (0, 0, glow_w, glow_h))
                 screen.blit(glow_surf, (int(x - glow_w // 2), int(y + h - 6)))
     
-    def _draw_hex_tile(self, screen, cx, cy, size, depth, time_ms, row, col):
-        """Vẽ hexagonal floor tile"""
-        if size < 6:
-            return
+    def _hex_floor_table(self):
+        """
+        Hexagonal floor geometry, computed once per resolution
         
-        # Hexagon points
-        points = []
-        for i in range(6):
-            angle = math.radians(60 * i + 30)
-            px = cx + int(math.cos(angle) * size)
-            py = cy + int(math.sin(angle) * size)
-            points.append((px, py))
-        
-        # Tile color với depth darkening
-        darkness = 1.0 - depth * 0.52
-        tile_r = int(35 * darkness)
-        tile_g = int(39 * darkness)
-        tile_b = int(49 * darkness)
-        
-        # Subtle pattern variation
-        pattern = (row + col) % 3
-        if pattern == 1:
-            tile_r += 4
-            tile_g += 4
-        elif pattern == 2:
-            tile_b += 5
-        
-        # Draw hexagon
-        pygame.draw.polygon(screen, (tile_r, tile_g, tile_b), points)
-        pygame.draw.polygon(screen, (tile_r + 10, tile_g + 10, tile_b + 14), points, 
-                          max(1, int(2 * (1 - depth * 0.45))))
-        
-        # Inner detail line
-        if size > 14:
-            inner_points = []
-            for i in range(6):
-                angle = math.radians(60 * i + 30)
-                px = cx + int(math.cos(angle) * size * 0.68)
-                py = cy + int(math.sin(angle) * size * 0.68)
-                inner_points.append((px, py))
+        Returns:
+            list: Rows (row_y, size, outer, inner, edge_width, tiles) where
+                  outer/inner are vertex offsets from the tile centre and
+                  tiles is [(cx, fill, edge, inner_color), ...]
+        """
+        key = (self.width, self.height)
+        if self._hex_floor is not None and self._hex_floor[0] == key:
+            return self._hex_floor[1]
+        
+        W, H = self.width, self.height
+        vanish_x = W // 2
+        grid_start_y = H // 2 + 145
+        hex_base_size = 48
+        
+        rows = []
+        for row in range(9):
+            row_depth = row / 9
+            row_y = int(grid_start_y + row * 38 + row_depth * 25)
+            
+            if row_y <= H // 2 or row_y >= H:
+                continue
             
-            pygame.draw.polygon(screen, (tile_r + 6, tile_g + 6, tile_b + 10), 
-                              inner_points, 1)
+            scale = 1.0 - row_depth * 0.55
+            hex_size = int(hex_base_size * scale)
+            if hex_size < 6:
+                continue
+            num_hex = int(6 + row * 0.9)
+            
+            # Same size for the whole row: one vertex table per row
+            outer = [(int(cx * hex_size), int(cy * hex_size)) for cx, cy in HEX_UNIT]
+            inner = [(int(cx * hex_size * 0.68), int(cy * hex_size * 0.68)) for cx, cy in HEX_UNIT] \
+                if hex_size > 14 else None
+            edge_width = max(1, int(2 * (1 - row_depth * 0.45)))
+            
+            # Tile color với depth darkening
+            darkness = 1.0 - row_depth * 0.52
+            tiles = []
+            for col in range(-num_hex // 2, num_hex // 2 + 1):
+                tile_r = int(35 * darkness)
+                tile_g = int(39 * darkness)
+                tile_b = int(49 * darkness)
+                
+                # Subtle pattern variation
+                pattern = (row + col) % 3
+                if pattern == 1:
+                    tile_r += 4
+                    tile_g += 4
+                elif pattern == 2:
+                    tile_b += 5
+                
+                tiles.append((int(vanish_x + col * hex_size * 1.65 * scale),
+                              (tile_r, tile_g, tile_b),
+                              (tile_r + 10, tile_g + 10, tile_b + 14),
+                              (tile_r + 6, tile_g + 6, tile_b + 10)))
+            
+            rows.append((row_y, hex_size, outer, inner, edge_width, tiles))
+        
+        self._hex_floor = (key, rows)
+        return rows
+    
+    def _draw_hex_floor(self, screen, scroll_x=0):
+        """
+        Vẽ hexagonal floor tiles from the precomputed table
+        
+        Args:
+            screen: Target surface
+            scroll_x: Horizontal offset (px at the nearest row) for a scrolling floor
+        """
+        W = self.width
+        polygon = pygame.draw.polygon
+        for row_y, size, outer, inner, edge_width, tiles in self._hex_floor_table():
+            shift = int(scroll_x * size / 48)
+            for cx, fill, edge, inner_color in tiles:
+                cx += shift
+                if not -size < cx < W + size:
+                    continue
+                points = [(cx + dx, row_y + dy) for dx, dy in outer]
+                polygon(screen, fill, points)
+                polygon(screen, edge, points, edge_width)
+                
+                # Inner detail line
+                if inner is not None:
+                    polygon(screen, inner_color, [(cx + dx, row_y + dy) for dx, dy in inner], 1)
 
     # ══════════════════════════════════════════════════════════
     #   ★★★ ULTRA REALISTIC FIRST-PERSON GUN ★★★
@@ -475,22 +719,19 @@ class UI:
         W, H = self.width, self.height
         t = pygame.time.get_ticks()
         
-        # Update animation timers
-        if self._muzzle_flash_timer > 0:
-            self._muzzle_flash_timer -= 1/60.0
+        # Animated values (advanced in update_animations)
+        recoil = self.anim['recoil']
+        flash_level = self.anim.level('flash')
+        if self.anim['flash'] > 0:
             show_flash = True
         
-        # Smooth recoil decay
-        self._gun_recoil = max(0, self._gun_recoil - 0.08)
-        self._gun_kickback = max(0, self._gun_kickback - 2.0)
-        
         # Gun base position
         gun_base_x = W // 2
-        gun_base_y = H - 58 + int(self._gun_kickback)
+        gun_base_y = H - 58 + int(self.anim['kickback'])
         
         # Recoil offset
-        recoil_y = int(-self._gun_recoil * 42)
-        recoil_sway = math.sin(self._gun_recoil * 3.2) * 6
+        recoil_y = int(-recoil * 42)
+        recoil_sway = math.sin(recoil * 3.2) * 6
         
         # ═══ LEFT HAND (Supporting hand) ═══
         lh_x = gun_base_x - 135 + int(recoil_sway)
@@ -603,7 +844,7 @@ class UI:
         
         # Trigger finger
         trigger_base_y = rh_y + 26
-        trigger_ext = 6 if self._gun_recoil > 0.4 else 0
+        trigger_ext = 6 if recoil > 0.4 else 0
         
         tf_rect = pygame.Rect(rh_x + 37, trigger_base_y + trigger_ext, 10, 26)
         pygame.draw.rect(screen, (148, 128, 108), tf_rect, border_radius=4)
@@ -664,7 +905,7 @@ class UI:
         pygame.draw.rect(screen, (48, 53, 63), port, 1, border_radius=3)
         
         # === PUMP FOREGRIP ===
-        pump_push = int(self._gun_recoil * 28)
+        pump_push = int(recoil * 28)
         pump_x = gun_x - 28 - pump_push
         pump_y = gun_y - 9
         pump_w = 43
@@ -691,7 +932,7 @@ class UI:
                        0, math.pi, 5)
         
         # Trigger
-        trigger_pull = 7 if self._gun_recoil > 0.4 else 0
+        trigger_pull = 7 if recoil > 0.4 else 0
         trigger_rect = pygame.Rect(guard_x + 14, guard_y + 19 + trigger_pull, 8, 15)
         pygame.draw.rect(screen, (165, 145, 125), trigger_rect, border_radius=3)
         pygame.draw.rect(screen, (125, 105, 85), trigger_rect, 2, border_radius=3)
@@ -724,35 +965,21 @@ class UI:
         pygame.draw.rect(screen, (92, 77, 62), buttplate, 2, border_radius=3)
         
         # === MUZZLE FLASH & EFFECTS ===
-        if show_flash and self._muzzle_flash_timer > 0:
+        if show_flash and flash_level > 0:
             flash_x = gun_x - 19 - 55
             flash_y = gun_y - 9
             
-            flash_intensity = self._muzzle_flash_timer / 0.15
+            flash_intensity = flash_level
             
-            # Large expanding flash core
-            for radius in range(75, 18, -13):
-                alpha = int(flash_intensity * 255 * (radius / 75))
-                flash_color = (255, 238, 125) if radius > 42 else (255, 198, 85)
-                
-                flash_surf = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
-                pygame.draw.circle(flash_surf, (*flash_color, alpha), (radius, radius), radius)
-                screen.blit(flash_surf, (flash_x - radius, flash_y - radius))
+            # Large expanding flash core (pre-rendered, see muzzle_flash.py)
+            bank = muzzle_flash.shared_bank()
+            for surf, (dx, dy) in bank.doom_discs(flash_intensity):
+                screen.blit(surf, (flash_x + dx, flash_y + dy))
             
             # Flash rays (star burst)
-            num_rays = 18
-            for ray_i in range(num_rays):
-                angle = (ray_i / num_rays) * 2 * math.pi + random.uniform(-0.18, 0.18)
-                length = random.randint(55, 100)
-                width = random.randint(4, 8)
-                
-                ray_alpha = int(flash_intensity * 230)
-                ray_surf = pygame.Surface((6, length), pygame.SRCALPHA)
-                pygame.draw.line(ray_surf, (255, 238, 155, ray_alpha), (3, 0), (3, length), width)
-                
-                ray_surf = pygame.transform.rotate(ray_surf, -math.degrees(angle) - 90)
-                screen.blit(ray_surf, (flash_x - ray_surf.get_width() // 2, 
-                                      flash_y - ray_surf.get_height() // 2))
+            burst, (dx, dy) = bank.doom_burst()
+            burst.set_alpha(int(flash_intensity * 230))
+            screen.blit(burst, (flash_x + dx, flash_y + dy))
             
             # Bright core
             core_size = int(20 * flash_intensity)
@@ -760,18 +987,15 @@ class UI:
             pygame.draw.circle(screen, (255, 238, 155), (flash_x, flash_y), core_size - 6)
             
             # Smoke puffs
-            if self._muzzle_flash_timer < 0.09:
+            if flash_level < 0.6:
+                puff_strength = (0.6 - flash_level) / 0.6
                 for puff_i in range(4):
                     puff_offset = puff_i * 16 + random.randint(-6, 6)
                     puff_x = flash_x - 75 - puff_offset
                     puff_y = flash_y + random.randint(-12, 12)
-                    puff_size = 17 + puff_i * 9
                     
-                    puff_alpha = int((0.09 - self._muzzle_flash_timer) / 0.09 * 85)
-                    puff_surf = pygame.Surface((puff_size * 2, puff_size * 2), pygame.SRCALPHA)
-                    pygame.draw.circle(puff_surf, (95, 95, 95, puff_alpha), 
-                                     (puff_size, puff_size), puff_size)
-                    screen.blit(puff_surf, (puff_x - puff_size, puff_y - puff_size))
+                    puff_surf, (dx, dy) = bank.smoke_puff(puff_i, puff_strength)
+                    screen.blit(puff_surf, (puff_x + dx, puff_y + dy))
         
         # === AMMO COUNTER HUD ===
         ammo_bg = pygame.Rect(W - 225, H - 78, 205, 63)
@@ -783,21 +1007,137 @@ class UI:
         
         ammo_count = self.large_font.render("50", True, (255, 195, 0))
         screen.blit(ammo_count, (W - 155, H - 63))
+        
+        # Areas the gun can cover: hands / recoil / flash / smoke, ammo counter
+        return [pygame.Rect(W // 2 - 270, H - 320, 490, 320), ammo_bg]
 
     # Legacy compatibility
     def draw_gun(self, screen, show_flash=False):
-        self.draw_gun_doom(screen, show_flash)
+        return self.draw_gun_doom(screen, show_flash)
 
     # ══════════════════════════════════════════════════════════
     #   PHẦN CÒN LẠI GIỮ NGUYÊN TỪ CODE GỐC
     # ══════════════════════════════════════════════════════════
     
     def draw_name_input(self, screen, player_name):
-        """DOOM-style name input screen với hiệu ứng sci-fi đầy đủ"""
+        """
+        DOOM-style name input screen với hiệu ứng sci-fi đầy đủ
+        
+        Corridor, banner, title, panel and input box are baked once
+        (_bake_name_input_static); per frame only the panel lights, the
+        typed name (glow cached per string), buttons and stripes are drawn.
+        """
         W, H = self.width, self.height
         t = pygame.time.get_ticks()
         
-        # ═══ ANIMATED BACKGROUND (DOOM CORRIDOR) ═══
+        if self._name_input_static is None:
+            self._name_input_static = pygame.Surface((W, H))
+            self._bake_name_input_static(self._name_input_static)
+        screen.blit(self._name_input_static, (0, 0))
+        
+        # Wall panel lights
+        for wall_x in [100, W - 150]:
+            for panel_y in range(100, H - 100, 120):
+                light_on = (t // 500 + panel_y // 120) % 3 == 0
+                light_color = (0, 255, 150) if light_on else (0, 80, 50)
+                pygame.draw.rect(screen, light_color, (wall_x + 15, panel_y + 15, 15, 8))
+        
+        panel_w = 700
+        panel_h = 280
+        panel_x = (W - panel_w) // 2
+        panel_y = 180
+        input_w = panel_w - 60
+        input_h = 70
+        input_x = panel_x + 30
+        input_y = panel_y + 75
+        
+        # Typed name + cursor (glow layers cached per string)
+        cursor_visible = (t // 400) % 2 == 0
+        for surf, dx, dy in self._name_text_layers(player_name + ("|" if cursor_visible else " ")):
+            screen.blit(surf, (input_x + dx, input_y + dy))
+        
+        char_surf = self._name_text_layers(f"{len(player_name)}/20", count=True)
+        screen.blit(char_surf, (input_x + input_w - 70, input_y + input_h + 8))
+        
+        # Buttons
+        button_y = panel_y + panel_h + 40
+        
+        back_x = W // 2 - 330
+        self._draw_doom_button(screen, "< ABORT", back_x, button_y, 280, 75, 
+                              (150, 50, 50), (200, 70, 70), "back", t)
+        
+        start_x = W // 2 + 50
+        if player_name.strip():
+            self._draw_doom_button(screen, "START >", start_x, button_y, 280, 75,
+                                  (0, 180, 100), (0, 230, 130), "confirm", t, pulse=True)
+        else:
+            pygame.draw.rect(screen, (40, 40, 50), (start_x, button_y, 280, 75), border_radius=8)
+            pygame.draw.rect(screen, (80, 80, 90), (start_x, button_y, 280, 75), 3, border_radius=8)
+            
+            text_surf = self.medium_font.render("START >", True, (100, 100, 120))
+            screen.blit(text_surf, text_surf.get_rect(center=(start_x + 140, button_y + 37)))
+            
+            self.buttons["confirm"] = (start_x, button_y, 280, 75)
+        
+        # Warning stripes
+        stripe_y = H - 60
+        stripe_h = 50
+        
+        stripe_offset = (t // 50) % 40
+        for x in range(-40, W + 40, 40):
+            stripe_x = x + stripe_offset
+            
+            points = [
+                (stripe_x, stripe_y),
+                (stripe_x + 30, stripe_y),
+                (stripe_x + 20, stripe_y + stripe_h),
+                (stripe_x - 10, stripe_y + stripe_h)
+            ]
+            
+            stripe_color = (200, 180, 0) if (stripe_x // 40) % 2 == 0 else (40, 40, 50)
+            pygame.draw.polygon(screen, stripe_color, points)
+        
+        warning_text = "! AUTHORIZED PERSONNEL ONLY !"
+        warning_blink = (t // 600) % 2 == 0
+        if warning_blink:
+            warning_surf = self.small_font.render(warning_text, True, (255, 50, 50))
+            screen.blit(warning_surf, warning_surf.get_rect(center=(W // 2, stripe_y + stripe_h // 2)))
+    
+    def _name_text_layers(self, text, count=False):
+        """
+        Rendered name text (glow layers + text) or char counter, cached per string
+        
+        Returns:
+            list | pygame.Surface: [(surface, dx, dy), ...] or the counter surface
+        """
+        key = (text, count)
+        cached = self._name_text_cache.get(key)
+        if cached is not None:
+            return cached
+        if len(self._name_text_cache) > 128:
+            self._name_text_cache.clear()
+        
+        if count:
+            cached = self.tiny_font.render(text, True, (150, 150, 180))
+        else:
+            text_surf = self.large_font.render(text, True, (0, 255, 200))
+            glow_surf = self.large_font.render(text, True, (0, 200, 150))
+            cached = []
+            for i in range(2):
+                glow_surface = pygame.Surface((text_surf.get_width(), text_surf.get_height()), pygame.SRCALPHA)
+                glow_surface.blit(glow_surf, (0, 0))
+                glow_surface.set_alpha(max(0, 80 - i * 40))
+                cached.append((glow_surface, 20 - i, 16 - i))
+            cached.append((text_surf, 20, 16))
+        
+        self._name_text_cache[key] = cached
+        return cached
+    
+    def _bake_name_input_static(self, screen):
+        """Vẽ phần tĩnh của màn hình nhập tên (không phụ thuộc thời gian)"""
+        W, H = self.width, self.height
+        
+        # ═══ BACKGROUND (DOOM CORRIDOR) ═══
         for y in range(H):
             shade = int(15 + (y / H) * 25)
             pygame.draw.line(screen, (shade, shade, shade + 5), (0, y), (W, y))
@@ -836,10 +1176,6 @@ class UI:
                 panel_rect = pygame.Rect(wall_x, panel_y, 45, 100)
                 pygame.draw.rect(screen, (60, 65, 75), panel_rect)
                 pygame.draw.rect(screen, (80, 85, 95), panel_rect, 2)
-                
-                light_on = (t // 500 + panel_y // 120) % 3 == 0
-                light_color = (0, 255, 150) if light_on else (0, 80, 50)
-                pygame.draw.rect(screen, light_color, (wall_x + 15, panel_y + 15, 15, 8))
         
         # Top banner
         banner_height = 100
@@ -865,8 +1201,8 @@ class UI:
         title_text = "ENTER YOUR NAME"
         title_surf = self.title_font.render(title_text, True, (255, 255, 255))
         
+        shadow_surf = self.title_font.render(title_text, True, (100, 0, 0))
         for offset in [(2, 2), (-2, -2), (2, -2), (-2, 2)]:
-            shadow_surf = self.title_font.render(title_text, True, (100, 0, 0))
             screen.blit(shadow_surf, (W // 2 - title_surf.get_width() // 2 + offset[0], 35 + offset[1]))
         
         screen.blit(title_surf, title_surf.get_rect(center=(W // 2, 37)))
@@ -913,35 +1249,11 @@ class UI:
         input_x = panel_x + 30
         input_y = panel_y + 75
         
-        for scan_y in range(input_h):
-            if scan_y % 3 == 0:
-                alpha = 180
-            else:
-                alpha = 200
-            pygame.draw.rect(screen, (15, 20, 30), (input_x, input_y + scan_y, input_w, 1))
+        pygame.draw.rect(screen, (15, 20, 30), (input_x, input_y, input_w, input_h))
         
         pygame.draw.rect(screen, (0, 255, 200), (input_x, input_y, input_w, input_h), 3)
         pygame.draw.rect(screen, (0, 180, 150), (input_x + 2, input_y + 2, input_w - 4, input_h - 4), 1)
         
-        cursor_visible = (t // 400) % 2 == 0
-        display_text = player_name + ("|" if cursor_visible else " ")
-        
-        text_surf = self.large_font.render(display_text, True, (0, 255, 200))
-        
-        for i in range(2):
-            glow_surf = self.large_font.render(display_text, True, (0, 200, 150))
-            glow_alpha = max(0, 80 - i * 40)
-            glow_surface = pygame.Surface((text_surf.get_width(), text_surf.get_height()), pygame.SRCALPHA)
-            glow_surface.blit(glow_surf, (0, 0))
-            glow_surface.set_alpha(glow_alpha)
-            screen.blit(glow_surface, (input_x + 20 - i, input_y + 16 - i))
-        
-        screen.blit(text_surf, (input_x + 20, input_y + 16))
-        
-        char_count_text = f"{len(player_name)}/20"
-        char_surf = self.tiny_font.render(char_count_text, True, (150, 150, 180))
-        screen.blit(char_surf, (input_x + input_w - 70, input_y + input_h + 8))
-        
         # Info panel
         info_y = input_y + input_h + 35
         
@@ -959,50 +1271,6 @@ class UI:
             
             value_surf = self.tiny_font.render(value, True, color)
             screen.blit(value_surf, (info_x, info_y + 18))
-        
-        # Buttons
-        button_y = panel_y + panel_h + 40
-        
-        back_x = W // 2 - 330
-        self._draw_doom_button(screen, "< ABORT", back_x, button_y, 280, 75, 
-                              (150, 50, 50), (200, 70, 70), "back", t)
-        
-        start_x = W // 2 + 50
-        if player_name.strip():
-            self._draw_doom_button(screen, "START >", start_x, button_y, 280, 75,
-                                  (0, 180, 100), (0, 230, 130), "confirm", t, pulse=True)
-        else:
-            pygame.draw.rect(screen, (40, 40, 50), (start_x, button_y, 280, 75), border_radius=8)
-            pygame.draw.rect(screen, (80, 80, 90), (start_x, button_y, 280, 75), 3, border_radius=8)
-            
-            text_surf = self.medium_font.render("START >", True, (100, 100, 120))
-            screen.blit(text_surf, text_surf.get_rect(center=(start_x + 140, button_y + 37)))
-            
-            self.buttons["confirm"] = (start_x, button_y, 280, 75)
-        
-        # Warning stripes
-        stripe_y = H - 60
-        stripe_h = 50
-        
-        stripe_offset = (t // 50) % 40
-        for x in range(-40, W + 40, 40):
-            stripe_x = x + stripe_offset
-            
-            points = [
-                (stripe_x, stripe_y),
-                (stripe_x + 30, stripe_y),
-                (stripe_x + 20, stripe_y + stripe_h),
-                (stripe_x - 10, stripe_y + stripe_h)
-            ]
-            
-            stripe_color = (200, 180, 0) if (stripe_x // 40) % 2 == 0 else (40, 40, 50)
-            pygame.draw.polygon(screen, stripe_color, points)
-        
-        warning_text = "! AUTHORIZED PERSONNEL ONLY !"
-        warning_blink = (t // 600) % 2 == 0
-        if warning_blink:
-            warning_surf = self.small_font.render(warning_text, True, (255, 50, 50))
-            screen.blit(warning_surf, warning_surf.get_rect(center=(W // 2, stripe_y + stripe_h // 2)))
     
     def _draw_doom_button(self, screen, text, x, y, w, h, base_color, hover_color, button_id, time_ms, pulse=False):
         """Vẽ button theo phong cách DOOM"""
@@ -1071,8 +1339,9 @@ class UI:
         screen.blit(ct,ct.get_rect(center=(self.width//2,610)))
 
     def draw_hud(self,screen,player_name,score,hp,wrong,max_wrong,monsters_killed):
+        """Returns: the rects drawn (a long name can stick out of its box)"""
         pygame.draw.rect(screen,(0,0,0,180),pygame.Rect(10,10,280,120),border_radius=10)
-        screen.blit(self.safe_render(self.small_font, player_name,      (255,255,255)),(20,20))
+        nr=screen.blit(self.safe_render(self.small_font, player_name,      (255,255,255)),(20,20))
         screen.blit(self.safe_render(self.medium_font,f"Score: {score}", (255,215,0)), (20,55))
         screen.blit(self.safe_render(self.small_font, f"Quai: {monsters_killed}",(100,255,100)),(20,95))
         pygame.draw.rect(screen,(0,0,0,180),pygame.Rect(self.width//2-150,10,300,80),border_radius=10)
@@ -1092,6 +1361,8 @@ class UI:
             pygame.draw.circle(screen,hc,(hx,hy),12)
             pygame.draw.circle(screen,hc,(hx+15,hy),12)
             pygame.draw.polygon(screen,hc,[(hx-12,hy),(hx+7,hy+25),(hx+27,hy)])
+        return [pygame.Rect(10,10,280,120),pygame.Rect(self.width//2-150,10,300,80),
+                pygame.Rect(self.width-160,10,150,90),nr,pygame.Rect(self.width-152,53,40*max_wrong,38)]
 
     def draw_question_panel(self,screen,question,target_part,selected_answer,
                             selected_answers,user_input,show_feedback,is_correct):
@@ -1132,6 +1403,7 @@ class UI:
         if   q_type=='multiple_choice': self.draw_multiple_choice(screen,question,selected_answer,selected_answers,show_feedback,yp)
         elif q_type=='true_false':      self.draw_true_false(screen,question,selected_answers,show_feedback,yp)
         elif q_type=='short_answer':    self.draw_short_answer(screen,question,user_input,show_feedback,is_correct,yp)
+        return pygame.Rect(0,PY,self.width,PH)
 
     def draw_multiple_choice(self,screen,question,selected_answer,selected_answers,show_feedback,y_pos):
         FA=310; cw=(self.width-100-FA-20)//2; AH=65; AX=50; SP=10
@@ -1198,8 +1470,8 @@ class UI:
             text_x=AX+TX_OFF; ty2=curr_y+PAD
             for li,line in enumerate(lines[:3]):
                 disp=f"{chr(65+i)}. {line}" if li==0 else f"    {line}"
-                s=self.safe_render(self.tiny_font,disp,(255,255,255))
-                if s.get_width()>TX_MAX+6: s=self.safe_render(self.micro_font,disp,(255,255,255))
+                font=self.tiny_font if self.metrics(self.tiny_font).width(disp)<=TX_MAX+6 else self.micro_font
+                s=self.render_cached(font,disp,(255,255,255))
                 if s.get_width()>AW-TX_OFF-8:
                     cl=pygame.Rect(text_x,ty2,AW-TX_OFF-8,s.get_height())
                     screen.set_clip(cl); screen.blit(s,(text_x,ty2)); screen.set_clip(None)
@@ -1219,14 +1491,16 @@ class UI:
         bc=(50,50,70) if not show_feedback else ((0,180,100) if is_correct else (200,60,60))
         pygame.draw.rect(screen,bc,(ix,y_pos,iw,ih),border_radius=10)
         pygame.draw.rect(screen,(120,150,255),(ix,y_pos,iw,ih),3,border_radius=10)
-        dt=user_input; cur="|" if not show_feedback and pygame.time.get_ticks()%1000<500 else ""
-        mw=iw-40
-        try:
-            ts=self.medium_font.render(dt+cur,True,(255,255,255))
-            while ts.get_width()>mw and len(dt)>0:
-                dt=dt[1:]; ts=self.medium_font.render(dt+cur,True,(255,255,255))
+        # Show the end of the input: cut arithmetically, one render per changed text, caret drawn as a line
+        # (room for the caret only while typing; it blinks, the cut must not)
+        fm=self.metrics(self.medium_font); mw=iw-40-(0 if show_feedback else fm.advance('|'))
+        dt=fm.fit_tail(user_input,mw)
+        if dt:
+            ts=self.render_cached(self.medium_font,dt,(255,255,255))
             screen.blit(ts,(ix+20,y_pos+14))
-        except: pass
+        if not show_feedback and pygame.time.get_ticks()%1000<500:
+            cx=ix+20+min(fm.caret_x(dt,len(dt)),mw)+2
+            pygame.draw.line(screen,(255,255,255),(cx,y_pos+16),(cx,y_pos+ih-16),2)
         hint="Nhap dap an" if not show_feedback else f"Dap an dung: {question.get('correct_answer','')}"
         try: screen.blit(self.safe_render(self.tiny_font,hint,(150,150,180)),(ix,y_pos+ih+6))
         except: pass
@@ -1275,7 +1549,8 @@ class UI:
             s=fn.render(txt,True,col2); screen.blit(s,s.get_rect(center=(self.width//2,yo+dy)))
         self.draw_button(screen,"Choi lai",self.width//2-150,620,300,70,(0,180,0),(0,220,0),"menu")
 
-    def draw_ranking(self,screen,rankings):
+    def draw_ranking(self,screen,rankings,page=0,page_count=1,per_page=10):
+        """rankings = only the rows of the current page (LeaderboardStore.page)"""
         t=self.large_font.render("BANG XEP HANG",True,(255,215,0))
         screen.blit(t,t.get_rect(center=(self.width//2,60)))
         self.draw_button(screen,"Reset",self.width-180,50,140,50,(200,50,50),(230,70,70),"reset")
@@ -1284,8 +1559,9 @@ class UI:
             screen.blit(s,s.get_rect(center=(self.width//2,self.height//2)))
         else:
             yo=130
-            for i,rank in enumerate(rankings):
-                rh,ry=70,yo+i*82
+            for n,rank in enumerate(rankings):
+                i=page*per_page+n
+                rh,ry=70,yo+n*82
                 col=[(255,215,0),(192,192,192),(205,127,50)][i] if i<3 else (70,70,70)
                 tc2=(0,0,0) if i<3 else (255,255,255)
                 pygame.draw.rect(screen,col,(100,ry,self.width-200,rh),border_radius=10)
@@ -1299,27 +1575,180 @@ class UI:
                 st=self.small_font.render("Thang" if rank['won'] else "Thua",True,
                     (0,100,0) if (rank['won'] and i<3) else ((0,255,0) if rank['won'] else (255,100,100)))
                 screen.blit(st,st.get_rect(right=self.width-130,centery=ry+rh//2))
+        if page_count>1:
+            pt=self.small_font.render(f"Trang {page+1}/{page_count}",True,(200,200,200))
+            screen.blit(pt,pt.get_rect(center=(self.width//2,105)))
+            pc=(0,100,200) if page>0 else (60,60,80); nc=(0,100,200) if page<page_count-1 else (60,60,80)
+            self.draw_button(screen,"<",self.width//2-260,self.height-100,90,60,pc,(0,130,230) if page>0 else pc,"rank_prev")
+            self.draw_button(screen,">",self.width//2+170,self.height-100,90,60,nc,(0,130,230) if page<page_count-1 else nc,"rank_next")
         self.draw_button(screen,"Quay lai",self.width//2-150,self.height-100,300,60,(0,100,200),(0,130,230),"back")
 
-    def draw_file_manager(self,screen,files):
+    def draw_file_manager(self,screen,files,search=None):
+        """files on the left (virtualized list), question search (Game.search_state) on the right"""
         t=self.large_font.render("Quan ly File De",True,(255,255,255))
-        screen.blit(t,t.get_rect(center=(self.width//2,80)))
-        self.draw_button(screen,"Tai len file moi (.txt)",self.width//2-250,150,500,60,(0,100,200),(0,130,230),"upload")
+        screen.blit(t,t.get_rect(center=(self.width//2,60)))
+        self.draw_button(screen,"Tai len file moi (.txt)",100,110,520,55,(0,100,200),(0,130,230),"upload")
         if not files:
-            s=self.medium_font.render("Chua co file nao duoc tai len",True,(150,150,150))
-            screen.blit(s,s.get_rect(center=(self.width//2,self.height//2)))
+            s=self.medium_font.render("Chua co file nao",True,(150,150,150))
+            screen.blit(s,s.get_rect(center=(360,self.height//2)))
         else:
-            yo=240
-            for i,file in enumerate(files):
-                fy=yo+i*90
-                pygame.draw.rect(screen,(50,50,70),(100,fy,self.width-200,75),border_radius=10)
-                pygame.draw.rect(screen,(100,100,150),(100,fy,self.width-200,75),2,border_radius=10)
-                screen.blit(self.medium_font.render(file['name'],True,(255,255,255)),(120,fy+15))
-                screen.blit(self.small_font.render(f"{file['question_count']} cau hoi - {file['upload_date'][:10]}",True,(200,200,200)),(120,fy+48))
-                self.draw_button(screen,"Xoa",self.width-180,fy+17,100,40,(200,50,50),(230,70,70),f"delete_{i}")
-        self.draw_button(screen,"Quay lai",self.width//2-150,self.height-100,300,60,(100,100,100),(130,130,130),"back")
+            self._draw_file_list(screen,files)
+        if search is not None:
+            self._draw_question_search(screen,search,files)
+        self.draw_button(screen,"Quay lai",self.width//2-150,self.height-90,300,60,(100,100,100),(130,130,130),"back")
+
+    # ══════════════════════════════════════════════════════════
+    #   FILE LIST (virtualized)
+    # ══════════════════════════════════════════════════════════
+    def _file_scroll_max(self,count):
+        return max(0,count*FILE_ROW_STEP-(FILE_ROW_STEP-FILE_ROW_H)-FILE_LIST_RECT[3])
+
+    def _visible_file_rows(self,count):
+        """range of file indices intersecting the viewport"""
+        first=int(self._file_scroll//FILE_ROW_STEP)
+        last=int((self._file_scroll+FILE_LIST_RECT[3])//FILE_ROW_STEP)+1
+        return range(max(0,first),min(count,last))
+
+    def _file_row_surface(self,file):
+        """Row background + texts, rebuilt only when the file record changes"""
+        key=(file['name'],file['question_count'],file['upload_date'])
+        row=self._file_row_cache.get(key)
+        if row is None:
+            row=pygame.Surface((FILE_LIST_RECT[2],FILE_ROW_H),pygame.SRCALPHA)
+            pygame.draw.rect(row,(50,50,70),(0,0,row.get_width(),FILE_ROW_H),border_radius=10)
+            pygame.draw.rect(row,(100,100,150),(0,0,row.get_width(),FILE_ROW_H),2,border_radius=10)
+            row.blit(self._fit_text(self.medium_font,file['name'],(255,255,255),370),(20,10))
+            row.blit(self.small_font.render(f"{file['question_count']} cau hoi - {file['upload_date'][:10]}",True,(200,200,200)),(20,46))
+            self._file_row_cache[key]=row
+        return row
+
+    def _file_delete_surfaces(self):
+        """The rows' "Xoa" button, baked once per hover state"""
+        if self._file_delete_btn is None:
+            ts=self.safe_render(self.medium_font,"Xoa",(255,255,255))
+            btns=[]
+            for c in ((200,50,50),(230,70,70)):
+                b=pygame.Surface((100,40),pygame.SRCALPHA)
+                pygame.draw.rect(b,c,(0,0,100,40),border_radius=10)
+                pygame.draw.rect(b,(255,255,255),(0,0,100,40),3,border_radius=10)
+                b.blit(ts,ts.get_rect(center=(50,20)))
+                btns.append(b)
+            self._file_delete_btn=tuple(btns)
+        return self._file_delete_btn
+
+    def _draw_file_list(self,screen,files):
+        vx,vy,vw,vh=FILE_LIST_RECT
+        self._file_scroll=max(0.0,min(self._file_scroll,self._file_scroll_max(len(files))))
+        if len(self._file_row_cache)>2*len(files)+32:
+            live={(f['name'],f['question_count'],f['upload_date']) for f in files}
+            self._file_row_cache={k:v for k,v in self._file_row_cache.items() if k in live}
+        old_clip=screen.get_clip()
+        screen.set_clip(pygame.Rect(vx,vy,vw,vh).clip(old_clip))
+        btn,btn_hov=self._file_delete_surfaces()
+        mx,my=pygame.mouse.get_pos()
+        for i in self._visible_file_rows(len(files)):
+            fy=vy+i*FILE_ROW_STEP-int(self._file_scroll)
+            screen.blit(self._file_row_surface(files[i]),(vx,fy))
+            # Not registered in self.buttons: check_file_delete_click hit-tests the visible window
+            bx,by=vx+400,fy+17
+            screen.blit(btn_hov if bx<=mx<=bx+100 and by<=my<=by+40 else btn,(bx,by))
+        screen.set_clip(old_clip)
+        scroll_max=self._file_scroll_max(len(files))
+        if scroll_max>0:
+            bar_h=max(30,int(vh*vh/(vh+scroll_max)))
+            bar_y=vy+int((vh-bar_h)*self._file_scroll/scroll_max)
+            pygame.draw.rect(screen,(40,40,60),(vx+vw+8,vy,6,vh),border_radius=3)
+            pygame.draw.rect(screen,(0,200,255),(vx+vw+8,bar_y,6,bar_h),border_radius=3)
+
+    def file_list_contains(self,x,y):
+        vx,vy,vw,vh=FILE_LIST_RECT
+        return vx<=x<=vx+vw and vy<=y<=vy+vh
+
+    def scroll_file_list(self,wheel_y):
+        """Mouse wheel: push the list (kinetic, decays in update_file_list)"""
+        self._file_scroll_velocity-=wheel_y*900.0
+
+    def begin_file_drag(self,y):
+        self._file_drag=(y,pygame.time.get_ticks())
+        self._file_scroll_velocity=0.0
+
+    def drag_file_list(self,y):
+        if self._file_drag is None: return
+        last_y,last_t=self._file_drag
+        now=pygame.time.get_ticks()
+        self._file_scroll-=y-last_y
+        if now>last_t:
+            self._file_scroll_velocity=-(y-last_y)*1000.0/(now-last_t)
+        self._file_drag=(y,now)
+
+    def end_file_drag(self):
+        if self._file_drag is not None and pygame.time.get_ticks()-self._file_drag[1]>80:
+            self._file_scroll_velocity=0.0  # held still before release: no fling
+        self._file_drag=None
+
+    def file_list_moving(self):
+        return self._file_drag is not None or self._file_scroll_velocity!=0.0
+
+    def update_file_list(self,dt,count):
+        """Kinetic scrolling: exponential friction, stops at both ends"""
+        if self._file_drag is not None or not self._file_scroll_velocity: return
+        self._file_scroll+=self._file_scroll_velocity*dt
+        self._file_scroll_velocity*=0.02**dt
+        scroll_max=self._file_scroll_max(count)
+        if self._file_scroll<0 or self._file_scroll>scroll_max:
+            self._file_scroll=max(0.0,min(self._file_scroll,scroll_max))
+            self._file_scroll_velocity=0.0
+        if abs(self._file_scroll_velocity)<5: self._file_scroll_velocity=0.0
+
+    def _fit_text(self,font,text,color,max_width):
+        """Render text, cut with '...' to max_width"""
+        return self.render_cached(font,self.metrics(font).fit_head(text,max_width),color)
+
+    def _draw_question_search(self,screen,search,files):
+        """Search box, level/type/file filters, one page of results"""
+        px,pw=660,520
+        # Query box (typed while the file manager is open)
+        pygame.draw.rect(screen,(30,30,50),(px,110,pw,55),border_radius=10)
+        pygame.draw.rect(screen,(0,200,255),(px,110,pw,55),2,border_radius=10)
+        q=search['query']
+        if q: qs=self._fit_text(self.small_font,q+("|" if (pygame.time.get_ticks()//500)%2==0 else ""),(255,255,255),pw-30)
+        else: qs=self.small_font.render("Go de tim cau hoi...",True,(120,120,150))
+        screen.blit(qs,qs.get_rect(midleft=(px+15,137)))
+
+        level_names={None:"Cap do: tat ca",'nhanbiet':"Nhan biet",'thonghieu':"Thong hieu",'vandung':"Van dung"}
+        type_names={None:"Loai: tat ca",'multiple_choice':"Trac nghiem",'true_false':"Dung/Sai",'short_answer':"Tra loi ngan"}
+        fi=search['file']
+        file_label="File: tat ca" if fi is None or fi>=len(files) else files[fi]['name']
+        for n,(label,bid) in enumerate(((level_names.get(search['level'],str(search['level'])),"search_level"),
+                                        (type_names.get(search['type'],str(search['type'])),"search_type"),
+                                        (file_label,"search_file"))):
+            self.draw_button(screen,label,px+n*176,175,168,42,(60,60,100),(80,80,140),bid)
+
+        result=search['result']
+        if result is None: return
+        ry=230
+        if not result['results']:
+            s=self.small_font.render("Khong tim thay cau hoi",True,(150,150,150))
+            screen.blit(s,s.get_rect(center=(px+pw//2,ry+120)))
+        for question,file_name in result['results']:
+            pygame.draw.rect(screen,(40,40,60),(px,ry,pw,62),border_radius=8)
+            pygame.draw.rect(screen,(90,90,140),(px,ry,pw,62),1,border_radius=8)
+            screen.blit(self._fit_text(self.small_font,question.get('question',''),(255,255,255),pw-20),(px+10,ry+6))
+            meta=f"{level_names.get(question.get('level'),'')} - {type_names.get(question.get('type','multiple_choice'),'')} - {file_name}"
+            screen.blit(self._fit_text(self.tiny_font,meta,(160,200,255),pw-20),(px+10,ry+36))
+            ry+=66
+        page,pages=result['page'],result['pages']
+        info=self.tiny_font.render(f"{result['total']} ket qua - trang {page+1}/{pages} - {result['elapsed_ms']:.1f} ms",True,(200,200,200))
+        screen.blit(info,info.get_rect(center=(px+pw//2,582)))
+        pc=(0,100,200) if page>0 else (60,60,80); nc=(0,100,200) if page<pages-1 else (60,60,80)
+        self.draw_button(screen,"<",px,562,70,40,pc,(0,130,230) if page>0 else pc,"search_prev")
+        self.draw_button(screen,">",px+pw-70,562,70,40,nc,(0,130,230) if page<pages-1 else nc,"search_next")
 
     def check_file_delete_click(self,x,y,file_count):
-        for i in range(file_count):
-            if self.check_button_click(x,y,f"delete_{i}"): return i
+        """Index of the file whose "Xoa" button is at (x, y); only the visible window is tested"""
+        if not self.file_list_contains(x,y): return None
+        vx,vy=FILE_LIST_RECT[:2]
+        for i in self._visible_file_rows(file_count):
+            fy=vy+i*FILE_ROW_STEP-int(self._file_scroll)
+            if vx+400<=x<=vx+500 and fy+17<=y<=fy+57: return i
         return None
\ No newline at end of file
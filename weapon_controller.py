@@ -12,6 +12,11 @@ Features:
 - Muzzle flash with screen-space glow
 - Dynamic lighting response
 - Performance-optimized rendering
+
+Recoil, flash, sway, bob and the smoothed position live in an
+animation.AnimationSystem (shared with UI when given one). Recoil and
+flash are the weapon's own channels (weapon_recoil / weapon_flash):
+the on-screen gun keeps its own rate and flash time.
 ═══════════════════════════════════════════════════════════════════
 """
 
@@ -19,6 +24,10 @@ import pygame
 import math
 import random
 
+import muzzle_flash
+from animation import DECAY, SPRING, gun_animation
+from noise import shared_table
+
 
 class WeaponState:
     """Weapon animation states"""
@@ -33,9 +42,18 @@ class WeaponController:
     Controls weapon rendering and animation in first-person view
     """
     
-    def __init__(self, screen_width, screen_height):
+    def __init__(self, screen_width, screen_height, anim=None):
+        """
+        Args:
+            screen_width: Screen width in pixels
+            screen_height: Screen height in pixels
+            anim: Shared AnimationSystem (e.g. UI.anim); None = own one,
+                  advanced by update()
+        """
         self.width = screen_width
         self.height = screen_height
+        self.anim = anim if anim is not None else gun_animation()
+        self._owns_anim = anim is None
         
         # ═══ WEAPON STATE ═══
         self.current_state = WeaponState.IDLE
@@ -46,40 +64,37 @@ class WeaponController:
         # ═══ WEAPON POSITION (normalized screen space) ═══
         # Base position: lower center-right
         self.base_position = pygame.math.Vector2(0.55, 0.85)  # (0-1 range)
-        self.current_position = pygame.math.Vector2(0.55, 0.85)
         self.target_position = pygame.math.Vector2(0.55, 0.85)
         
         # ═══ WEAPON ROTATION ═══
         self.base_rotation = -5.0  # Slight tilt for natural feel
-        self.current_rotation = -5.0
         
-        # ═══ RECOIL ANIMATION ═══
+        # ═══ RECOIL ANIMATION ═══ (strength: anim 'weapon_recoil')
+        self.recoil_recovery_rate = 6.0  # Recovery speed (per second)
+        self.anim.channel('weapon_recoil', DECAY, self.recoil_recovery_rate)
         self.recoil_offset = pygame.math.Vector2(0, 0)
         self.recoil_rotation = 0.0
-        self.recoil_strength = 1.0  # Current recoil intensity (0-1)
-        self.recoil_recovery_rate = 6.0  # Recovery speed
         
         # Recoil pattern (adds variety)
         self.recoil_pattern_x = 0.0
         self.recoil_pattern_y = 0.0
+        self.rng = random.Random()  # Seedable for session replay
+        self.seed = None
         
-        # ═══ IDLE ANIMATION ═══
-        self.idle_sway_timer = 0.0
-        self.idle_sway_speed = 0.6  # Hz
+        # ═══ IDLE ANIMATION ═══ (phase: anim 'sway')
         self.idle_sway_amount = 0.01  # Normalized screen space
+        self.idle_drift_amount = 0.004  # Noise drift on top of the figure-8
+        self.sway_noise_offset = 0.0  # Lattice offset into the shared noise table (reseed)
         
-        # ═══ MOVEMENT BOB ═══
-        self.bob_timer = 0.0
+        # ═══ MOVEMENT BOB ═══ (phase: anim 'bob')
         self.bob_speed = 2.8  # Hz
         self.bob_amount_vertical = 0.03  # Normalized
         self.bob_amount_horizontal = 0.015
         self.is_moving = False
         
-        # ═══ MUZZLE FLASH ═══
-        self.muzzle_flash_active = False
-        self.muzzle_flash_timer = 0.0
+        # ═══ MUZZLE FLASH ═══ (seconds left: anim 'weapon_flash')
         self.muzzle_flash_duration = 0.08  # seconds
-        self.muzzle_flash_intensity = 1.0
+        self.anim.channel('weapon_flash', DECAY, 1.0)
         
         # ═══ VISUAL EFFECTS ═══
         self.dynamic_light_intensity = 0.0  # 0-1, from scene lights
@@ -93,11 +108,38 @@ class WeaponController:
         # ═══ SMOOTHING ═══
         self.position_smoothing = 12.0  # Higher = more responsive
         self.rotation_smoothing = 10.0
+        self.anim.channel('weapon_x', SPRING, self.position_smoothing, self.base_position.x)
+        self.anim.channel('weapon_y', SPRING, self.position_smoothing, self.base_position.y)
+        self.anim.channel('weapon_rot', SPRING, self.rotation_smoothing, self.base_rotation)
         
         # ═══ PERFORMANCE ═══
         self.render_weapon = True  # Can be toggled for performance
         self.detail_level = 1.0  # 0-1, affects visual quality
     
+    # ══════════════════════════════════════════════════════════
+    #   ANIMATED VALUES (read-only views of self.anim)
+    # ══════════════════════════════════════════════════════════
+    
+    @property
+    def current_position(self):
+        return pygame.math.Vector2(self.anim['weapon_x'], self.anim['weapon_y'])
+    
+    @property
+    def current_rotation(self):
+        return self.anim['weapon_rot']
+    
+    @property
+    def recoil_strength(self):
+        return self.anim['weapon_recoil']
+    
+    @property
+    def muzzle_flash_active(self):
+        return self.anim['weapon_flash'] > 0.0
+    
+    @property
+    def muzzle_flash_intensity(self):
+        return self.anim.level('weapon_flash')
+    
     # ══════════════════════════════════════════════════════════
     #   UPDATE METHODS
     # ══════════════════════════════════════════════════════════
@@ -128,19 +170,21 @@ class WeaponController:
         if self.is_moving:
             self._update_movement_bob(dt)
         
-        # Update muzzle flash
-        self._update_muzzle_flash(dt)
-        
-        # Smooth position and rotation interpolation
+        # Smooth position and rotation interpolation (spring targets)
         self._smooth_transform(dt)
+        
+        # A shared system is advanced once per frame by its owner (FPSRenderer / Game)
+        if self._owns_anim:
+            self.anim.update(dt)
     
     def _update_idle(self, dt):
         """Idle breathing/sway animation"""
-        self.idle_sway_timer += dt * self.idle_sway_speed * math.pi * 2
+        phase = self.anim['sway']
         
-        # Subtle figure-8 pattern
-        sway_x = math.sin(self.idle_sway_timer) * self.idle_sway_amount
-        sway_y = math.sin(self.idle_sway_timer * 0.5) * self.idle_sway_amount * 0.6
+        # Subtle figure-8 pattern + slow drift (2 noise points per sway cycle)
+        drift_x, drift_y = shared_table().sample2(phase / math.pi + self.sway_noise_offset)
+        sway_x = math.sin(phase) * self.idle_sway_amount + drift_x * self.idle_drift_amount
+        sway_y = math.sin(phase * 0.5) * self.idle_sway_amount * 0.6 + drift_y * self.idle_drift_amount
         
         self.target_position.x = self.base_position.x + sway_x
         self.target_position.y = self.base_position.y + sway_y
@@ -183,11 +227,8 @@ class WeaponController:
             self._change_state(WeaponState.IDLE)
     
     def _update_recoil(self, dt):
-        """Update and recover from recoil"""
+        """Recoil offset from the (decaying) recoil channel"""
         if self.recoil_strength > 0:
-            # Smooth recovery curve
-            self.recoil_strength = max(0, self.recoil_strength - self.recoil_recovery_rate * dt)
-            
             # Calculate recoil offset with pattern
             intensity = self.recoil_strength
             
@@ -206,46 +247,23 @@ class WeaponController:
     
     def _update_movement_bob(self, dt):
         """Update weapon bob during movement"""
-        self.bob_timer += dt * self.bob_speed * math.pi * 2
+        phase = self.anim['bob']
         
         # Vertical bob
-        bob_y = math.sin(self.bob_timer) * self.bob_amount_vertical
+        bob_y = math.sin(phase) * self.bob_amount_vertical
         
         # Horizontal bob (half frequency)
-        bob_x = math.sin(self.bob_timer * 0.5) * self.bob_amount_horizontal
+        bob_x = math.sin(phase * 0.5) * self.bob_amount_horizontal
         
         # Apply to target position
         self.target_position.x = self.base_position.x + bob_x
         self.target_position.y = self.base_position.y + bob_y
     
-    def _update_muzzle_flash(self, dt):
-        """Update muzzle flash effect"""
-        if self.muzzle_flash_active:
-            self.muzzle_flash_timer += dt
-            
-            # Calculate intensity falloff
-            progress = self.muzzle_flash_timer / self.muzzle_flash_duration
-            self.muzzle_flash_intensity = max(0, 1.0 - progress)
-            
-            if self.muzzle_flash_timer >= self.muzzle_flash_duration:
-                self.muzzle_flash_active = False
-                self.muzzle_flash_timer = 0.0
-    
     def _smooth_transform(self, dt):
-        """Smooth interpolation for position and rotation"""
-        # Position smoothing (exponential)
-        alpha_pos = 1.0 - math.exp(-self.position_smoothing * dt)
-        
-        target_x = self.target_position.x + self.recoil_offset.x
-        target_y = self.target_position.y + self.recoil_offset.y
-        
-        self.current_position.x += (target_x - self.current_position.x) * alpha_pos
-        self.current_position.y += (target_y - self.current_position.y) * alpha_pos
-        
-        # Rotation smoothing
-        alpha_rot = 1.0 - math.exp(-self.rotation_smoothing * dt)
-        target_rot = self.base_rotation + self.recoil_rotation
-        self.current_rotation += (target_rot - self.current_rotation) * alpha_rot
+        """Point the position / rotation springs at target + recoil"""
+        self.anim.set_target('weapon_x', self.target_position.x + self.recoil_offset.x)
+        self.anim.set_target('weapon_y', self.target_position.y + self.recoil_offset.y)
+        self.anim.set_target('weapon_rot', self.base_rotation + self.recoil_rotation)
     
     # ══════════════════════════════════════════════════════════
     #   PUBLIC API - WEAPON CONTROL
@@ -261,16 +279,25 @@ class WeaponController:
         self._change_state(WeaponState.FIRING)
         
         # Apply recoil
-        self.recoil_strength = 1.0 * recoil_multiplier
+        self.anim.kick('weapon_recoil', 1.0 * recoil_multiplier)
         
         # Randomize recoil pattern for variety
-        self.recoil_pattern_x = random.uniform(-1.0, 1.0)
-        self.recoil_pattern_y = random.uniform(-0.5, 0.5)
+        self.recoil_pattern_x = self.rng.uniform(-1.0, 1.0)
+        self.recoil_pattern_y = self.rng.uniform(-0.5, 0.5)
         
         # Activate muzzle flash
-        self.muzzle_flash_active = True
-        self.muzzle_flash_timer = 0.0
-        self.muzzle_flash_intensity = 1.0
+        self.anim.kick('weapon_flash', self.muzzle_flash_duration)
+    
+    def reseed(self, seed):
+        """
+        Seed the recoil pattern generator so firing is reproducible
+        
+        Args:
+            seed: Integer seed (recorded by replay.SessionRecorder)
+        """
+        self.seed = seed
+        self.rng.seed(seed)
+        self.sway_noise_offset = shared_table().offset(seed)
     
     def reload(self):
         """Start reload animation"""
@@ -284,6 +311,7 @@ class WeaponController:
     def set_moving(self, moving):
         """Set whether player is moving"""
         self.is_moving = moving
+        self.anim.set_rate('bob', self.bob_speed if moving else 0.0)
     
     def _change_state(self, new_state):
         """Internal: Change animation state"""
@@ -348,30 +376,13 @@ class WeaponController:
         
         intensity = self.muzzle_flash_intensity
         
-        # Bright core
-        core_size = int(25 * intensity)
-        if core_size > 0:
-            core_surf = pygame.Surface((core_size * 2, core_size * 2), pygame.SRCALPHA)
-            pygame.draw.circle(core_surf, (255, 255, 235, int(255 * intensity)), 
-                             (core_size, core_size), core_size)
-            screen.blit(core_surf, (flash_x - core_size, flash_y - core_size))
-        
-        # Outer glow layers
-        for i in range(3):
-            glow_size = int((40 + i * 20) * intensity)
-            if glow_size > 0:
-                alpha = int((120 - i * 40) * intensity)
-                glow_surf = pygame.Surface((glow_size * 2, glow_size * 2), pygame.SRCALPHA)
-                pygame.draw.circle(glow_surf, (255, 230, 180, alpha), 
-                                 (glow_size, glow_size), glow_size)
-                screen.blit(glow_surf, (flash_x - glow_size, flash_y - glow_size))
-        
-        # Screen-space glow (additive blend simulation)
+        # Bright core + outer glow layers (pre-rendered, see muzzle_flash.py)
+        for surf, (dx, dy) in muzzle_flash.shared_bank().weapon_layers(intensity):
+            screen.blit(surf, (flash_x + dx, flash_y + dy))
+        
+        # Screen-space glow (additive)
         if intensity > 0.5:
-            glow_overlay = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-            glow_alpha = int(20 * (intensity - 0.5) * 2)
-            glow_overlay.fill((255, 240, 200, glow_alpha))
-            screen.blit(glow_overlay, (0, 0), special_flags=pygame.BLEND_RGBA_ADD)
+            muzzle_flash.screen_glow(screen, (255, 240, 200), int(20 * (intensity - 0.5) * 2))
     
     def get_muzzle_flash_intensity(self):
         """Get current muzzle flash intensity for lighting effects"""
@@ -385,11 +396,10 @@ class WeaponController:
         """Reset weapon to default state"""
         self.current_state = WeaponState.IDLE
         self.state_time = 0.0
-        self.current_position = pygame.math.Vector2(self.base_position)
         self.target_position = pygame.math.Vector2(self.base_position)
-        self.current_rotation = self.base_rotation
-        self.recoil_strength = 0.0
-        self.muzzle_flash_active = False
-        self.is_moving = False
-        self.bob_timer = 0.0
-        self.idle_sway_timer = 0.0
\ No newline at end of file
+        self.anim.snap('weapon_x', self.base_position.x)
+        self.anim.snap('weapon_y', self.base_position.y)
+        self.anim.snap('weapon_rot', self.base_rotation)
+        for name in ('weapon_recoil', 'weapon_flash', 'bob', 'sway'):
+            self.anim.kick(name, 0.0)
+        self.set_moving(False)
\ No newline at end of file
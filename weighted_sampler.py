@@ -0,0 +1,113 @@
+"""
+═══════════════════════════════════════════════════════════════════
+WEIGHTED SAMPLER (Fenwick / binary indexed tree)
+═══════════════════════════════════════════════════════════════════
+Draw index i with probability weight[i] / total.
+
+- set(i, w): O(log n)        - sample(rng): O(log n) descent
+- build from a weight list: O(n)
+
+Used by QuestionManager for difficulty / recency weighted question
+selection that stays cheap on banks with 100k+ questions.
+═══════════════════════════════════════════════════════════════════
+"""
+
+
+class FenwickSampler:
+    """
+    Prefix-sum tree over non-negative weights
+    """
+
+    def __init__(self, weights=()):
+        """
+        Args:
+            weights: Initial weights (index order)
+        """
+        self.weights = [max(0.0, float(w)) for w in weights]
+        self.live = sum(1 for w in self.weights if w > 0.0)  # Indices with weight > 0
+        n = len(self.weights)
+        tree = [0.0] * (n + 1)
+        for i, w in enumerate(self.weights, 1):
+            tree[i] += w
+            parent = i + (i & -i)
+            if parent <= n:
+                tree[parent] += tree[i]
+        self.tree = tree
+        self._top = 1 << (n.bit_length() - 1) if n else 0
+        self._updates = 0
+
+    def __len__(self):
+        return len(self.weights)
+
+    def get(self, i):
+        return self.weights[i]
+
+    def set(self, i, weight):
+        """Set weight of index i"""
+        weight = max(0.0, float(weight))
+        old = self.weights[i]
+        delta = weight - old
+        if delta == 0.0:
+            return
+        self.live += (weight > 0.0) - (old > 0.0)
+        self.weights[i] = weight
+        tree = self.tree
+        n = len(tree) - 1
+        j = i + 1
+        while j <= n:
+            tree[j] += delta
+            j += j & -j
+
+        # Float deltas drift slowly: rebuild exactly once in a while
+        self._updates += 1
+        if self._updates >= 1 << 16:
+            self.__init__(self.weights)
+
+    def prefix(self, i):
+        """Sum of weights[0:i]"""
+        total = 0.0
+        tree = self.tree
+        while i > 0:
+            total += tree[i]
+            i -= i & -i
+        return total
+
+    def total(self):
+        return self.prefix(len(self.weights))
+
+    def find(self, value):
+        """Smallest index whose inclusive prefix sum exceeds value"""
+        tree = self.tree
+        n = len(tree) - 1
+        pos = 0
+        step = self._top
+        while step:
+            nxt = pos + step
+            if nxt <= n and tree[nxt] <= value:
+                pos = nxt
+                value -= tree[nxt]
+            step >>= 1
+        return pos
+
+    def sample(self, rng):
+        """
+        Args:
+            rng: random.Random-like (uses rng.random())
+
+        Returns:
+            int | None: Drawn index, None if every weight is 0
+        """
+        if not self.live:
+            return None
+        total = self.total()
+        i = self.find(rng.random() * total)
+        # Rounding can land past the end or on a zero weight: step back to a live one
+        n = len(self.weights)
+        if i >= n:
+            i = n - 1
+        while i > 0 and self.weights[i] <= 0.0:
+            i -= 1
+        if self.weights[i] <= 0.0:
+            # Only zero weights below: first live index is the answer
+            i = next(j for j, w in enumerate(self.weights) if w > 0.0)
+        return i